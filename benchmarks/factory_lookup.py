@@ -0,0 +1,141 @@
+"""Benchmark factory lookups, and server rows built per second.
+
+Factories find their products through SubclassesMixin. This compares
+the current lookups, a dict access in the registry filled when classes
+are defined, with the previous ones, which walked the whole subclass
+tree on every call (reproduced here by legacy_subclass_lookup()).
+
+    model_factories
+        CountryItemFactory and ServerType lookups
+    server_rows
+        ServerRow widgets built from a synthetic server list, which
+        requires GTK and a display, and is skipped otherwise
+
+Usage:
+    python3 benchmarks/factory_lookup.py [--lookups 100000] [--rows 2000]
+"""
+import argparse
+import sys
+import time
+from contextlib import contextmanager
+from types import SimpleNamespace
+from unittest import mock
+
+from fake_session import fake_session, generate_servers # noqa
+from protonvpn_nm_lib.enums import ServerTierEnum # noqa
+from protonvpn_gui.model import ServerList, ServerType # noqa
+from protonvpn_gui.model.country_item import CountryItemFactory # noqa
+from protonvpn_gui.utils import SubclassesMixin # noqa
+
+
+@contextmanager
+def legacy_subclass_lookup():
+    """Make SubclassesMixin walk the subclass tree on every lookup."""
+    def get_all_subclasses(cls):
+        all_subclasses = []
+        for subclass in cls.__subclasses__():
+            all_subclasses.append(subclass)
+            all_subclasses.extend(get_all_subclasses(subclass))
+
+        return all_subclasses
+
+    def get_subclasses_dict(cls, attribute):
+        return dict(
+            [
+                (getattr(x, attribute), x)
+                for x in get_all_subclasses(cls)
+                if hasattr(x, attribute)
+            ]
+        )
+
+    def get_subclass_by_name(cls, name):
+        for subclass in get_all_subclasses(cls):
+            if hasattr(subclass, "concrete_factory")\
+                    and name.lower() == subclass.__name__.lower():
+                return subclass
+
+        raise KeyError(name)
+
+    with mock.patch.object(
+        SubclassesMixin, "_get_all_subclasses",
+        classmethod(get_all_subclasses)
+    ), mock.patch.object(
+        SubclassesMixin, "_get_subclasses_dict",
+        classmethod(get_subclasses_dict)
+    ), mock.patch.object(
+        SubclassesMixin, "_get_subclass_by_name",
+        classmethod(get_subclass_by_name)
+    ):
+        yield
+
+
+def run_model_factories(lookups):
+    start = time.perf_counter()
+    for _ in range(lookups):
+        CountryItemFactory.factory()
+        ServerType.factory("non_secure_core_default")
+
+    return lookups * 2 / (time.perf_counter() - start)
+
+
+def run_server_rows(rows):
+    from protonvpn_gui.view.server_list_components.server_row import ServerRow
+
+    dashboard_view = SimpleNamespace(application=None)
+    snapshot = ServerList().generate_list(ServerTierEnum.PLUS_VISIONARY)
+    server_rows = [
+        (country_item, server)
+        for country_item in snapshot.none_secure_core.servers
+        for server in country_item.servers
+    ][:rows]
+
+    start = time.perf_counter()
+    for country_item, server in server_rows:
+        ServerRow(dashboard_view, country_item, server, False)
+
+    return len(server_rows) / (time.perf_counter() - start)
+
+
+def print_result(name, unit, before, after):
+    print("{:<16} {:>14.0f} {:>14.0f} {:>8.1f}x  ({})".format(
+        name, before, after, after / before, unit
+    ))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--lookups", type=int, default=100000)
+    parser.add_argument("--rows", type=int, default=2000)
+    args = parser.parse_args()
+
+    print("{:<16} {:>14} {:>14} {:>9}".format(
+        "benchmark", "before", "after", "speedup"
+    ))
+    with legacy_subclass_lookup():
+        before = run_model_factories(args.lookups)
+    after = run_model_factories(args.lookups)
+    print_result("model_factories", "lookups/s", before, after)
+
+    try:
+        import gi
+        gi.require_version('Gtk', '3.0')
+        from gi.repository import Gtk
+    except (ImportError, ValueError):
+        print("server_rows skipped: GTK is not available")
+        return
+
+    if not Gtk.init_check(sys.argv)[0]:
+        print("server_rows skipped: no display")
+        return
+
+    servers = generate_servers(args.rows)
+    with fake_session(servers):
+        with legacy_subclass_lookup():
+            before = run_server_rows(args.rows)
+        after = run_server_rows(args.rows)
+
+    print_result("server_rows", "rows/s", before, after)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
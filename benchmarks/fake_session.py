@@ -0,0 +1,61 @@
+"""Synthetic logical servers for the benchmarks.
+
+The fake session, and the protonvpn_nm_lib stand-in used when the library
+is not installed, come from tests/conftest.py. Thus the model layer can
+be exercised without an API session or network access, wherever the
+tests can run.
+"""
+import os
+import random
+import sys
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCHMARKS_DIR))
+sys.path.insert(0, os.path.join(os.path.dirname(BENCHMARKS_DIR), "tests"))
+
+from conftest import fake_session, logical_server # noqa
+from protonvpn_nm_lib.enums import FeatureEnum, ServerTierEnum # noqa
+
+__all__ = ["fake_session", "generate_servers"]
+
+# Same seed for every run, so that results can be compared between versions.
+RANDOM_SEED = 1
+# Fixed list of countries, so that results do not depend on the
+# country codes known by the installed protonvpn_nm_lib.
+COUNTRY_CODES = (
+    "AE", "AR", "AT", "AU", "BE", "BG", "BR", "CA", "CH", "CL", "CO", "CR",
+    "CY", "CZ", "DE", "DK", "EE", "ES", "FI", "FR", "GR", "HK", "HR", "HU",
+    "IE", "IL", "IN", "IS", "IT", "JP", "KR", "LT", "LU", "LV", "MD", "MX",
+    "MY", "NG", "NL", "NO", "NZ", "PE", "PL", "PT", "RO", "RS", "SE", "SG",
+    "SI", "SK", "TR", "TW", "UA", "UK", "US", "ZA",
+)
+
+
+def generate_servers(server_count):
+    """Generate synthetic logical servers.
+
+    Servers are spread evenly across COUNTRY_CODES and tiers,
+    every 10th server being a Secure Core server.
+
+    Args:
+        server_count (int)
+
+    Returns:
+        list
+    """
+    rand = random.Random(RANDOM_SEED)
+    servers = []
+    for index in range(server_count):
+        exit_country = COUNTRY_CODES[index % len(COUNTRY_CODES)]
+        features = [FeatureEnum.NORMAL]
+        if index % 10 == 0:
+            features = [FeatureEnum.SECURE_CORE]
+        servers.append(
+            logical_server(
+                "{}#{}".format(exit_country, index), exit_country,
+                ServerTierEnum(index % 4), features,
+                load=rand.randint(0, 100), score=rand.random()
+            )
+        )
+
+    return servers
@@ -0,0 +1,356 @@
+"""Benchmark each stage of the server list model pipeline.
+
+The stages are measured against synthetic server lists of increasing size:
+
+    country_item_create
+        CountryItem.create() for every country, including the
+        Secure Core split
+    server_type_generate
+        SecureCoreServers.generate() and NonSecureCoreServers.generate()
+    generate_list
+        the whole ServerList.generate_list()
+
+For each stage the best and median wall time are reported, measured
+without tracemalloc, followed by a separate traced run that reports:
+
+    peak
+        highest amount of memory held by the stage at once
+    allocated
+        memory and blocks allocated by the stage, including the
+        temporary ones (see AllocationCounter)
+    retained
+        memory and blocks still allocated once the stage finished
+
+Results can be written as JSON with --output, and compared against a
+previous run with --compare, so that regressions can be spotted
+between versions.
+
+Usage:
+    python3 benchmarks/model_pipeline.py [--servers 1000 10000 50000]
+        [--repeat 5] [--tier PLUS_VISIONARY] [--output results.json]
+        [--compare previous.json]
+"""
+import argparse
+import gc
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from fake_session import fake_session, generate_servers # noqa
+from protonvpn_nm_lib.api import protonvpn # noqa
+from protonvpn_nm_lib.enums import ServerTierEnum # noqa
+from protonvpn_gui.model import ServerList, ServerTable, ServerType # noqa
+from protonvpn_gui.module import Module # noqa
+
+DEFAULT_SERVER_COUNTS = [1000, 10000, 50000]
+# 2: allocated_blocks renamed to retained_blocks
+# 3: allocated_bytes and allocated_blocks count all allocations
+RESULTS_FORMAT_VERSION = 3
+
+
+class Stage:
+    """Benchmark stage.
+
+    setup() prepares the input of a single run and is not measured,
+    run() receives that input and is measured.
+    """
+    name = None
+
+    def setup(self, servers, user_tier):
+        return None
+
+    def run(self, data):
+        raise NotImplementedError()
+
+
+class CountryItemCreateStage(Stage):
+    name = "country_item_create"
+
+    def setup(self, servers, user_tier):
+        return (
+            protonvpn.get_country().get_dict_with_country_code_servername(
+                servers
+            ),
+            {server.name.lower(): server for server in servers},
+            user_tier
+        )
+
+    def run(self, data):
+        country_servernames, server_index, user_tier = data
+        server_table = ServerTable(user_tier)
+        countries = []
+        for country_code, servername_list in country_servernames.items():
+            country_item = Module().country_item_model()
+            country_item.create(
+                servername_list, server_index,
+                server_table, user_tier, country_code
+            )
+            countries.append(country_item.split_by_secure_core())
+
+        return countries
+
+
+class ServerTypeGenerateStage(Stage):
+    name = "server_type_generate"
+
+    def setup(self, servers, user_tier):
+        create_stage = CountryItemCreateStage()
+        countries = create_stage.run(
+            create_stage.setup(servers, user_tier)
+        )
+        secure_core_servers = ServerType.factory("secure_core_default")
+        none_secure_core_servers = ServerType.factory(
+            "non_secure_core_default"
+        )
+        secure_core_servers.user_tier = user_tier
+        none_secure_core_servers.user_tier = user_tier
+
+        return (
+            secure_core_servers,
+            [secure_core for secure_core, _ in countries],
+            none_secure_core_servers,
+            [none_secure_core for _, none_secure_core in countries],
+        )
+
+    def run(self, data):
+        (
+            secure_core_servers, secure_core_countries,
+            none_secure_core_servers, none_secure_core_countries
+        ) = data
+        secure_core_servers.generate(secure_core_countries)
+        none_secure_core_servers.generate(none_secure_core_countries)
+
+        return data
+
+
+class GenerateListStage(Stage):
+    name = "generate_list"
+
+    def setup(self, servers, user_tier):
+        return ServerList(), user_tier
+
+    def run(self, data):
+        server_list, user_tier = data
+        return server_list.generate_list(user_tier)
+
+
+STAGES = [
+    CountryItemCreateStage(),
+    ServerTypeGenerateStage(),
+    GenerateListStage(),
+]
+
+
+def measure_time(stage, servers, user_tier, repeat):
+    timings = []
+    for _ in range(repeat):
+        data = stage.setup(servers, user_tier)
+        gc.collect()
+        start = time.perf_counter()
+        stage.run(data)
+        timings.append(time.perf_counter() - start)
+
+    return timings
+
+
+class AllocationCounter:
+    """Count the memory allocated while profiling is enabled.
+
+    Python only reports the memory that is currently allocated, thus the
+    allocated blocks (sys.getallocatedblocks()) and traced memory
+    (tracemalloc) are sampled on every function call and return, and
+    their increases between samples are added up. Memory allocated and
+    released between two samples is not counted, thus results are a lower
+    bound, but temporary objects of the stage are counted, unlike
+    with the retained memory. tracemalloc has to be tracing.
+    """
+    def __init__(self):
+        self.allocated_blocks = 0
+        self.allocated_bytes = 0
+        self.__blocks = sys.getallocatedblocks()
+        self.__bytes, _ = tracemalloc.get_traced_memory()
+
+    def __call__(self, frame, event, arg):
+        blocks = sys.getallocatedblocks()
+        if blocks > self.__blocks:
+            self.allocated_blocks += blocks - self.__blocks
+        self.__blocks = blocks
+
+        traced_bytes, _ = tracemalloc.get_traced_memory()
+        if traced_bytes > self.__bytes:
+            self.allocated_bytes += traced_bytes - self.__bytes
+        self.__bytes = traced_bytes
+
+
+def measure_memory(stage, servers, user_tier):
+    data = stage.setup(servers, user_tier)
+    gc.collect()
+    # Each stage is traced on its own, so that the peak
+    # and the counters only include the stage.
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        baseline, _ = tracemalloc.get_traced_memory()
+        allocation_counter = AllocationCounter()
+        sys.setprofile(allocation_counter)
+        try:
+            result = stage.run(data)  # noqa: F841, kept alive for the snapshot
+        finally:
+            sys.setprofile(None)
+        # Allocations after the last sample
+        allocation_counter(None, "return", None)
+        current, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    # Net amount of blocks that are still alive once the stage finished
+    retained_blocks = sum(
+        stat.count_diff
+        for stat in after.compare_to(before, "filename")
+    )
+
+    return {
+        "peak_bytes": peak - baseline,
+        "allocated_bytes": allocation_counter.allocated_bytes,
+        "allocated_blocks": allocation_counter.allocated_blocks,
+        "retained_bytes": current - baseline,
+        "retained_blocks": retained_blocks,
+    }
+
+
+def run_benchmarks(server_counts, repeat, user_tier):
+    results = []
+    for server_count in server_counts:
+        servers = generate_servers(server_count)
+        with fake_session(servers, user_tier):
+            for stage in STAGES:
+                timings = measure_time(stage, servers, user_tier, repeat)
+                result = {
+                    "stage": stage.name,
+                    "servers": server_count,
+                    "best_seconds": min(timings),
+                    "median_seconds": statistics.median(timings),
+                    "per_server_us": min(timings) / server_count * 1e6,
+                }
+                result.update(measure_memory(stage, servers, user_tier))
+                results.append(result)
+                print_result(result)
+
+    return results
+
+
+def print_header():
+    print(
+        "{:<22} {:>8} {:>10} {:>10} {:>9} {:>10} {:>11} {:>10} {:>10}".format(
+            "stage", "servers", "best (s)", "median (s)", "us/server",
+            "peak (KB)", "alloc (KB)", "allocs", "retained"
+        )
+    )
+
+
+def print_result(result):
+    print(
+        "{:<22} {:>8} {:>10.4f} {:>10.4f} {:>9.2f} {:>10.1f} {:>11.1f} "
+        "{:>10} {:>10}".format(
+            result["stage"], result["servers"], result["best_seconds"],
+            result["median_seconds"], result["per_server_us"],
+            result["peak_bytes"] / 1024, result["allocated_bytes"] / 1024,
+            result["allocated_blocks"], result["retained_blocks"]
+        )
+    )
+
+
+def print_comparison(results, previous_results):
+    previous_by_key = {
+        (result["stage"], result["servers"]): result
+        for result in previous_results["results"]
+    }
+    print()
+    print("Compared to {}:".format(previous_results.get("revision")))
+    print("{:<22} {:>8} {:>10} {:>10} {:>10}".format(
+        "stage", "servers", "time", "peak", "allocs"
+    ))
+    for result in results:
+        previous = previous_by_key.get((result["stage"], result["servers"]))
+        if not previous:
+            continue
+
+        print("{:<22} {:>8} {:>+9.1f}% {:>+9.1f}% {:>10}".format(
+            result["stage"], result["servers"],
+            get_change(previous["best_seconds"], result["best_seconds"]),
+            get_change(previous["peak_bytes"], result["peak_bytes"]),
+            format_change(
+                previous.get("allocated_blocks"), result["allocated_blocks"]
+            ),
+        ))
+
+
+def get_change(previous, current):
+    if not previous:
+        return 0.0
+
+    return (current - previous) / previous * 100
+
+
+def format_change(previous, current):
+    # Results of format version 2 and older did not count allocations
+    if previous is None:
+        return "n/a"
+
+    return "{:+.1f}%".format(get_change(previous, current))
+
+
+def get_revision():
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--servers", type=int, nargs="+", default=DEFAULT_SERVER_COUNTS
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--tier", choices=[tier.name for tier in ServerTierEnum],
+        default=ServerTierEnum.PLUS_VISIONARY.name
+    )
+    parser.add_argument("--output", help="write results to a JSON file")
+    parser.add_argument("--compare", help="JSON file of a previous run")
+    args = parser.parse_args()
+
+    print_header()
+    results = run_benchmarks(
+        args.servers, args.repeat, ServerTierEnum[args.tier]
+    )
+    output = {
+        "format_version": RESULTS_FORMAT_VERSION,
+        "revision": get_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "tier": args.tier,
+        "repeat": args.repeat,
+        "results": results,
+    }
+
+    if args.compare:
+        with open(args.compare) as f:
+            print_comparison(results, json.load(f))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(output, f, indent=4)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
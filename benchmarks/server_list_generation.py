@@ -0,0 +1,40 @@
+"""Benchmark ServerList.generate_list against synthetic server lists.
+
+Runs the model generation with a fake session of increasing size and
+prints the wall time per run together with the time spent per server,
+which should stay roughly constant as the server count grows.
+
+Usage:
+    python3 benchmarks/server_list_generation.py [server_count ...]
+
+See model_pipeline.py for a per stage breakdown.
+"""
+import sys
+import time
+
+from fake_session import fake_session, generate_servers # noqa
+from protonvpn_nm_lib.enums import ServerTierEnum # noqa
+from protonvpn_gui.model import ServerList # noqa
+
+DEFAULT_SERVER_COUNTS = [500, 1000, 2000, 4000, 8000]
+
+
+def run(server_count):
+    with fake_session(generate_servers(server_count)):
+        start = time.perf_counter()
+        ServerList().generate_list(ServerTierEnum.PLUS_VISIONARY)
+        return time.perf_counter() - start
+
+
+def main():
+    server_counts = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SERVER_COUNTS
+    print("{:>10} {:>12} {:>16}".format("servers", "total (s)", "per server (us)"))
+    for server_count in server_counts:
+        elapsed = run(server_count)
+        print("{:>10} {:>12.4f} {:>16.2f}".format(
+            server_count, elapsed, elapsed / server_count * 1e6
+        ))
+
+
+if __name__ == "__main__":
+    main()
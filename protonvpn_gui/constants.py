@@ -15,6 +15,25 @@ FLAGS_DIR_PATH = os.path.join(IMG_DIR_PATH, "flags")
 
 LOGGER_NAME = "protonvpn-gui"
 
+# Time to wait for the user to stop typing before searching servers
+SERVER_SEARCH_DEBOUNCE_SECONDS = 0.15
+# Country rows are only created once they get close to the viewport
+SERVER_LIST_VIRTUALIZED = True
+# Estimated height of a country row, taken by rows not created yet
+VIRTUAL_COUNTRY_ROW_HEIGHT = 45
+# Rows within this amount of pages above or below the viewport are created
+VIRTUAL_COUNTRY_ROW_OVERSCAN_PAGES = 1
+# Server rows created right away when a country is expanded,
+# the other ones are created in chunks once the main loop is idle
+SERVER_ROWS_CREATED_ON_EXPAND = 20
+SERVER_ROWS_CREATED_PER_IDLE = 10
+# Time the server list can be built for in a single main loop iteration,
+# so that rows are built without dropping frames
+SERVER_LIST_BUILD_BUDGET_SECONDS = 0.004
+# Memory that decoded images can take before the least
+# recently used ones are evicted from the pixbuf cache
+PIXBUF_CACHE_MAX_BYTES = 8 * 1024 * 1024
+
 
 protonvpn_logo = "protonvpn-logo.png"
 VPN_TRAY_ON = "vpn-connected.svg"
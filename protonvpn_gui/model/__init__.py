@@ -1,10 +1,16 @@
-from .server_item import ServerItemFactory
+from .server_table import ServerTable
+from .server_score_index import ServerScoreIndex
+from .server_search_index import ServerSearchIndex
+from .streaming_services_index import StreamingServicesIndex
 from .country_item import CountryItemFactory
 from .server_type import ServerType
-from .server_list import ServerList
+from .server_list import ServerList, ServerListSnapshot
+from .server_list_cache import ServerListCache
 from .utilities import Utilities
 
 __all__ = [
-    "ServerItemFactory", "CountryItemFactory",
-    "ServerList", "ServerType", "Utilities"
+    "CountryItemFactory", "ServerTable",
+    "ServerScoreIndex", "ServerSearchIndex", "StreamingServicesIndex",
+    "ServerList",
+    "ServerListSnapshot", "ServerListCache", "ServerType", "Utilities"
 ]
@@ -1,8 +1,11 @@
 from protonvpn_nm_lib.enums import ServerStatusEnum, ServerTierEnum, FeatureEnum
 from protonvpn_nm_lib.country_codes import country_codes
-from ..module import Module
 from abc import abstractmethod, ABCMeta
+from collections import Counter
+import copy
 from ..utils import SubclassesMixin
+from .feature_mask import get_features_from_mask, has_feature
+from .server_table import ServerTableRows
 
 
 class CountryItemFactory(SubclassesMixin, metaclass=ABCMeta):
@@ -47,6 +50,11 @@ class CountryItemFactory(SubclassesMixin, metaclass=ABCMeta):
     def features():
         raise NotImplementedError()
 
+    @property
+    @abstractmethod
+    def feature_mask():
+        raise NotImplementedError()
+
     @property
     @abstractmethod
     def servers():
@@ -97,6 +105,18 @@ class CountryItemFactory(SubclassesMixin, metaclass=ABCMeta):
     def create():
         raise NotImplementedError()
 
+    @abstractmethod
+    def split_by_secure_core():
+        raise NotImplementedError()
+
+    @abstractmethod
+    def dump():
+        raise NotImplementedError()
+
+    @abstractmethod
+    def restore():
+        raise NotImplementedError()
+
 
 class CountryItem(CountryItemFactory):
     """CountryItem class.
@@ -115,8 +135,13 @@ class CountryItem(CountryItemFactory):
             the tiers that this country has
         features: list
             features that this country provides
-        servers: list
-            contains a list of ServerItem
+        feature_mask: int
+            bitwise OR of the feature masks of all its servers
+        servers: ServerTableRows
+            servers of the country, as row indexes of a ServerTable
+        ammount_of_<tier>_servers: int
+            number of servers per tier, counted whenever the
+            servers are set
 
     All the properties can be reacheched from the outside, but only two can be
     set outside of it's own class, entry_country_code and country_name.
@@ -135,8 +160,14 @@ class CountryItem(CountryItemFactory):
         self.__entry_country_code: str = None
         self.__status: ServerStatusEnum = None
         self.__tiers: list = []
-        self.__features: list = set()
+        self.__features: list = []
+        self.__feature_mask: int = 0
         self.__servers: list = []
+        self.__secure_core_servers: list = []
+        self.__non_secure_core_servers: list = []
+        self.__servers_per_tier: Counter = Counter()
+        self.__secure_core_servers_per_tier: Counter = Counter()
+        self.__non_secure_core_servers_per_tier: Counter = Counter()
         self.__can_connect: bool = False
         self.__minimum_required_tier = None
         self.__is_virtual_country: bool = None
@@ -181,6 +212,10 @@ class CountryItem(CountryItemFactory):
     def features(self):
         return self.__features
 
+    @property
+    def feature_mask(self):
+        return self.__feature_mask
+
     @property
     def servers(self):
         return self.__servers
@@ -188,6 +223,9 @@ class CountryItem(CountryItemFactory):
     @servers.setter
     def servers(self, newvalue):
         self.__servers = newvalue
+        self.__servers_per_tier = Counter(
+            server.tier for server in newvalue
+        )
 
     @property
     def can_connect(self):
@@ -203,70 +241,72 @@ class CountryItem(CountryItemFactory):
 
     @property
     def ammount_of_free_servers(self):
-        num_free_countries = 0
-        for server in self.servers:
-            if server.tier == ServerTierEnum.FREE:
-                num_free_countries += 1
-
-        return num_free_countries
+        return self.__servers_per_tier[ServerTierEnum.FREE]
 
     @property
     def ammount_of_basic_servers(self):
-        num_basic_countries = 0
-        for server in self.servers:
-            if server.tier == ServerTierEnum.BASIC:
-                num_basic_countries += 1
-
-        return num_basic_countries
+        return self.__servers_per_tier[ServerTierEnum.BASIC]
 
     @property
     def ammount_of_plus_servers(self):
-        num_plus_countries = 0
-        for server in self.servers:
-            if server.tier == ServerTierEnum.PLUS_VISIONARY:
-                num_plus_countries += 1
-
-        return num_plus_countries
+        return self.__servers_per_tier[ServerTierEnum.PLUS_VISIONARY]
 
     @property
     def ammount_of_internal_servers(self):
-        num_internal_countries = 0
-        for server in self.servers:
-            if server.tier.value >= ServerTierEnum.PM.value:
-                num_internal_countries += 1
-
-        return num_internal_countries
+        return sum(
+            servers
+            for tier, servers in self.__servers_per_tier.items()
+            if tier.value >= ServerTierEnum.PM.value
+        )
 
     def create(
         self, servername_list,
-        server_filter, user_tier, country_code
+        server_index, server_table, user_tier, country_code
     ):
+        """Create country item.
+
+        Args:
+            servername_list (list): servernames that belong to this country
+            server_index (dict): lowercase servername -> logical server,
+                built once per refresh by ServerList.generate_list
+            server_table (ServerTable): table where the servers are stored
+            user_tier (ServerTierEnum)
+            country_code (str): ISO country code
+        """
         status_collection = set()
         tier_collection = set()
-        feature_collection = set()
+        feature_mask = 0
         country_host_collection = []
+        secure_core_servers_per_tier = Counter()
+        non_secure_core_servers_per_tier = Counter()
         self.__entry_country_code = country_code
+        self.__servers = ServerTableRows(server_table)
+        self.__secure_core_servers = ServerTableRows(server_table)
+        self.__non_secure_core_servers = ServerTableRows(server_table)
 
         for servername in servername_list:
-            logical_server = server_filter(
-                lambda server: server.name.lower() == servername.lower()
-            )[0]
-            server_item = Module().server_item_model()
-
-            server_item.create(logical_server, user_tier)
-
+            logical_server = server_index[servername.lower()]
+            server_item = server_table.append(logical_server)
             self.__servers.append(server_item)
-            self.__add_feature_to_collection(
-                feature_collection, server_item.features
-            )
+            feature_mask |= server_item.feature_mask
+            if has_feature(server_item.feature_mask, FeatureEnum.SECURE_CORE):
+                self.__secure_core_servers.append(server_item)
+                secure_core_servers_per_tier[server_item.tier] += 1
+            else:
+                self.__non_secure_core_servers.append(server_item)
+                non_secure_core_servers_per_tier[server_item.tier] += 1
+                country_host_collection.append(logical_server.host_country)
+
             self.__add_status_to_collection(
                 status_collection, server_item.status
             )
             self.__add_tier_to_collection(tier_collection, server_item.tier)
-            if FeatureEnum.SECURE_CORE not in logical_server.features:
-                country_host_collection.append(logical_server.host_country)
 
-        self.__set_features(feature_collection)
+        self.__secure_core_servers_per_tier = secure_core_servers_per_tier
+        self.__non_secure_core_servers_per_tier = non_secure_core_servers_per_tier
+        self.__servers_per_tier = secure_core_servers_per_tier\
+            + non_secure_core_servers_per_tier
+        self.__set_features(feature_mask)
         self.__set_status(status_collection)
         self.__set_tiers(tier_collection)
         self.__set_minimum_required_tier(tier_collection)
@@ -286,11 +326,72 @@ class CountryItem(CountryItemFactory):
             ) else False
         self.__is_virtual_country = all(country_host_collection)
 
-    def __add_feature_to_collection(
-        self, feature_collection, server_features
-    ):
-        for feature in server_features:
-            feature_collection.add(feature)
+    def split_by_secure_core(self):
+        """Split this country into Secure Core and non-Secure Core views.
+
+        The servers are partitioned while the country is being created,
+        so this only builds two shallow copies of this object that share
+        its country information but hold their own ServerTableRows.
+
+        Returns:
+            tuple(CountryItem, CountryItem): secure core and
+                non-secure core country views
+        """
+        return (
+            self.__create_view(
+                self.__secure_core_servers,
+                self.__secure_core_servers_per_tier
+            ),
+            self.__create_view(
+                self.__non_secure_core_servers,
+                self.__non_secure_core_servers_per_tier
+            )
+        )
+
+    def dump(self):
+        """Dump this country to builtin types.
+
+        Servers are stored as their row index in the ServerTable.
+
+        Returns:
+            dict
+        """
+        return {
+            "entry_country_code": self.__entry_country_code,
+            "country_name": self.__country_name,
+            "status": self.__status.value,
+            "tiers": [tier.value for tier in self.__tiers],
+            "feature_mask": self.__feature_mask,
+            "minimum_country_tier": self.__minimum_required_tier.value,
+            "can_connect": self.__can_connect,
+            "is_virtual": self.__is_virtual_country,
+            "servers": self.__servers.indexes.tolist(),
+        }
+
+    def restore(self, data, server_table):
+        """Restore a country from the output of dump().
+
+        Args:
+            data (dict)
+            server_table (ServerTable): table that holds the servers
+        """
+        self.__entry_country_code = data["entry_country_code"]
+        self.__country_name = data["country_name"]
+        self.__status = ServerStatusEnum(data["status"])
+        self.__tiers = [ServerTierEnum(tier) for tier in data["tiers"]]
+        self.__set_features(data["feature_mask"])
+        self.__minimum_required_tier = ServerTierEnum(
+            data["minimum_country_tier"]
+        )
+        self.__can_connect = data["can_connect"]
+        self.__is_virtual_country = data["is_virtual"]
+        self.servers = ServerTableRows(server_table, data["servers"])
+
+    def __create_view(self, servers, servers_per_tier):
+        country_view = copy.copy(self)
+        country_view.__servers = servers.copy()
+        country_view.__servers_per_tier = servers_per_tier
+        return country_view
 
     def __add_status_to_collection(self, status_collection, server_status):
         status_collection.add(server_status)
@@ -298,8 +399,9 @@ class CountryItem(CountryItemFactory):
     def __add_tier_to_collection(self, tier_collection, server_tier):
         tier_collection.add(server_tier)
 
-    def __set_features(self, features_collector):
-        self.__features = list(features_collector)
+    def __set_features(self, feature_mask):
+        self.__feature_mask = feature_mask
+        self.__features = get_features_from_mask(feature_mask)
 
     def __set_status(self, status_collection):
         self.__status = self.__get_country_status(list(status_collection))
@@ -0,0 +1,55 @@
+from protonvpn_nm_lib.enums import FeatureEnum
+
+# FeatureEnum.NORMAL has value 0, so each feature is assigned its own bit
+# instead of relying on the enum values.
+FEATURE_BITS = {
+    feature: 1 << position
+    for position, feature
+    in enumerate(FeatureEnum)
+}
+
+
+def get_feature_mask(features):
+    """Encode a collection of features as an integer bitmask.
+
+    Args:
+        features (list): list of FeatureEnum
+
+    Returns:
+        int
+    """
+    feature_mask = 0
+    for feature in features:
+        feature_mask |= FEATURE_BITS[feature]
+
+    return feature_mask
+
+
+def get_features_from_mask(feature_mask):
+    """Decode a bitmask back into a list of features.
+
+    Args:
+        feature_mask (int)
+
+    Returns:
+        list: list of FeatureEnum, in FeatureEnum order
+    """
+    return [
+        feature
+        for feature, feature_bit
+        in FEATURE_BITS.items()
+        if feature_mask & feature_bit
+    ]
+
+
+def has_feature(feature_mask, feature):
+    """Check if a feature is set in a bitmask.
+
+    Args:
+        feature_mask (int)
+        feature (FeatureEnum)
+
+    Returns:
+        bool
+    """
+    return bool(feature_mask & FEATURE_BITS[feature])
@@ -0,0 +1,55 @@
+from abc import ABCMeta, abstractmethod
+from threading import Lock
+
+
+class LazyIndex(metaclass=ABCMeta):
+    """LazyIndex class.
+
+    Base class of the indexes of a server list snapshot. The index is
+    built by _build() on first access, so that a snapshot does not pay
+    for indexes that are never queried. It can also be built ahead of
+    time with build(), i.e from a background thread.
+
+    Snapshots are read from several threads, thus the index is built
+    once under a lock, and the built index is read without locking.
+
+    Methods:
+        build()
+            build the index if it is not built yet
+        reset()
+            drop the index, it is built again on next access
+    """
+    def __init__(self):
+        self.__index = None
+        self.__build_lock = Lock()
+
+    @property
+    def is_built(self):
+        return self.__index is not None
+
+    def build(self):
+        self._get_index()
+
+    def reset(self):
+        with self.__build_lock:
+            self.__index = None
+
+    def _get_index(self):
+        index = self.__index
+        if index is not None:
+            return index
+
+        with self.__build_lock:
+            if self.__index is None:
+                self.__index = self._build()
+
+            return self.__index
+
+    @abstractmethod
+    def _build(self):
+        """Build the index.
+
+        Returns:
+            object: returned by _get_index() until reset() is called
+        """
+        raise NotImplementedError()
@@ -1,7 +1,30 @@
+from dataclasses import dataclass
+from itertools import count
+from threading import Lock
+
 from protonvpn_nm_lib.api import protonvpn
+from protonvpn_nm_lib.country_codes import country_codes
+from protonvpn_nm_lib.enums import ServerStatusEnum, ServerTierEnum
 
+from .. import rx
 from ..module import Module
-import concurrent.futures
+
+
+@dataclass(frozen=True)
+class ServerListSnapshot:
+    """Server list of a single generation.
+
+    Snapshots are never modified once published, apart from server loads,
+    scores and statuses which are updated in place by update_server_loads(),
+    thus they can be read from any thread without locking.
+    """
+    version: int
+    secure_core: object
+    none_secure_core: object
+    server_table: object = None
+    countries: tuple = None
+    score_index: object = None
+    streaming_services_index: object = None
 
 
 class ServerList:
@@ -11,69 +34,416 @@ class ServerList:
     dashboardserver list. This class can either generate a list with
     secure core servers or a list with non-secure servers.
 
+    Each generation is published as an immutable ServerListSnapshot,
+    which replaces the previous one at once. Generations that finish after
+    a newer one are discarded.
+
     Properties:
-        server_list: list
-            contains a list of CountryItem
+        snapshot: ServerListSnapshot
+            latest generated list
 
     Methods:
         generate_list()
             generates the neccesary elements for server listing and
             stores them in server_list
+        stream_list()
+            same as generate_list(), but emits the non-Secure Core
+            countries as soon as they are created
+        update_server_loads()
+            updates server loads, scores and statuses of the current
+            list in place
+        get_best_servers()
+            queries the servers with the best score of a country
+        get_streaming_services()
+            gets the streaming services of a country
+        dump()/restore()
+            converts the generated list from/to builtin types, so that
+            it can be cached to disk
     """
     def __init__(self):
-        self.__none_secure_core_servers = Module().non_secure_core_servers_model
-        self.__secure_core_servers = Module().secure_core_servers_model
+        self.__versions = count(1)
+        self.__publish_lock = Lock()
+        self.__snapshot = ServerListSnapshot(
+            version=0,
+            secure_core=Module().secure_core_servers_model,
+            none_secure_core=Module().non_secure_core_servers_model
+        )
+
+    @property
+    def snapshot(self):
+        return self.__snapshot
 
     @property
     def none_secure_core(self):
-        return self.__none_secure_core_servers
+        return self.__snapshot.none_secure_core
 
     @property
     def secure_core(self):
-        return self.__secure_core_servers
+        return self.__snapshot.secure_core
 
     def generate_list(self, user_tier):
         """Generate server list.
 
         Args:
             user_tier (ServerTierEnum)
+
+        Returns:
+            ServerListSnapshot|None: the published snapshot, or None if
+                a newer generation was published in the meantime
         """
-        unfiltered_server_list = []
-        server_list = protonvpn.get_session().servers
-        server_filter = protonvpn.get_session().servers.filter
+        return self.__generate(user_tier)
+
+    def stream_list(self, user_tier):
+        """Generate server list, emitting countries as they are created.
+
+        Countries are created in their final list order (countries
+        available to the user tier first), so that they can be displayed
+        before the whole list is generated. The list is generated when
+        the observable is subscribed to, on the subscribing thread.
+
+        Once a newer generation is published, countries are no longer
+        emitted and the generation stops, as it would be discarded anyway.
+
+        Args:
+            user_tier (ServerTierEnum)
+
+        Returns:
+            rx.Observable: emits the non-Secure Core CountryItem views in
+                list order, then the published ServerListSnapshot unless a
+                newer generation was published in the meantime
+        """
+        def subscribe(observer, scheduler=None):
+            try:
+                snapshot = self.__generate(user_tier, observer.on_next)
+            except Exception as e:
+                observer.on_error(e)
+                return
+
+            if snapshot is not None:
+                observer.on_next(snapshot)
+
+            observer.on_completed()
+
+        return rx.create(subscribe)
+
+    def __generate(self, user_tier, on_country_created=None):
+        """Generate server list.
+
+        Args:
+            user_tier (ServerTierEnum)
+            on_country_created (callable): if provided, countries are
+                created in list order and their non-Secure Core view
+                is passed to it as soon as it is created, until a newer
+                generation is published
+
+        Returns:
+            ServerListSnapshot|None: None if a newer generation was
+                published in the meantime
+        """
+        version = next(self.__versions)
+        countries = []
+        secure_core_countries = []
+        non_secure_core_countries = []
+        session = protonvpn.get_session()
+        server_list = session.servers
+        server_index = self.__get_server_index(server_list)
+        server_table = Module().server_table_model(user_tier)
         country_code_with_matching_servers = self\
             .__get_country_code_with_matching_servers(server_list)
 
-        self.__none_secure_core_servers.user_tier = user_tier
-        self.__secure_core_servers.user_tier = user_tier
+        secure_core_servers = self.__create_server_type(
+            "secure_core_default", user_tier
+        )
+        none_secure_core_servers = self.__create_server_type(
+            "non_secure_core_default", user_tier
+        )
+
+        country_codes_with_servernames = country_code_with_matching_servers\
+            .items()
+        if on_country_created is not None:
+            country_codes_with_servernames = self.__sort_country_codes(
+                country_codes_with_servernames,
+                server_index, none_secure_core_servers
+            )
 
-        for country_code, servername_list in country_code_with_matching_servers.items(): # noqa
+        for country_code, servername_list in country_codes_with_servernames:
             country_item = Module().country_item_model()
             country_item.create(
-                servername_list, server_filter,
-                user_tier, country_code
+                servername_list, server_index,
+                server_table, user_tier, country_code
+            )
+
+            countries.append(country_item)
+            secure_core_country, non_secure_core_country = country_item\
+                .split_by_secure_core()
+            secure_core_countries.append(secure_core_country)
+            non_secure_core_countries.append(non_secure_core_country)
+            if on_country_created is not None:
+                if self.__is_superseded(version):
+                    return None
+
+                none_secure_core_servers._default_sort(non_secure_core_country)
+                on_country_created(non_secure_core_country)
+
+        secure_core_servers.generate(secure_core_countries)
+        none_secure_core_servers.generate(non_secure_core_countries)
+
+        return self.__publish(ServerListSnapshot(
+            version=version,
+            secure_core=secure_core_servers,
+            none_secure_core=none_secure_core_servers,
+            server_table=server_table,
+            countries=tuple(countries),
+            score_index=Module().server_score_index_model(server_table),
+            streaming_services_index=Module().streaming_services_index_model(
+                session
             )
+        ))
+
+    def update_server_loads(self):
+        """Update server loads, scores and statuses in place.
+
+        Compares the current logical servers against the generated list
+        and only updates the servers whose load, score or status changed.
+        The score index is reset if scores or statuses changed, so that
+        get_best_servers() ranks servers by their current score.
 
-            unfiltered_server_list.append(country_item)
+        Returns:
+            list|None: (ServerTableRow, load, ServerStatusEnum) for each
+                server whose load or status changed, or None if the list has
+                to be regenerated with generate_list(), which is the case
+                when servers were added or removed or when a country status
+                would change.
+        """
+        snapshot = self.__snapshot
+        if snapshot.countries is None:
+            return None
+
+        server_table = snapshot.server_table
+        changes = server_table.get_load_changes(
+            protonvpn.get_session().servers
+        )
+        if changes is None or self.__changes_country_status(
+            snapshot, changes
+        ):
+            return None
 
-        _jobs = [
-            [self.__secure_core_servers, unfiltered_server_list],
-            [self.__none_secure_core_servers, unfiltered_server_list],
+        loads = server_table.loads
+        scores = server_table.scores
+        statuses = server_table.statuses
+        displayed_changes = [
+            (server_table.row(index), str(load), status)
+            for index, load, _, status in changes
+            if load != loads[index] or status.value != statuses[index]
         ]
+        ranking_changed = any(
+            score != scores[index] or status.value != statuses[index]
+            for index, _, score, status in changes
+        )
+
+        server_table.apply_load_changes(changes)
+        if ranking_changed:
+            snapshot.score_index.reset()
+
+        return displayed_changes
+
+    def get_best_servers(
+        self, exit_country_code, features=None, max_tier=None, count=1
+    ):
+        """Get the servers with the best score for an exit country.
 
-        with concurrent.futures.ProcessPoolExecutor() as exec:
-            res = exec.map(self._generate_process, _jobs)
-            for instance, servers in list(res):
-                if isinstance(instance, type(self.__secure_core_servers)):
-                    self.__secure_core_servers.servers = servers
-                elif isinstance(instance, type(self.__none_secure_core_servers)):
-                    self.__none_secure_core_servers.servers = servers
+        See ServerScoreIndex.get_best_servers().
 
-    def _generate_process(self, data):
-        instance = data[0]
-        servers = data[1]
+        Returns:
+            list: ServerTableRow, best score first, empty if no
+                list was generated yet
+        """
+        snapshot = self.__snapshot
+        if snapshot.score_index is None:
+            return []
+
+        return snapshot.score_index.get_best_servers(
+            exit_country_code, features, max_tier, count
+        )
+
+    def get_streaming_services(self, entry_country_code):
+        """Get the streaming services of a country.
+
+        See StreamingServicesIndex.get_services().
+
+        Returns:
+            tuple|None: StreamingService sorted by name, None if the
+                country does not support streaming or if no list was
+                generated yet
+        """
+        snapshot = self.__snapshot
+        if snapshot.streaming_services_index is None:
+            return None
+
+        return snapshot.streaming_services_index.get_services(
+            entry_country_code
+        )
+
+    def dump(self):
+        """Dump the generated list to builtin types.
+
+        Returns:
+            dict|None: None if no list is available
+        """
+        snapshot = self.__snapshot
+        if snapshot.server_table is None:
+            return None
+
+        return {
+            "server_table": snapshot.server_table.dump(),
+            "secure_core": [
+                country_item.dump()
+                for country_item in snapshot.secure_core.servers
+            ],
+            "non_secure_core": [
+                country_item.dump()
+                for country_item in snapshot.none_secure_core.servers
+            ],
+        }
+
+    def restore(self, data):
+        """Restore a list from the output of dump().
+
+        The restored list keeps the order in which it was dumped.
+        Since it does not come from the current logical servers it can
+        not be updated with update_server_loads(), thus it has to be
+        replaced by calling generate_list().
+
+        Args:
+            data (dict)
+
+        Returns:
+            ServerListSnapshot|None: the published snapshot, or None if
+                a newer generation was published in the meantime
+        """
+        version = next(self.__versions)
+        server_table = Module().server_table_model.restore(
+            data["server_table"]
+        )
+
+        secure_core_servers = self.__create_server_type(
+            "secure_core_default", server_table.user_tier
+        )
+        none_secure_core_servers = self.__create_server_type(
+            "non_secure_core_default", server_table.user_tier
+        )
+        secure_core_servers.servers = self.__restore_countries(
+            data["secure_core"], server_table
+        )
+        none_secure_core_servers.servers = self.__restore_countries(
+            data["non_secure_core"], server_table
+        )
+
+        # Restored countries are Secure Core/non-Secure Core views,
+        # which is not enough to detect country status changes,
+        # thus countries are not set.
+        return self.__publish(ServerListSnapshot(
+            version=version,
+            secure_core=secure_core_servers,
+            none_secure_core=none_secure_core_servers,
+            server_table=server_table,
+            score_index=Module().server_score_index_model(server_table),
+            streaming_services_index=Module().streaming_services_index_model(
+                protonvpn.get_session()
+            )
+        ))
+
+    def __create_server_type(self, server_type, user_tier):
+        server_type = Module().server_type_model.factory(server_type)
+        server_type.user_tier = user_tier
+        return server_type
 
-        return instance, instance.generate(servers)
+    def __is_superseded(self, version):
+        return version < self.__snapshot.version
+
+    def __publish(self, snapshot):
+        with self.__publish_lock:
+            if self.__is_superseded(snapshot.version):
+                return None
+
+            self.__snapshot = snapshot
+
+        return snapshot
+
+    def __restore_countries(self, country_list, server_table):
+        countries = []
+        for data in country_list:
+            country_item = Module().country_item_model()
+            country_item.restore(data, server_table)
+            countries.append(country_item)
+
+        return countries
+
+    def __changes_country_status(self, snapshot, changes):
+        new_status_by_index = {
+            index: status
+            for index, _, _, status in changes
+            if status != snapshot.server_table.row(index).status
+        }
+        if not new_status_by_index:
+            return False
+
+        for country_item in snapshot.countries:
+            if not any(
+                server.index in new_status_by_index
+                for server in country_item.servers
+            ):
+                continue
+
+            country_is_active = any(
+                new_status_by_index.get(
+                    server.index, server.status
+                ) == ServerStatusEnum.ACTIVE
+                for server in country_item.servers
+            )
+            if country_is_active != (
+                country_item.status == ServerStatusEnum.ACTIVE
+            ):
+                return True
+
+        return False
+
+    def __sort_country_codes(
+        self, country_codes_with_servernames, server_index, server_type
+    ):
+        """Sort country codes in the order of the non-Secure Core list.
+
+        Only the minimum tier and the name of each country are needed to
+        know its position, which are cheap to get from the logical servers.
+        The list is still sorted once all countries are created, which
+        keeps this order since the same sort key is used.
+
+        Returns:
+            list: (country code, servernames)
+        """
+        def get_sort_key(country_code_with_servernames):
+            country_code, servername_list = country_code_with_servernames
+            minimum_country_tier = ServerTierEnum(min(
+                server_index[servername.lower()].tier
+                for servername in servername_list
+            ))
+            return server_type.get_country_sort_key(
+                minimum_country_tier,
+                country_codes.get(country_code, country_code)
+            )
+
+        return sorted(country_codes_with_servernames, key=get_sort_key)
+
+    def __get_server_index(self, server_list):
+        """Index logical servers by their lowercase name.
+
+        Built once per refresh so that each CountryItem can resolve
+        its servers with a dict lookup instead of scanning the whole list.
+        """
+        return {
+            logical_server.name.lower(): logical_server
+            for logical_server in server_list
+        }
 
     def __get_country_code_with_matching_servers(self, server_list):
         country = protonvpn.get_country()
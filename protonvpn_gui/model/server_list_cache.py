@@ -0,0 +1,116 @@
+import json
+import os
+import struct
+import zlib
+
+from protonvpn_nm_lib.constants import PROTON_XDG_CACHE_HOME
+
+from ..logger import logger
+
+SERVER_LIST_CACHE_FILEPATH = os.path.join(
+    PROTON_XDG_CACHE_HOME, "gui_server_list.cache"
+)
+
+
+class ServerListCache:
+    """ServerListCache class.
+
+    Persists the last generated ServerList, so that it can be displayed
+    right away at startup, while a fresh list is being generated.
+
+    The file starts with a magic string and a format version, followed
+    by the zlib compressed ServerList.dump() output. Files with another
+    format version are ignored and overwritten on the next save.
+
+    Methods:
+        save(server_list)
+            write server list to disk
+        load(server_list, user_tier)
+            restore cached list into server_list
+    """
+    MAGIC = b"PVGUISL"
+    # 2: scores are stored as floats instead of being truncated
+    FORMAT_VERSION = 2
+    __HEADER = struct.Struct(">7sH")
+
+    def __init__(self, filepath=SERVER_LIST_CACHE_FILEPATH):
+        self.__filepath = filepath
+
+    @property
+    def filepath(self):
+        return self.__filepath
+
+    def save(self, server_list):
+        """Save server list to cache.
+
+        Args:
+            server_list (ServerList): generated server list
+        """
+        data = server_list.dump()
+        if data is None:
+            return
+
+        payload = zlib.compress(
+            json.dumps(data, separators=(",", ":")).encode("utf-8")
+        )
+        cache_dir = os.path.dirname(self.__filepath)
+        if not os.path.isdir(cache_dir):
+            os.makedirs(cache_dir)
+
+        tmp_filepath = self.__filepath + ".tmp"
+        with open(tmp_filepath, "wb") as f:
+            f.write(self.__HEADER.pack(self.MAGIC, self.FORMAT_VERSION))
+            f.write(payload)
+
+        os.replace(tmp_filepath, self.__filepath)
+
+    def load(self, server_list, user_tier):
+        """Load cached server list.
+
+        Args:
+            server_list (ServerList): list to restore the cache into
+            user_tier (ServerTierEnum): current user tier, the cache is
+                ignored if it was generated for another tier
+
+        Returns:
+            bool: if the cache was restored, False if it is missing,
+                corrupted or of another format version
+        """
+        try:
+            with open(self.__filepath, "rb") as f:
+                content = f.read()
+        except FileNotFoundError:
+            return False
+
+        try:
+            magic, version = self.__HEADER.unpack_from(content)
+        except struct.error:
+            logger.info("Server list cache is corrupted")
+            return False
+
+        if magic != self.MAGIC or version != self.FORMAT_VERSION:
+            logger.info(
+                "Ignoring server list cache with format version {}".format(
+                    version
+                )
+            )
+            return False
+
+        try:
+            data = json.loads(
+                zlib.decompress(content[self.__HEADER.size:]).decode("utf-8")
+            )
+        except (zlib.error, ValueError):
+            logger.info("Server list cache is corrupted")
+            return False
+
+        # The payload can be valid JSON without being a dumped
+        # server list, i.e if the file was partially overwritten.
+        try:
+            if data["server_table"]["user_tier"] != user_tier.value:
+                return False
+
+            return server_list.restore(data) is not None
+        except (KeyError, IndexError, TypeError, ValueError):
+            logger.info("Server list cache is corrupted")
+            return False
@@ -0,0 +1,99 @@
+from itertools import islice
+
+from protonvpn_nm_lib.enums import FeatureEnum
+
+from .feature_mask import get_feature_mask
+from .lazy_index import LazyIndex
+
+
+class ServerScoreIndex(LazyIndex):
+    """ServerScoreIndex class.
+
+    Query index over a ServerTable, to find the best servers of a
+    country without going through the whole server list.
+
+    For each exit country, and for each exit country and feature, the
+    row indexes are kept in runs that are pre-sorted by score, best
+    score first. A query walks the most specific run and stops as soon as
+    enough servers match, thus it only visits the servers it returns plus
+    the ones filtered out by tier or by additional features.
+
+    Runs are sorted by the scores of the table at the time they are built,
+    reset() has to be called once scores are updated.
+
+    Methods:
+        get_best_servers(exit_country_code, features, max_tier, count)
+            get the servers with the best score
+    """
+    def __init__(self, server_table):
+        super().__init__()
+        self.__server_table = server_table
+
+    def get_best_servers(
+        self, exit_country_code, features=None, max_tier=None, count=1
+    ):
+        """Get the servers with the best score for an exit country.
+
+        Args:
+            exit_country_code (str): case insensitive
+            features (list): FeatureEnum that the servers must all have
+            max_tier (ServerTierEnum): if provided, servers of a
+                higher tier are ignored
+            count (int): max amount of servers to return
+
+        Returns:
+            list: ServerTableRow, best score first
+        """
+        features = [
+            feature
+            for feature in (features or [])
+            if feature != FeatureEnum.NORMAL
+        ]
+        run = self._get_index().get(
+            (
+                exit_country_code.upper(),
+                features[0] if features else None
+            ),
+            []
+        )
+        feature_mask = get_feature_mask(features)
+        feature_masks = self.__server_table.feature_masks
+        tiers = self.__server_table.tiers
+        max_tier_value = None if max_tier is None else max_tier.value
+
+        matching_indexes = (
+            index
+            for index in run
+            if feature_masks[index] & feature_mask == feature_mask
+            and (max_tier_value is None or tiers[index] <= max_tier_value)
+        )
+
+        return [
+            self.__server_table.row(index)
+            for index in islice(matching_indexes, count)
+        ]
+
+    def _build(self):
+        server_table = self.__server_table
+        scores = server_table.scores
+        runs = {}
+        for index in sorted(
+            range(len(server_table)),
+            key=lambda index: scores[index],
+            reverse=True
+        ):
+            exit_country_code = server_table.exit_country_codes[index]
+            if not exit_country_code:
+                continue
+
+            exit_country_code = exit_country_code.upper()
+            runs.setdefault((exit_country_code, None), []).append(index)
+            for feature in server_table.features[index]:
+                if feature == FeatureEnum.NORMAL:
+                    continue
+
+                runs.setdefault(
+                    (exit_country_code, feature), []
+                ).append(index)
+
+        return runs
@@ -0,0 +1,348 @@
+from dataclasses import dataclass
+
+from protonvpn_nm_lib.enums import FeatureEnum
+
+from .feature_mask import has_feature
+from .lazy_index import LazyIndex
+
+FEATURE_KEYWORDS = {
+    FeatureEnum.P2P: "p2p",
+    FeatureEnum.TOR: "tor",
+    FeatureEnum.STREAMING: "streaming",
+}
+
+
+# Words shorter than this are only matched exactly,
+# since almost any short word is a few typos away from another one.
+FUZZY_MIN_LENGTH = 4
+# Words shorter than this only match countries, as a single letter
+# would otherwise match servers from almost every country.
+SERVER_MATCH_MIN_LENGTH = 2
+
+
+@dataclass(frozen=True)
+class CountrySearchMatch:
+    """Country matching a search.
+
+    server_names is None if the country itself matches, otherwise it
+    holds the servers of the country that match.
+    """
+    country_name: str
+    server_names: frozenset = None
+
+
+@dataclass(frozen=True)
+class _SearchTerms:
+    """Lookup tables of a ServerSearchIndex, by lowercase term."""
+    country_names_by_substring: dict
+    country_names_by_prefix: dict
+    server_names_by_prefix: dict
+    country_name_by_server_name: dict
+    fuzzy_terms_by_trigram: dict
+    country_positions: dict
+
+
+class ServerSearchIndex(LazyIndex):
+    """ServerSearchIndex class.
+
+    Inverted index over the countries of a server list, mapping search
+    terms to the matching countries and servers.
+
+    A country matches if the search term is part of its name, or if
+    each word of the search term is the beginning of any of:
+        - country name words, country code and feature keywords
+          (p2p, tor, streaming)
+        - server names (i.e CH#12, or DE#1 for IS-DE#1) and server cities
+    When words only match servers of a country, the matching servers are
+    part of the result, so that only them can be displayed.
+
+    Words that do not match exactly are also matched with typos against
+    country names, cities and feature keywords (i.e Swizerland or
+    Frankfrt). Candidate terms are those sharing a trigram with the word,
+    and are kept if their bounded edit distance to the word is low enough.
+
+    Methods:
+        search(user_input)
+            get the matching countries, best matches first
+    """
+    def __init__(self, countries):
+        super().__init__()
+        self.__countries = countries
+
+    def search(self, user_input):
+        """Get the countries that match the user input.
+
+        Args:
+            user_input (str)
+
+        Returns:
+            tuple|None: CountrySearchMatch, exact matches first in list
+                order followed by the closest typo matches, or None if the
+                input is empty and all countries match
+        """
+        if not user_input:
+            return None
+
+        terms = self._get_index()
+        user_input = user_input.lower()
+        matches = dict.fromkeys(
+            terms.country_names_by_substring.get(user_input, ()), (0, None)
+        )
+
+        words = user_input.split()
+        if words:
+            word_matches = [
+                self.__get_word_matches(terms, word) for word in words
+            ]
+            for country_name in set(word_matches[0]).intersection(
+                *word_matches[1:]
+            ):
+                if country_name in matches:
+                    continue
+
+                distance = 0
+                server_names = None
+                for word_match in word_matches:
+                    word_distance, word_server_names = word_match[country_name]
+                    distance += word_distance
+                    if word_server_names is None:
+                        continue
+
+                    server_names = word_server_names if server_names is None\
+                        else server_names & word_server_names
+
+                if server_names is None or server_names:
+                    matches[country_name] = (distance, server_names)
+
+        return tuple(
+            CountrySearchMatch(country_name, matches[country_name][1])
+            for country_name in sorted(
+                matches,
+                key=lambda country_name: (
+                    matches[country_name][0],
+                    terms.country_positions[country_name]
+                )
+            )
+        )
+
+    def __get_word_matches(self, terms, word):
+        """Get the countries matching a single word.
+
+        Returns:
+            dict: (distance, server names|None) by country name
+        """
+        matches = {}
+        self.__add_term_matches(terms, matches, word, 0)
+        if len(word) < FUZZY_MIN_LENGTH:
+            return matches
+
+        max_distance = 1 if len(word) <= 5 else 2
+        candidate_terms = set()
+        for trigram in get_trigrams(word):
+            candidate_terms.update(
+                terms.fuzzy_terms_by_trigram.get(trigram, ())
+            )
+
+        for term in candidate_terms:
+            distance = get_prefix_edit_distance(word, term, max_distance)
+            if distance <= max_distance:
+                self.__add_term_matches(terms, matches, term, distance)
+
+        return matches
+
+    def __add_term_matches(self, terms, matches, term, distance):
+        for country_name in terms.country_names_by_prefix.get(term, ()):
+            self.__add_match(matches, country_name, distance, None)
+
+        if len(term) < SERVER_MATCH_MIN_LENGTH:
+            return
+
+        server_names_by_country_name = {}
+        for server_name in terms.server_names_by_prefix.get(term, ()):
+            server_names_by_country_name.setdefault(
+                terms.country_name_by_server_name[server_name], set()
+            ).add(server_name)
+
+        for country_name, server_names in server_names_by_country_name.items():
+            self.__add_match(
+                matches, country_name, distance, frozenset(server_names)
+            )
+
+    def __add_match(self, matches, country_name, distance, server_names):
+        try:
+            current_distance, current_server_names = matches[country_name]
+        except KeyError:
+            matches[country_name] = (distance, server_names)
+            return
+
+        if distance < current_distance:
+            matches[country_name] = (distance, server_names)
+        elif distance == current_distance and current_server_names is not None:
+            matches[country_name] = (
+                distance,
+                None if server_names is None
+                else current_server_names | server_names
+            )
+
+    def _build(self):
+        country_names_by_substring = {}
+        country_names_by_prefix = {}
+        server_names_by_prefix = {}
+        country_name_by_server_name = {}
+        fuzzy_terms_by_trigram = {}
+        for country_item in self.__countries:
+            country_name = country_item.country_name
+            self.__add_substrings(country_names_by_substring, country_name)
+            for term in self.__get_country_terms(country_item):
+                self.__add_prefixes(
+                    country_names_by_prefix, term, country_name
+                )
+
+            for server in country_item.servers:
+                country_name_by_server_name[server.name] = country_name
+                for term in self.__get_server_terms(server):
+                    self.__add_prefixes(
+                        server_names_by_prefix, term, server.name
+                    )
+
+            for term in self.__get_fuzzy_terms(country_item):
+                for trigram in get_trigrams(term):
+                    fuzzy_terms_by_trigram.setdefault(
+                        trigram, set()
+                    ).add(term)
+
+        return _SearchTerms(
+            country_names_by_substring=self.__freeze(
+                country_names_by_substring
+            ),
+            country_names_by_prefix=self.__freeze(country_names_by_prefix),
+            server_names_by_prefix=self.__freeze(server_names_by_prefix),
+            country_name_by_server_name=country_name_by_server_name,
+            fuzzy_terms_by_trigram=self.__freeze(fuzzy_terms_by_trigram),
+            country_positions={
+                country_item.country_name: position
+                for position, country_item in enumerate(self.__countries)
+            }
+        )
+
+    def __get_fuzzy_terms(self, country_item):
+        terms = set(
+            word
+            for word in country_item.country_name.lower().split()
+            if len(word) >= FUZZY_MIN_LENGTH
+        )
+        for feature, keyword in FEATURE_KEYWORDS.items():
+            if (
+                len(keyword) >= FUZZY_MIN_LENGTH
+                and has_feature(country_item.feature_mask, feature)
+            ):
+                terms.add(keyword)
+
+        for server in country_item.servers:
+            if server.city:
+                terms.update(
+                    word
+                    for word in server.city.lower().split()
+                    if len(word) >= FUZZY_MIN_LENGTH
+                )
+
+        return terms
+
+    def __get_country_terms(self, country_item):
+        terms = set(country_item.country_name.lower().split())
+        if country_item.entry_country_code:
+            terms.add(country_item.entry_country_code.lower())
+
+        for feature, keyword in FEATURE_KEYWORDS.items():
+            if has_feature(country_item.feature_mask, feature):
+                terms.add(keyword)
+
+        return terms
+
+    def __get_server_terms(self, server):
+        servername = server.name.lower()
+        terms = {servername}
+        if "-" in servername:
+            terms.add(servername.split("-", 1)[1])
+
+        if server.city:
+            city = server.city.lower()
+            terms.add(city)
+            terms.update(city.split())
+
+        return terms
+
+    def __add_substrings(self, country_names_by_substring, country_name):
+        lowercase_country_name = country_name.lower()
+        for start in range(len(lowercase_country_name)):
+            for end in range(start + 1, len(lowercase_country_name) + 1):
+                country_names_by_substring.setdefault(
+                    lowercase_country_name[start:end], set()
+                ).add(country_name)
+
+    def __add_prefixes(self, names_by_prefix, term, name):
+        for end in range(1, len(term) + 1):
+            names_by_prefix.setdefault(term[:end], set()).add(name)
+
+    def __freeze(self, values_by_term):
+        # Most terms match the same few values,
+        # thus equal sets are shared.
+        frozen_sets = {}
+        frozen_values_by_term = {}
+        for term, values in values_by_term.items():
+            values = frozenset(values)
+            frozen_values_by_term[term] = frozen_sets.setdefault(
+                values, values
+            )
+
+        return frozen_values_by_term
+
+
+def get_trigrams(word):
+    """Get the set of 3 letter sequences of a word.
+
+    The word is padded at the start, so that words with a typo in
+    the middle still share a trigram with the term they are close to
+    (i.e Untied and United share "$un").
+
+    Args:
+        word (str)
+
+    Returns:
+        set
+    """
+    word = "$$" + word
+    return set(word[index:index + 3] for index in range(len(word) - 2))
+
+
+def get_prefix_edit_distance(word, term, max_distance):
+    """Get the edit distance between a word and the closest prefix of term.
+
+    Prefixes are considered, so that a word can match while it is
+    still being typed (i.e Swizer for Switzerland).
+
+    Args:
+        word (str)
+        term (str)
+        max_distance (int): computation stops once the distance
+            is known to be higher
+
+    Returns:
+        int: edit distance, or max_distance + 1 if higher
+    """
+    previous_row = list(range(len(term) + 1))
+    for word_index, word_char in enumerate(word, 1):
+        current_row = [word_index]
+        for term_index, term_char in enumerate(term, 1):
+            current_row.append(min(
+                previous_row[term_index] + 1,
+                current_row[term_index - 1] + 1,
+                previous_row[term_index - 1] + (word_char != term_char)
+            ))
+
+        if min(current_row) > max_distance:
+            return max_distance + 1
+
+        previous_row = current_row
+
+    return min(min(previous_row), max_distance + 1)
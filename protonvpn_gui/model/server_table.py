@@ -0,0 +1,430 @@
+from array import array
+import sys
+
+from protonvpn_nm_lib.enums import ServerStatusEnum, ServerTierEnum
+
+from .feature_mask import get_feature_mask, get_features_from_mask
+
+TIER_BY_VALUE = {tier.value: tier for tier in ServerTierEnum}
+STATUS_BY_VALUE = {status.value: status for status in ServerStatusEnum}
+
+
+class ServerTable:
+    """ServerTable class.
+
+    Columnar storage for all the servers of a server list generation.
+    Each server is a row index into parallel arrays, numeric values
+    are stored in typed arrays and repeated strings are interned, so that
+    thousands of servers share their country codes, cities and
+    feature lists instead of each holding its own copy. Features are
+    additionally stored as bitmasks (see feature_mask.py). Servernames are
+    unique, thus they are stored as they come from the logical servers.
+
+    Rows are accessed through ServerTableRow, which exposes the properties
+    of a server. Rows are only created on access and are not kept by the
+    table, collections of servers are ServerTableRows that only hold
+    row indexes.
+
+    Properties:
+        user_tier: ServerTierEnum
+            tier of the user, used to compute has_to_upgrade
+    """
+    __slots__ = (
+        "__user_tier", "__names", "__loads", "__scores", "__cities",
+        "__features", "__feature_masks", "__tiers", "__statuses", "__exit_country_codes",
+        "__entry_country_codes", "__host_countries", "__interned_features"
+    )
+
+    def __init__(self, user_tier):
+        self.__user_tier = ServerTierEnum(user_tier)
+        self.__names = []
+        self.__loads = array("B")
+        self.__scores = array("d")
+        self.__cities = []
+        self.__features = []
+        self.__feature_masks = array("I")
+        self.__tiers = array("b")
+        self.__statuses = array("b")
+        self.__exit_country_codes = []
+        self.__entry_country_codes = []
+        self.__host_countries = []
+        self.__interned_features = {}
+
+    def __len__(self):
+        return len(self.__names)
+
+    @property
+    def user_tier(self):
+        return self.__user_tier
+
+    @property
+    def names(self):
+        return self.__names
+
+    @property
+    def loads(self):
+        return self.__loads
+
+    @property
+    def scores(self):
+        return self.__scores
+
+    @property
+    def cities(self):
+        return self.__cities
+
+    @property
+    def features(self):
+        return self.__features
+
+    @property
+    def feature_masks(self):
+        return self.__feature_masks
+
+    @property
+    def tiers(self):
+        return self.__tiers
+
+    @property
+    def statuses(self):
+        return self.__statuses
+
+    @property
+    def exit_country_codes(self):
+        return self.__exit_country_codes
+
+    @property
+    def entry_country_codes(self):
+        return self.__entry_country_codes
+
+    @property
+    def host_countries(self):
+        return self.__host_countries
+
+    def append(self, logical_server):
+        """Add a logical server to the table.
+
+        Args:
+            logical_server (LogicalServer)
+
+        Returns:
+            ServerTableRow: view over the newly added row
+        """
+        self.__names.append(logical_server.name)
+        self.__loads.append(int(logical_server.load))
+        self.__scores.append(float(logical_server.score))
+        self.__cities.append(self.__intern(logical_server.city))
+        features, feature_mask = self.__intern_features(logical_server.features)
+        self.__features.append(features)
+        self.__feature_masks.append(feature_mask)
+        self.__tiers.append(ServerTierEnum(logical_server.tier).value)
+        self.__statuses.append(ServerStatusEnum(logical_server.enabled).value)
+        self.__exit_country_codes.append(
+            self.__intern(logical_server.exit_country)
+        )
+        self.__entry_country_codes.append(
+            self.__intern(logical_server.entry_country)
+        )
+        self.__host_countries.append(
+            self.__intern(logical_server.host_country)
+        )
+
+        return self.row(len(self.__names) - 1)
+
+    def row(self, index):
+        """Get a view over a row.
+
+        Args:
+            index (int): row index
+
+        Returns:
+            ServerTableRow
+        """
+        return ServerTableRow(self, index)
+
+    def get_load_changes(self, server_list):
+        """Compare the table against a fresh list of logical servers.
+
+        Only loads, scores and statuses are compared. If servers were
+        added, removed or had their tier or features changed, the table
+        can not be updated in place and None is returned instead.
+
+        Args:
+            server_list (list): list of LogicalServer
+
+        Returns:
+            list|None: (row index, load, score, ServerStatusEnum) for each
+                server whose load, score or status changed
+        """
+        # Only needed while comparing, thus it is not kept
+        # with the table, as loads are compared every few minutes.
+        index_by_name = {
+            name: index for index, name in enumerate(self.__names)
+        }
+        changes = []
+        matching_servers = 0
+        for logical_server in server_list:
+            index = index_by_name.get(logical_server.name)
+            if (
+                index is None
+                or self.__tiers[index] != ServerTierEnum(logical_server.tier).value
+                or self.__feature_masks[index] != get_feature_mask(
+                    logical_server.features
+                )
+            ):
+                return None
+
+            matching_servers += 1
+            load = int(logical_server.load)
+            score = float(logical_server.score)
+            status = ServerStatusEnum(logical_server.enabled)
+            if (
+                self.__loads[index] != load
+                or self.__scores[index] != score
+                or self.__statuses[index] != status.value
+            ):
+                changes.append((index, load, score, status))
+
+        if matching_servers != len(self.__names):
+            return None
+
+        return changes
+
+    def apply_load_changes(self, changes):
+        """Write changes from get_load_changes() into the table.
+
+        Args:
+            changes (list): (row index, load, score, ServerStatusEnum)
+        """
+        for index, load, score, status in changes:
+            self.__loads[index] = load
+            self.__scores[index] = score
+            self.__statuses[index] = status.value
+
+    def dump(self):
+        """Dump the table columns to builtin types.
+
+        Returns:
+            dict
+        """
+        return {
+            "user_tier": self.__user_tier.value,
+            "names": self.__names,
+            "loads": self.__loads.tolist(),
+            "scores": self.__scores.tolist(),
+            "cities": self.__cities,
+            "feature_masks": self.__feature_masks.tolist(),
+            "tiers": self.__tiers.tolist(),
+            "statuses": self.__statuses.tolist(),
+            "exit_country_codes": self.__exit_country_codes,
+            "entry_country_codes": self.__entry_country_codes,
+            "host_countries": self.__host_countries,
+        }
+
+    @classmethod
+    def restore(cls, data):
+        """Create a table from the output of dump().
+
+        Args:
+            data (dict)
+
+        Returns:
+            ServerTable
+        """
+        table = cls(data["user_tier"])
+        table.__names = list(data["names"])
+        table.__loads = array("B", data["loads"])
+        table.__scores = array("d", data["scores"])
+        table.__cities = [table.__intern(city) for city in data["cities"]]
+        table.__feature_masks = array("I", data["feature_masks"])
+        table.__tiers = array("b", data["tiers"])
+        table.__statuses = array("b", data["statuses"])
+        table.__exit_country_codes = [
+            table.__intern(code) for code in data["exit_country_codes"]
+        ]
+        table.__entry_country_codes = [
+            table.__intern(code) for code in data["entry_country_codes"]
+        ]
+        table.__host_countries = [
+            table.__intern(code) for code in data["host_countries"]
+        ]
+
+        features_by_mask = {}
+        for feature_mask in table.__feature_masks:
+            if feature_mask not in features_by_mask:
+                features_by_mask[feature_mask] = tuple(
+                    get_features_from_mask(feature_mask)
+                )
+        table.__features = [
+            features_by_mask[feature_mask]
+            for feature_mask in table.__feature_masks
+        ]
+        table.__interned_features = {
+            features: (features, feature_mask)
+            for feature_mask, features in features_by_mask.items()
+        }
+
+        return table
+
+    def __intern(self, value):
+        if isinstance(value, str):
+            return sys.intern(value)
+
+        return value
+
+    def __intern_features(self, features):
+        features = tuple(features)
+        try:
+            return self.__interned_features[features]
+        except KeyError:
+            interned_features = (features, get_feature_mask(features))
+            self.__interned_features[features] = interned_features
+            return interned_features
+
+
+class ServerTableRows:
+    """ServerTableRows class.
+
+    List-like collection of servers of a ServerTable. Only row indexes
+    are stored, in a typed array, and a ServerTableRow is created each
+    time a server is accessed. Thus countries do not keep one object per
+    server, which is most of the memory of a server list otherwise.
+
+    Supports len(), iteration, indexing, append() and sort(), which is
+    what the model and views expect from a list of servers.
+    """
+    __slots__ = ("__table", "__indexes")
+
+    def __init__(self, table, indexes=()):
+        self.__table = table
+        self.__indexes = array("I", indexes)
+
+    def __len__(self):
+        return len(self.__indexes)
+
+    def __iter__(self):
+        return map(self.__table.row, self.__indexes)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return ServerTableRows(self.__table, self.__indexes[index])
+
+        return self.__table.row(self.__indexes[index])
+
+    def __repr__(self):
+        return "{}({})".format(type(self).__name__, list(self))
+
+    @property
+    def indexes(self):
+        return self.__indexes
+
+    def append(self, server):
+        """Add a server.
+
+        Args:
+            server (ServerTableRow): row of the same table
+        """
+        self.__indexes.append(server.index)
+
+    def sort(self, key, reverse=False):
+        """Sort servers in place.
+
+        Args:
+            key (callable): receives a ServerTableRow
+            reverse (bool)
+        """
+        row = self.__table.row
+        self.__indexes = array("I", sorted(
+            self.__indexes,
+            key=lambda index: key(row(index)),
+            reverse=reverse
+        ))
+
+    def copy(self):
+        return ServerTableRows(self.__table, self.__indexes)
+
+
+class ServerTableRow:
+    """ServerTableRow class.
+
+    Lightweight view over a single row of a ServerTable, this is how
+    the model and views access a server.
+
+    Properties:
+        name, city, load, score, features, feature_mask, tier, status,
+        exit_country_code, entry_country_code, host_country
+            values of the row
+        is_plus: bool
+            the server tier is Plus or higher
+        has_to_upgrade: bool
+            the server tier is higher than the user tier
+    """
+    __slots__ = ("__table", "__index")
+
+    def __init__(self, table, index):
+        self.__table = table
+        self.__index = index
+
+    def __str__(self):
+        return self.__repr__()
+
+    def __repr__(self):
+        return "{} || {} ({})".format(
+            type(self), self.name, self.features
+        )
+
+    @property
+    def index(self):
+        return self.__index
+
+    @property
+    def name(self):
+        return self.__table.names[self.__index]
+
+    @property
+    def load(self):
+        return str(self.__table.loads[self.__index])
+
+    @property
+    def score(self):
+        return self.__table.scores[self.__index]
+
+    @property
+    def city(self):
+        return self.__table.cities[self.__index]
+
+    @property
+    def features(self):
+        return self.__table.features[self.__index]
+
+    @property
+    def feature_mask(self):
+        return self.__table.feature_masks[self.__index]
+
+    @property
+    def tier(self):
+        return TIER_BY_VALUE[self.__table.tiers[self.__index]]
+
+    @property
+    def is_plus(self):
+        return self.__table.tiers[self.__index] >= ServerTierEnum.PLUS_VISIONARY.value
+
+    @property
+    def status(self):
+        return STATUS_BY_VALUE[self.__table.statuses[self.__index]]
+
+    @property
+    def exit_country_code(self):
+        return self.__table.exit_country_codes[self.__index]
+
+    @property
+    def entry_country_code(self):
+        return self.__table.entry_country_codes[self.__index]
+
+    @property
+    def has_to_upgrade(self):
+        return self.__table.tiers[self.__index] > self.__table.user_tier.value
+
+    @property
+    def host_country(self):
+        return self.__table.host_countries[self.__index]
@@ -1,8 +1,22 @@
-from protonvpn_nm_lib.enums import ServerTierEnum, FeatureEnum
+from protonvpn_nm_lib.enums import ServerTierEnum
 from abc import abstractmethod, ABCMeta
+from collections import Counter
+from functools import lru_cache
+import locale
+from ..module import Module
 from ..utils import SubclassesMixin
 
 
+@lru_cache(maxsize=None)
+def get_collation_key(name):
+    """Get the locale-aware sort key of a country name.
+
+    Country names do not change within a session, thus keys are
+    computed once and reused by every server list generation.
+    """
+    return locale.strxfrm(name)
+
+
 class ServerType(SubclassesMixin, metaclass=ABCMeta):
     @classmethod
     def factory(cls, type="default"):
@@ -28,6 +42,11 @@ class ServerType(SubclassesMixin, metaclass=ABCMeta):
     def servers():
         raise NotImplementedError()
 
+    @property
+    @abstractmethod
+    def search_index():
+        raise NotImplementedError()
+
     @property
     @abstractmethod
     def total_countries_count():
@@ -64,6 +83,7 @@ class SecureCoreServers(ServerType):
     def __init__(self):
         self.__servers = []
         self.__user_tier = None
+        self.__search_index = Module().server_search_index_model([])
 
     @property
     def user_tier(self):
@@ -80,6 +100,11 @@ class SecureCoreServers(ServerType):
     @servers.setter
     def servers(self, newvalue):
         self.__servers = newvalue
+        self.__search_index = Module().server_search_index_model(newvalue)
+
+    @property
+    def search_index(self):
+        return self.__search_index
 
     @property
     def total_countries_count(self):
@@ -101,19 +126,20 @@ class SecureCoreServers(ServerType):
     def internal_countries_count(self):
         pass
 
-    def generate(self, unfiltered_server_list):
-        self.__servers = []
-        for country_item in unfiltered_server_list:
-            country_item.servers = list(filter(
-                lambda server: any(
-                    feature == FeatureEnum.SECURE_CORE
-                    for feature
-                    in server.features
-                ), country_item.servers
-            ))
-
-            self.__servers.append(country_item)
-        self.__servers.sort(key=lambda c: c.country_name)
+    def generate(self, country_list):
+        """Generate Secure Core list.
+
+        Args:
+            country_list (list): CountryItem views that only
+                contain Secure Core servers
+        """
+        self.__servers = list(country_list)
+        self.__servers.sort(
+            key=lambda country: get_collation_key(country.country_name)
+        )
+        self.__search_index = Module().server_search_index_model(
+            self.__servers
+        )
 
         return self.__servers
 
@@ -124,12 +150,23 @@ class NonSecureCoreServers(ServerType):
     def __init__(self):
         self.__servers = []
         self.__user_tier = None
+        self.__countries_per_tier = Counter()
+        self.__search_index = Module().server_search_index_model([])
         self.sort_methods_by_tier = {
             ServerTierEnum.FREE: self._sort_for_free_user,
             ServerTierEnum.BASIC: self._sort_for_basic_user,
             ServerTierEnum.PLUS_VISIONARY: self._sort_for_plus_user,
             ServerTierEnum.PM: self._sort_for_internal_user,
         }
+        # Receive the minimum tier of a country and return True if it
+        # should be listed after the ones available to the user
+        self.is_upgrade_tier_by_user_tier = {
+            ServerTierEnum.FREE: lambda tier: tier != ServerTierEnum.FREE,
+            ServerTierEnum.BASIC:
+                lambda tier: tier.value > ServerTierEnum.BASIC.value,
+            ServerTierEnum.PLUS_VISIONARY: lambda tier: False,
+            ServerTierEnum.PM: lambda tier: tier != ServerTierEnum.PM,
+        }
 
     @property
     def user_tier(self):
@@ -146,6 +183,12 @@ class NonSecureCoreServers(ServerType):
     @servers.setter
     def servers(self, newvalue):
         self.__servers = newvalue
+        self.__count_countries_per_tier()
+        self.__search_index = Module().server_search_index_model(newvalue)
+
+    @property
+    def search_index(self):
+        return self.__search_index
 
     @property
     def total_countries_count(self):
@@ -153,130 +196,120 @@ class NonSecureCoreServers(ServerType):
 
     @property
     def free_countries_count(self):
-        num_countries = 0
-        for server in self.__servers:
-            if ServerTierEnum.FREE == server.minimum_country_tier:
-                num_countries += 1
-
-        return num_countries
+        return self.__countries_per_tier[ServerTierEnum.FREE]
 
     @property
     def basic_countries_count(self):
-        num_countries = 0
-        for server in self.__servers:
-            if ServerTierEnum.BASIC == server.minimum_country_tier:
-                num_countries += 1
-
-        return num_countries
+        return self.__countries_per_tier[ServerTierEnum.BASIC]
 
     @property
     def plus_countries_count(self):
-        num_countries = 0
-        for server in self.__servers:
-            if ServerTierEnum.PLUS_VISIONARY == server.minimum_country_tier:
-                num_countries += 1
-
-        return num_countries
+        return self.__countries_per_tier[ServerTierEnum.PLUS_VISIONARY]
 
     @property
     def internal_countries_count(self):
-        num_countries = 0
-        for server in self.__servers:
-            if ServerTierEnum.PM == server.minimum_country_tier:
-                num_countries += 1
+        return self.__countries_per_tier[ServerTierEnum.PM]
 
-        return num_countries
+    def generate(self, country_list):
+        """Generate non-Secure Core list.
 
-    def generate(self, unfiltered_server_list):
-        self.__servers = []
-        for country_item in unfiltered_server_list:
-            country_item.servers = list(filter(
-                lambda server: all(
-                    feature != FeatureEnum.SECURE_CORE
-                    for feature
-                    in server.features
-                ), country_item.servers
-            ))
-
-            country_item.servers = self._default_sort(
-                country_item
-            )
-            self.__servers.append(country_item)
+        Args:
+            country_list (list): CountryItem views that only
+                contain non-Secure Core servers
+        """
+        self.__servers = list(country_list)
+        for country_item in self.__servers:
+            self._default_sort(country_item)
+
+        self.__count_countries_per_tier()
 
         try:
             self.sort_methods_by_tier[self.__user_tier]()
         except KeyError:
-            self.__sort_for_free_users()
+            self._sort_for_free_user()
+
+        self.__search_index = Module().server_search_index_model(
+            self.__servers
+        )
 
         return self.__servers
 
-    def _default_sort(self, country_item):
-        matching_server = list(filter(
-            lambda server: server.tier == self.__user_tier,
-            country_item.servers
-        ))
-        matching_server.sort(
-            key=lambda server: server.name
+    def __count_countries_per_tier(self):
+        self.__countries_per_tier = Counter(
+            country.minimum_country_tier for country in self.__servers
         )
-        non_matching_servers = list(filter(
-            lambda server: server.tier != self.__user_tier,
-            country_item.servers
-        ))
-        non_matching_servers.sort(
-            key=lambda server: server.name
+
+    def _default_sort(self, country_item):
+        """Sort the servers of a country in place.
+
+        Servers matching the user tier come first, followed by the
+        remaining ones from the highest to the lowest tier, each group
+        being sorted by name.
+        """
+        user_tier = self.__user_tier
+        country_item.servers.sort(
+            key=lambda server: (
+                server.tier != user_tier,
+                -server.tier.value,
+                server.name
+            )
         )
-        non_matching_servers.sort(
-            key=lambda server: server.tier.value, reverse=True
+
+        return country_item.servers
+
+    def get_country_sort_key(self, minimum_country_tier, country_name):
+        """Get the key that orders a country in the list of the user tier.
+
+        Countries can be put in order before they are created,
+        since the key only depends on their minimum tier and name.
+
+        Args:
+            minimum_country_tier (ServerTierEnum)
+            country_name (str)
+
+        Returns:
+            tuple
+        """
+        is_upgrade_tier = self.is_upgrade_tier_by_user_tier.get(
+            self.__user_tier,
+            self.is_upgrade_tier_by_user_tier[ServerTierEnum.FREE]
         )
-        matching_server.extend(
-            non_matching_servers
+        return (
+            is_upgrade_tier(minimum_country_tier),
+            get_collation_key(country_name)
         )
 
-        return matching_server
-
     def _sort_for_free_user(self):
-        free_countries = list(filter(
-            lambda country: country.minimum_country_tier == ServerTierEnum.FREE,
-            self.__servers
-        ))
-        upgrade_countries = list(filter(
-            lambda country: country.minimum_country_tier != ServerTierEnum.FREE,
-            self.__servers
-        ))
-        free_countries.sort(key=lambda country: country.country_name)
-        upgrade_countries.sort(key=lambda country: country.country_name)
-        free_countries.extend(upgrade_countries)
-        self.__servers = free_countries
+        self.__sort_countries(
+            self.is_upgrade_tier_by_user_tier[ServerTierEnum.FREE]
+        )
 
     def _sort_for_basic_user(self):
-        free_and_basic_countries = list(filter(
-            lambda country: country.minimum_country_tier.value <= ServerTierEnum.BASIC.value,
-            self.__servers
-        ))
-        upgrade_countries = list(filter(
-            lambda country: country.minimum_country_tier.value > ServerTierEnum.BASIC.value,
-            self.__servers
-        ))
-        free_and_basic_countries.sort(key=lambda country: country.country_name)
-        upgrade_countries.sort(key=lambda country: country.country_name)
-        free_and_basic_countries.extend(upgrade_countries)
-        self.__servers = free_and_basic_countries
+        self.__sort_countries(
+            self.is_upgrade_tier_by_user_tier[ServerTierEnum.BASIC]
+        )
 
     def _sort_for_plus_user(self):
-        self.__servers.sort(
-            key=lambda country: country.country_name
+        self.__sort_countries(
+            self.is_upgrade_tier_by_user_tier[ServerTierEnum.PLUS_VISIONARY]
         )
 
     def _sort_for_internal_user(self):
-        internal_servers = list(filter(
-            lambda country: country.minimum_country_tier == ServerTierEnum.PM,
-            self.__servers
-        ))
-        other_servers = list(filter(
-            lambda country: country.minimum_country_tier != ServerTierEnum.PM,
-            self.__servers
-        ))
-        internal_servers.sort(key=lambda country: country.country_name)
-        other_servers.sort(key=lambda country: country.country_name)
-        internal_servers.extend(other_servers)
-        self.__servers = internal_servers
+        self.__sort_countries(
+            self.is_upgrade_tier_by_user_tier[ServerTierEnum.PM]
+        )
+
+    def __sort_countries(self, is_upgrade_tier):
+        """Sort countries with a single composite key.
+
+        Args:
+            is_upgrade_tier (callable): receives the minimum tier of a
+                country and returns True if it should be listed after
+                the ones available to the user
+        """
+        self.__servers.sort(
+            key=lambda country: (
+                is_upgrade_tier(country.minimum_country_tier),
+                get_collation_key(country.country_name)
+            )
+        )
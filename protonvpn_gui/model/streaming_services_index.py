@@ -0,0 +1,68 @@
+from dataclasses import dataclass
+
+from .lazy_index import LazyIndex
+
+
+@dataclass(frozen=True)
+class StreamingService:
+    """Streaming service available in a country.
+
+    icon_path is None if the service has to be displayed by its name.
+    """
+    name: str
+    icon_path: str = None
+
+
+class StreamingServicesIndex(LazyIndex):
+    """StreamingServicesIndex class.
+
+    Streaming services by entry country code, read from the streaming
+    services of a session so that server rows only have to hold a
+    country code. Services are sorted by name and their icons are
+    resolved, thus displaying them does not have to go through the
+    session again.
+
+    Methods:
+        get_services(entry_country_code)
+            get the streaming services of a country
+    """
+    def __init__(self, session):
+        super().__init__()
+        self.__session = session
+
+    def get_services(self, entry_country_code):
+        """Get the streaming services of a country.
+
+        Args:
+            entry_country_code (str)
+
+        Returns:
+            tuple|None: StreamingService sorted by name, or None if
+                the country does not support streaming
+        """
+        return self._get_index().get(entry_country_code)
+
+    def _build(self):
+        streaming_icons = self.__session.streaming_icons
+        display_logos = self.__session.clientconfig.features.streaming_logos
+        services_by_country_code = {}
+        for country_code, services in self.__session.streaming.items():
+            services_by_country_code[country_code] = tuple(
+                StreamingService(
+                    name=service["Name"],
+                    icon_path=self.__get_icon_path(
+                        service, streaming_icons, display_logos
+                    )
+                )
+                for service in sorted(
+                    services, key=lambda service: service["Name"]
+                )
+            )
+
+        return services_by_country_code
+
+    def __get_icon_path(self, service, streaming_icons, display_logos):
+        if not display_logos:
+            return None
+
+        return streaming_icons.get(service.get("Icon")) or None
@@ -5,13 +5,18 @@ class Module(metaclass=Singleton):
 
     def __init__(self):
         # Model
-        self.__server_item_model = None
         self.__country_item_model = None
+        self.__server_table_model = None
+        self.__server_type_model = None
+        self.__server_score_index_model = None
+        self.__server_search_index_model = None
+        self.__streaming_services_index_model = None
 
         self.__non_secure_core_servers_model = None
         self.__secure_core_servers_model = None
 
         self.__server_list_model = None
+        self.__server_list_cache_model = None
 
         # ViewModel
         self.__login_view_model = None
@@ -22,18 +27,6 @@ class Module(metaclass=Singleton):
         # Utils
         self.__utils = None
 
-    @property
-    def server_item_model(self):
-        """Return server item model"""
-        if self.__server_item_model is None:
-            from .model import ServerItemFactory
-            self.__server_item_model = ServerItemFactory.factory()
-        return self.__server_item_model
-
-    @server_item_model.setter
-    def server_item_model(self, newvalue):
-        self.__server_item_model = newvalue
-
     @property
     def country_item_model(self):
         """Return country item model"""
@@ -46,6 +39,66 @@ class Module(metaclass=Singleton):
     def country_item_model(self, newvalue):
         self.__country_item_model = newvalue
 
+    @property
+    def server_table_model(self):
+        """Return server table model"""
+        if self.__server_table_model is None:
+            from .model import ServerTable
+            self.__server_table_model = ServerTable
+        return self.__server_table_model
+
+    @server_table_model.setter
+    def server_table_model(self, newvalue):
+        self.__server_table_model = newvalue
+
+    @property
+    def server_score_index_model(self):
+        """Return server score index model"""
+        if self.__server_score_index_model is None:
+            from .model import ServerScoreIndex
+            self.__server_score_index_model = ServerScoreIndex
+        return self.__server_score_index_model
+
+    @server_score_index_model.setter
+    def server_score_index_model(self, newvalue):
+        self.__server_score_index_model = newvalue
+
+    @property
+    def server_search_index_model(self):
+        """Return server search index model"""
+        if self.__server_search_index_model is None:
+            from .model import ServerSearchIndex
+            self.__server_search_index_model = ServerSearchIndex
+        return self.__server_search_index_model
+
+    @server_search_index_model.setter
+    def server_search_index_model(self, newvalue):
+        self.__server_search_index_model = newvalue
+
+    @property
+    def streaming_services_index_model(self):
+        """Return streaming services index model"""
+        if self.__streaming_services_index_model is None:
+            from .model import StreamingServicesIndex
+            self.__streaming_services_index_model = StreamingServicesIndex
+        return self.__streaming_services_index_model
+
+    @streaming_services_index_model.setter
+    def streaming_services_index_model(self, newvalue):
+        self.__streaming_services_index_model = newvalue
+
+    @property
+    def server_type_model(self):
+        """Return server type model"""
+        if self.__server_type_model is None:
+            from .model import ServerType
+            self.__server_type_model = ServerType
+        return self.__server_type_model
+
+    @server_type_model.setter
+    def server_type_model(self, newvalue):
+        self.__server_type_model = newvalue
+
     @property
     def non_secure_core_servers_model(self):
         """Return non-secure-core servers model"""
@@ -82,6 +135,18 @@ class Module(metaclass=Singleton):
     def server_list_model(self, newvalue):
         self.__server_list_model = newvalue
 
+    @property
+    def server_list_cache_model(self):
+        """Return server list cache model"""
+        if self.__server_list_cache_model is None:
+            from .model import ServerListCache
+            self.__server_list_cache_model = ServerListCache()
+        return self.__server_list_cache_model
+
+    @server_list_cache_model.setter
+    def server_list_cache_model(self, newvalue):
+        self.__server_list_cache_model = newvalue
+
     @property
     def login_view_model(self):
         """Return login view model"""
@@ -22,21 +22,21 @@ class AbstractButtonFactory(WidgetFactory):
 
     @classmethod
     def button(cls, widget):
-        subclasses = cls._get_subclasses_with("concrete_factory")
-        for subclass in subclasses:
-            if "buttonfactory" == subclass.__name__.lower():
-                return subclass.factory(widget)
+        try:
+            subclass = cls._get_subclass_by_name("buttonfactory")
+        except KeyError:
+            raise NotImplementedError("Button not implemented")
 
-        raise NotImplementedError("Button not implemented")
+        return subclass.factory(widget)
 
     @classmethod
     def link(cls, widget):
-        subclasses = cls._get_subclasses_with("concrete_factory")
-        for subclass in subclasses:
-            if "linkbuttonfactory" == subclass.__name__.lower():
-                return subclass.factory(widget)
+        try:
+            subclass = cls._get_subclass_by_name("linkbuttonfactory")
+        except KeyError:
+            raise NotImplementedError("Link button not implemented")
 
-        raise NotImplementedError("Link button not implemented")
+        return subclass.factory(widget)
 
     @property
     @abstractmethod
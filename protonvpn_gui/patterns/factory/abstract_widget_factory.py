@@ -7,62 +7,63 @@ class WidgetFactory(SubclassesMixin, metaclass=ABCMeta):
 
     @classmethod
     def button(cls, widget):
-        subclasses = cls._get_subclasses_with("abstract_buton_factory")
-        for subclass in subclasses:
-            if "abstractbuttonfactory" == subclass.__name__.lower():
-                return subclass.factory(widget)
+        # Not a concrete factory, thus it can not be looked up by name
+        from .abstract_button_factory import AbstractButtonFactory
+        return AbstractButtonFactory.factory(widget)
 
     @classmethod
     def switch(cls, widget):
-        subclasses = cls._get_subclasses_with("concrete_factory")
-        for subclass in subclasses:
-            if "switchfactory" == subclass.__name__.lower():
-                return subclass.factory(widget)
+        try:
+            subclass = cls._get_subclass_by_name("switchfactory")
+        except KeyError:
+            return None
+
+        return subclass.factory(widget)
 
     @classmethod
     def grid(cls, widget):
-        subclasses = cls._get_subclasses_with("concrete_factory")
-        for subclass in subclasses:
-            if "gridfactory" == subclass.__name__.lower():
-                return subclass.factory(widget)
+        try:
+            subclass = cls._get_subclass_by_name("gridfactory")
+        except KeyError:
+            raise NotImplementedError("Grid not implemented")
 
-        raise NotImplementedError("Grid not implemented")
+        return subclass.factory(widget)
 
     @classmethod
     def revealer(cls, widget):
-        subclasses = cls._get_subclasses_with("concrete_factory")
-        for subclass in subclasses:
-            if "revealerfactory" == subclass.__name__.lower():
-                return subclass.factory(widget)
+        try:
+            subclass = cls._get_subclass_by_name("revealerfactory")
+        except KeyError:
+            raise NotImplementedError("Revealer not implemented")
 
-        raise NotImplementedError("Revealer not implemented")
+        return subclass.factory(widget)
 
     @classmethod
     def image(cls, widget, extra_arg=None):
-        subclasses = cls._get_subclasses_with("concrete_factory")
-        for subclass in subclasses:
-            if "imagefactory" == subclass.__name__.lower():
-                return subclass.factory(widget, extra_arg)
+        try:
+            subclass = cls._get_subclass_by_name("imagefactory")
+        except KeyError:
+            raise NotImplementedError("Revealer not implemented")
 
-        raise NotImplementedError("Revealer not implemented")
+        return subclass.factory(widget, extra_arg)
 
     @classmethod
     def label(cls, widget, label_text=None):
-        subclasses = cls._get_subclasses_with("concrete_factory")
-        for subclass in subclasses:
-            if "labelfactory" == subclass.__name__.lower():
-                return subclass.factory(widget, label_text)
+        try:
+            subclass = cls._get_subclass_by_name("labelfactory")
+        except KeyError:
+            raise NotImplementedError("Revealer not implemented")
 
-        raise NotImplementedError("Revealer not implemented")
+        return subclass.factory(widget, label_text)
 
     @classmethod
     def textview(cls, widget, text=""):
-        subclasses = cls._get_subclasses_with("concrete_factory")
-        for subclass in subclasses:
-            if "textviewfactory" == subclass.__name__.lower():
-                return subclass.factory(widget, text)
+        try:
+            subclass = cls._get_subclass_by_name("textviewfactory")
+        except KeyError:
+            raise NotImplementedError("Revealer not implemented")
 
-        raise NotImplementedError("Revealer not implemented")
+        return subclass.factory(widget, text)
 
     @abstractclassmethod
     def factory():
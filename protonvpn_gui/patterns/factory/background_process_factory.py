@@ -1,4 +1,5 @@
 import threading
+from functools import lru_cache
 import gi
 
 gi.require_version('Gtk', '3.0')
@@ -10,17 +11,23 @@ import subprocess
 from protonvpn_nm_lib.core.subprocess_wrapper import subprocess as _subprocess
 
 
+@lru_cache(maxsize=None)
+def get_gio_version():
+    """Get the version of gio, which does not change while running."""
+    try:
+        _version = _subprocess.run(["gio", "--version"], stdout=subprocess.PIPE, stderr=subprocess.PIPE).stdout.decode('utf-8')
+    except ValueError:
+        _version = subprocess.run(["gio", "--version"], stdout=subprocess.PIPE, stderr=subprocess.PIPE).stdout.decode('utf-8')
+
+    return str(_version).strip("\n")
+
+
 class BackgroundProcess(SubclassesMixin):
     """Abstract Widget Factory class."""
 
     @classmethod
     def factory(cls, threading_backend=None):
-        try:
-            _version = _subprocess.run(["gio", "--version"], stdout=subprocess.PIPE, stderr=subprocess.PIPE).stdout.decode('utf-8')
-        except ValueError:
-            _version = subprocess.run(["gio", "--version"], stdout=subprocess.PIPE, stderr=subprocess.PIPE).stdout.decode('utf-8')
-
-        _version = str(_version).strip("\n")
+        _version = get_gio_version()
         subclasses_dict = cls._get_subclasses_dict("threading_backend")
 
         # run_in_thread is supported since 2.36 (https://docs.gtk.org/gio/callback.TaskThreadFunc.html),
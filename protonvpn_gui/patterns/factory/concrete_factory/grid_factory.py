@@ -250,6 +250,15 @@ class GridFactory(WidgetFactory):
             attach_position, width, height
         )
 
+    def move_to_row(self, widget, row_number):
+        """Move an attached widget to another row.
+
+        Args:
+            widget (Gtk.Widget)
+            row_number (int)
+        """
+        self.__widget.child_set_property(widget, "top-attach", row_number)
+
     def remove_row(self, row_number):
         """Remove row from grid based on row_number.
 
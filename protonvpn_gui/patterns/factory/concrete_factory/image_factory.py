@@ -12,6 +12,7 @@ gi.require_version('Gtk', '3.0')
 from gi.repository import GdkPixbuf, Gtk
 
 from ..abstract_widget_factory import WidgetFactory
+from ..pixbuf_cache import PixbufCache
 SMALL_LOGO_SIZE = 50
 
 
@@ -164,100 +165,82 @@ class ImageFactory(WidgetFactory):
         self.__widget.set_from_pixbuf(pixbuf_widget)
 
     def create_pixbuf_custom_path(
-        self, path, width=None, height=None, preserve_aspect_ratio=True
+        self, path, width=None, height=None, preserve_aspect_ratio=True,
+        rotation=GdkPixbuf.PixbufRotation.NONE
     ):
         """Gets the icon pixbuff for the specified filename.
 
         If width and/or height are not provided, then the icon
         is set with original values. Else, the icon is resized.
 
+        Pixbufs are shared through PixbufCache, thus
+        they must not be modified in place.
+
         Args:
             path (string):
             width (int|float): optional
             height (int|float): optional
+            rotation (GdkPixbuf.PixbufRotation): optional
 
         Returns:
             GdkPixbuf instance with loaded image
         """
-        if width and height:
-            return GdkPixbuf.Pixbuf.new_from_file_at_scale(
-                filename=path,
-                width=width,
-                height=height,
-                preserve_aspect_ratio=preserve_aspect_ratio
-            )
-
-        return GdkPixbuf.Pixbuf.new_from_file(
-            filename=path
+        return PixbufCache().get(
+            path,
+            width=width,
+            height=height,
+            preserve_aspect_ratio=preserve_aspect_ratio,
+            rotation=rotation
         )
 
     def create_icon_pixbuf_from_name(
-        self, icon_name, width=None, height=None, preserve_aspect_ratio=True
+        self, icon_name, width=None, height=None, preserve_aspect_ratio=True,
+        rotation=GdkPixbuf.PixbufRotation.NONE
     ):
         """Gets the icon pixbuff for the specified filename.
 
-        If width and/or height are not provided, then the icon
-        is set with original values. Else, the icon is resized.
+        See create_pixbuf_custom_path().
 
         Args:
             icon_name (string):
             width (int|float): optional
             height (int|float): optional
+            rotation (GdkPixbuf.PixbufRotation): optional
 
         Returns:
             GdkPixbuf instance with loaded image
         """
-        if width and height:
-            return GdkPixbuf.Pixbuf.new_from_file_at_scale(
-                filename=os.path.join(
-                    ICON_DIR_PATH,
-                    icon_name,
-
-                ),
-                width=width,
-                height=height,
-                preserve_aspect_ratio=preserve_aspect_ratio
-            )
-
-        return GdkPixbuf.Pixbuf.new_from_file(
-            filename=os.path.join(
-                ICON_DIR_PATH,
-                icon_name
-            )
+        return self.create_pixbuf_custom_path(
+            os.path.join(ICON_DIR_PATH, icon_name),
+            width=width,
+            height=height,
+            preserve_aspect_ratio=preserve_aspect_ratio,
+            rotation=rotation
         )
 
     def create_image_pixbuf_from_name(
-        self, image_name, width=None, height=None, preserve_aspect_ratio=True
+        self, image_name, width=None, height=None, preserve_aspect_ratio=True,
+        rotation=GdkPixbuf.PixbufRotation.NONE
     ):
-        """Gets the icon pixbuff for the specified filename.
+        """Gets the image pixbuff for the specified filename.
 
-        If width and/or height are not provided, then the image
-        is set with original values. Else, the image is resized.
+        See create_pixbuf_custom_path().
 
         Args:
-            icon_name (string):
+            image_name (string):
             width (int|float): optional
             height (int|float): optional
+            rotation (GdkPixbuf.PixbufRotation): optional
 
         Returns:
             GdkPixbuf instance with loaded image
         """
-        if width and height:
-            return GdkPixbuf.Pixbuf.new_from_file_at_scale(
-                filename=os.path.join(
-                    IMG_DIR_PATH,
-                    image_name
-                ),
-                width=width,
-                height=height,
-                preserve_aspect_ratio=preserve_aspect_ratio
-            )
-
-        return GdkPixbuf.Pixbuf.new_from_file(
-            filename=os.path.join(
-                IMG_DIR_PATH,
-                image_name
-            )
+        return self.create_pixbuf_custom_path(
+            os.path.join(IMG_DIR_PATH, image_name),
+            width=width,
+            height=height,
+            preserve_aspect_ratio=preserve_aspect_ratio,
+            rotation=rotation
         )
 
 
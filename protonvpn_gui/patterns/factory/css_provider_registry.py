@@ -0,0 +1,70 @@
+import os
+
+import gi
+
+gi.require_version('Gtk', '3.0')
+
+from gi.repository import Gdk, Gtk
+
+from ...constants import CSS_DIR_PATH
+from ...logger import logger
+from ...utils import Singleton
+
+
+class CssProviderRegistry(metaclass=Singleton):
+    """CssProviderRegistry class.
+
+    Process-wide registry of the stylesheets added to the screen, so that
+    windows and popovers that are created many times (i.e the server
+    features window) do not add another provider to the screen each
+    time, which would slow down every style recalculation.
+
+    Each stylesheet is parsed once, on its first use, and its provider
+    is added once per screen.
+
+    Methods:
+        attach(css_filename, screen)
+            add the provider of a stylesheet to a screen, if not yet added
+    """
+    def __init__(self):
+        self.__providers = {}
+        self.__attached_providers = set()
+
+    @property
+    def attached_providers_count(self):
+        return len(self.__attached_providers)
+
+    def attach(
+        self, css_filename, screen=None,
+        priority=Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
+    ):
+        """Add the provider of a stylesheet to a screen.
+
+        Args:
+            css_filename (string): filename within CSS_DIR_PATH
+            screen (Gdk.Screen): optional, default screen if not provided
+            priority (int)
+
+        Returns:
+            Gtk.CssProvider: shared provider of the stylesheet
+        """
+        provider = self.__providers.get(css_filename)
+        if provider is None:
+            provider = Gtk.CssProvider()
+            provider.load_from_path(os.path.join(CSS_DIR_PATH, css_filename))
+            self.__providers[css_filename] = provider
+
+        if screen is None:
+            screen = Gdk.Screen.get_default()
+
+        key = (css_filename, screen)
+        if key not in self.__attached_providers:
+            Gtk.StyleContext.add_provider_for_screen(
+                screen, provider, priority
+            )
+            self.__attached_providers.add(key)
+            logger.info("Attached {} ({} CSS providers attached)".format(
+                css_filename, self.attached_providers_count
+            ))
+
+        return provider
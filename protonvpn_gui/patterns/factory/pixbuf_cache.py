@@ -0,0 +1,138 @@
+from collections import OrderedDict
+from threading import Lock
+
+import gi
+
+gi.require_version('Gtk', '3.0')
+
+from gi.repository import GdkPixbuf
+
+from ...constants import PIXBUF_CACHE_MAX_BYTES
+from ...utils import Singleton
+
+
+class PixbufCache(metaclass=Singleton):
+    """PixbufCache class.
+
+    Process-wide cache of decoded images, so that the same flag or icon
+    is only decoded (or rasterized, for SVGs) once, no matter how many
+    widgets display it.
+
+    Pixbufs are keyed by (path, width, height, preserve_aspect_ratio,
+    rotation, scale) and are shared between widgets, thus they must not
+    be modified in place. Least recently used pixbufs are evicted once
+    the cached pixbufs take more than max_bytes.
+
+    Methods:
+        get(path, width, height, preserve_aspect_ratio, rotation, scale)
+            get a pixbuf, decoding it on a miss
+        clear()
+            drop all cached pixbufs
+    """
+    def __init__(self, max_bytes=PIXBUF_CACHE_MAX_BYTES):
+        self.__max_bytes = max_bytes
+        self.__pixbufs = OrderedDict()
+        self.__size_in_bytes = 0
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+        self.__lock = Lock()
+
+    @property
+    def hits(self):
+        return self.__hits
+
+    @property
+    def misses(self):
+        return self.__misses
+
+    @property
+    def evictions(self):
+        return self.__evictions
+
+    @property
+    def size_in_bytes(self):
+        return self.__size_in_bytes
+
+    def get(
+        self, path, width=None, height=None, preserve_aspect_ratio=True,
+        rotation=GdkPixbuf.PixbufRotation.NONE, scale=1
+    ):
+        """Get the pixbuf of an image file.
+
+        If width and/or height are not provided, then the image
+        is loaded with its original size. Else, the image is resized.
+
+        Args:
+            path (string): image filepath
+            width (int|float): optional
+            height (int|float): optional
+            preserve_aspect_ratio (bool)
+            rotation (GdkPixbuf.PixbufRotation)
+            scale (int): the image is loaded at width * scale, height *
+                scale, i.e to be painted on a HiDPI cairo surface
+
+        Returns:
+            GdkPixbuf.Pixbuf: shared, must not be modified
+        """
+        key = (path, width, height, preserve_aspect_ratio, rotation, scale)
+        with self.__lock:
+            pixbuf = self.__pixbufs.get(key)
+            if pixbuf is not None:
+                self.__pixbufs.move_to_end(key)
+                self.__hits += 1
+                return pixbuf
+
+            self.__misses += 1
+
+        # Decoding happens outside of the lock, so that loading
+        # an image does not block other threads reading the cache.
+        pixbuf = self.__load(
+            path, width, height, preserve_aspect_ratio, rotation, scale
+        )
+        with self.__lock:
+            if key not in self.__pixbufs:
+                self.__pixbufs[key] = pixbuf
+                self.__size_in_bytes += self.__get_size_in_bytes(pixbuf)
+                self.__evict()
+
+        return pixbuf
+
+    def clear(self):
+        with self.__lock:
+            self.__pixbufs.clear()
+            self.__size_in_bytes = 0
+
+    def __load(
+        self, path, width, height, preserve_aspect_ratio, rotation, scale
+    ):
+        if width and height:
+            pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(
+                filename=path,
+                width=width * scale,
+                height=height * scale,
+                preserve_aspect_ratio=preserve_aspect_ratio
+            )
+        else:
+            pixbuf = GdkPixbuf.Pixbuf.new_from_file(
+                filename=path
+            )
+
+        if rotation != GdkPixbuf.PixbufRotation.NONE:
+            pixbuf = pixbuf.rotate_simple(rotation)
+
+        return pixbuf
+
+    def __evict(self):
+        # The most recently added pixbuf is always kept,
+        # even if it is larger than the whole budget.
+        while (
+            self.__size_in_bytes > self.__max_bytes
+            and len(self.__pixbufs) > 1
+        ):
+            _, pixbuf = self.__pixbufs.popitem(last=False)
+            self.__size_in_bytes -= self.__get_size_in_bytes(pixbuf)
+            self.__evictions += 1
+
+    def __get_size_in_bytes(self, pixbuf):
+        return pixbuf.get_rowstride() * pixbuf.get_height()
@@ -10,14 +10,53 @@ class Singleton(type):
 
 
 class SubclassesMixin:
+    """Gives classes access to their subclasses.
+
+    Subclasses are registered on all their ancestors once they are
+    defined (see __init_subclass__), and lookups by attribute are cached,
+    so that factories find their products with a single dict access
+    instead of walking the subclass tree on every call.
+
+    Concrete factories, the classes that declare a concrete_factory
+    attribute, are also registered by their case insensitive class name.
+    Their products inherit the attribute but are not registered, as
+    products of different factories share names (i.e Dummy).
+
+    Raises:
+        TypeError: when a concrete factory is defined with the name
+            of another concrete factory of the same ancestor
+    """
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._subclasses = []
+        cls._subclasses_dicts = {}
+        cls._concrete_factories_by_name = {}
+        bases = [
+            base for base in cls.__mro__[1:]
+            if "_subclasses" in base.__dict__
+        ]
+
+        name = cls.__name__.lower()
+        is_concrete_factory = "concrete_factory" in cls.__dict__
+        if is_concrete_factory:
+            for base in bases:
+                if name in base._concrete_factories_by_name:
+                    raise TypeError(
+                        "{} is already a concrete factory of {}".format(
+                            cls.__name__, base.__name__
+                        )
+                    )
+
+        for base in bases:
+            base._subclasses.append(cls)
+            # Lookups of the ancestors have to include the new class
+            base._subclasses_dicts = {}
+            if is_concrete_factory:
+                base._concrete_factories_by_name[name] = cls
+
     @classmethod
     def _get_all_subclasses(cls):
-        all_subclasses = []
-        for subclass in cls.__subclasses__():
-            all_subclasses.append(subclass)
-            all_subclasses.extend(subclass._get_all_subclasses())
-
-        return all_subclasses
+        return list(cls.__dict__.get("_subclasses", []))
 
     @classmethod
     def _get_subclasses_with(cls, attribute):
@@ -25,10 +64,34 @@ class SubclassesMixin:
 
     @classmethod
     def _get_subclasses_dict(cls, attribute):
-        return dict(
+        """Get subclasses by the value of one of their attributes.
+
+        Returns:
+            dict: shared between calls, must not be modified
+        """
+        subclasses_dicts = cls.__dict__.get("_subclasses_dicts", {})
+        try:
+            return subclasses_dicts[attribute]
+        except KeyError:
+            pass
+
+        subclasses_dict = dict(
             [
                 (getattr(x, attribute), x)
                 for x in cls._get_all_subclasses()
                 if hasattr(x, attribute)
             ]
         )
+        subclasses_dicts[attribute] = subclasses_dict
+        return subclasses_dict
+
+    @classmethod
+    def _get_subclass_by_name(cls, name):
+        """Get a concrete factory by its case insensitive class name.
+
+        Raises:
+            KeyError: if there is no such concrete factory
+        """
+        return cls.__dict__.get("_concrete_factories_by_name", {})[
+            name.lower()
+        ]
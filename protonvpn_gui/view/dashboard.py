@@ -8,13 +8,20 @@ import weakref
 
 from gi.repository import Gdk, Gio, GLib, Gtk
 
-from ..constants import (CSS_DIR_PATH, KILLSWITCH_ICON_SET, NETSHIELD_ICON_SET,
-                         SECURE_CORE_ICON_SET, UI_DIR_PATH, protonvpn_logo)
+from ..constants import (KILLSWITCH_ICON_SET, NETSHIELD_ICON_SET,
+                         SECURE_CORE_ICON_SET, SERVER_SEARCH_DEBOUNCE_SECONDS,
+                         UI_DIR_PATH, protonvpn_logo)
 from ..enums import (DashboardFeaturesEnum, GLibEventSourceEnum,
                      IndicatorActionEnum)
 from ..logger import logger
 from ..module import Module
 from ..patterns.factory import WidgetFactory
+from ..patterns.factory.css_provider_registry import CssProviderRegistry
+from .. import rx
+from ..rx import operators as rx_ops
+from ..rx.scheduler import ThreadPoolScheduler
+from ..rx.scheduler.mainloop import GtkScheduler
+from ..rx.subject import Subject
 from ..view_model.dataclass.dashboard import (ConnectedToVPNInfo, ConnectError,
                                               ConnectInProgressInfo,
                                               ConnectPreparingInfo,
@@ -313,6 +320,7 @@ class DashboardView(Gtk.ApplicationWindow):
 
         # Other views
         self.server_list_view = ServerListView(weakref.proxy(self))
+        self.setup_server_search()
         self.quick_settings_popover = QuickSettingsPopoverView(
             weakref.proxy(self.dashboard_view_model)
         )
@@ -422,16 +430,7 @@ class DashboardView(Gtk.ApplicationWindow):
     def setup_css(self):
         """Setup CSS styles."""
         logger.info("Setting up css")
-        self.provider = Gtk.CssProvider()
-        self.provider.load_from_path(
-            os.path.join(CSS_DIR_PATH, "dashboard.css")
-        )
-        screen = Gdk.Screen.get_default()
-        Gtk.StyleContext.add_provider_for_screen(
-            screen,
-            self.provider,
-            Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-        )
+        self.provider = CssProviderRegistry().attach("dashboard.css")
         self.set_css_class(self.quick_connect_button, ["primary", "main-button"])
         self.set_css_class(self.main_disconnect_button, ["transparent-danger", "main-button"])
         self.set_css_class(self.cancel_connect_overlay_button, ["transparent-danger", "main-button"])
@@ -533,15 +532,40 @@ class DashboardView(Gtk.ApplicationWindow):
             self.application.indicator.dashboard_action.dispose()
         except AttributeError:
             pass
+        self.server_search_subscription.dispose()
         self.destroy()
 
+    def setup_server_search(self):
+        """Setup server search pipeline.
+
+        Search input is debounced, so that nothing is searched while
+        the user is typing. Countries are then matched in a worker thread,
+        and if the user typed again in the meantime the outdated result is
+        dropped by switch_latest(). Only the latest result is applied to
+        the server list, on the main loop.
+        """
+        self.server_search_subject = Subject()
+        search_scheduler = ThreadPoolScheduler(1)
+        self.server_search_subscription = self.server_search_subject.pipe(
+            rx_ops.debounce(SERVER_SEARCH_DEBOUNCE_SECONDS),
+            rx_ops.map(lambda user_input: rx.from_callable(
+                lambda: self.server_list_view.search(user_input),
+                scheduler=search_scheduler
+            )),
+            rx_ops.switch_latest(),
+            rx_ops.observe_on(GtkScheduler(GLib)),
+        ).subscribe(
+            on_next=self.server_list_view.apply_search_result,
+            on_error=lambda e: logger.exception(e)
+        )
+
     def filter_server_list(self, server_search_entry):
         """Filter server list based on user input.
 
         Args:
             server_search_entry: Gtk.SearchEntry
         """
-        self.server_list_view.filter_server_list(
+        self.server_search_subject.on_next(
             server_search_entry.get_text()
         )
 
@@ -10,9 +10,10 @@ from gi.repository import WebKit2 as Webkit
 from proton.constants import VERSION as api_version
 from protonvpn_nm_lib.constants import APP_VERSION as lib_version
 
-from ..constants import APP_VERSION, CSS_DIR_PATH, UI_DIR_PATH, protonvpn_logo
+from ..constants import APP_VERSION, UI_DIR_PATH, protonvpn_logo
 from ..logger import logger
 from ..patterns.factory import WidgetFactory
+from ..patterns.factory.css_provider_registry import CssProviderRegistry
 
 
 @Gtk.Template(filename=os.path.join(UI_DIR_PATH, "dialog.ui"))
@@ -51,16 +52,7 @@ class DialogView(Gtk.ApplicationWindow):
         self.headerbar_sign_icon.set_from_pixbuf(protonvpn_headerbar_pixbuf)
         self.set_icon(window_icon)
 
-        self.provider = Gtk.CssProvider()
-        self.provider.load_from_path(
-            os.path.join(CSS_DIR_PATH, "dialog.css")
-        )
-        screen = Gdk.Screen.get_default()
-        Gtk.StyleContext.add_provider_for_screen(
-            screen,
-            self.provider,
-            Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-        )
+        self.provider = CssProviderRegistry().attach("dialog.css")
 
     def display_dialog(self):
         """Displays the dialog to the user."""
@@ -8,10 +8,11 @@ gi.require_version('Gtk', '3.0')
 
 from gi.repository import Gdk, Gio, GLib, Gtk
 
-from ..constants import (CSS_DIR_PATH, ICON_DIR_PATH, IMG_DIR_PATH,
-                         UI_DIR_PATH, protonvpn_logo)
+from ..constants import (ICON_DIR_PATH, IMG_DIR_PATH, UI_DIR_PATH,
+                         protonvpn_logo)
 from ..enums import IndicatorActionEnum
 from ..patterns.factory import WidgetFactory
+from ..patterns.factory.css_provider_registry import CssProviderRegistry
 from .dialog import LoginKillSwitchDialog, TroubleshootDialog, WebView
 from ..module import Module
 
@@ -348,14 +349,7 @@ class LoginView(Gtk.ApplicationWindow):
         )
 
     def setup_css(self):
-        provider = Gtk.CssProvider()
-        provider.load_from_path(os.path.join(CSS_DIR_PATH, "login.css"))
-        screen = Gdk.Screen.get_default()
-        Gtk.StyleContext.add_provider_for_screen(
-            screen,
-            provider,
-            Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-        )
+        CssProviderRegistry().attach("login.css")
 
     def set_css_class(self, gtk_object, add_css_class=None, remove_css_class=None):
         gtk_object_context = gtk_object.get_style_context()
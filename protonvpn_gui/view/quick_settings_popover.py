@@ -9,11 +9,12 @@ from protonvpn_nm_lib.enums import (KillswitchStatusEnum,
                                     NetshieldTranslationEnum,
                                     SecureCoreStatusEnum, ServerTierEnum)
 
-from ..constants import (CSS_DIR_PATH, KILLSWITCH_ICON_SET, NETSHIELD_ICON_SET,
+from ..constants import (KILLSWITCH_ICON_SET, NETSHIELD_ICON_SET,
                          SECURE_CORE_ICON_SET, UI_DIR_PATH)
 from ..enums import (DashboardKillSwitchIconEnum, DashboardNetshieldIconEnum,
                      DashboardSecureCoreIconEnum)
 from ..patterns.factory.abstract_widget_factory import WidgetFactory
+from ..patterns.factory.css_provider_registry import CssProviderRegistry
 
 
 @Gtk.Template(filename=os.path.join(UI_DIR_PATH, "quick_settings_popover.ui"))
@@ -39,15 +40,8 @@ class QuickSettingsPopoverView(Gtk.Popover):
         )
         self.connect("closed", self.on_closed_popover)
 
-        self.provider = Gtk.CssProvider()
-        self.provider.load_from_path(
-            os.path.join(CSS_DIR_PATH, "quick_settings_popover.css")
-        )
-        screen = Gdk.Screen.get_default()
-        Gtk.StyleContext.add_provider_for_screen(
-            screen,
-            self.provider,
-            Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
+        self.provider = CssProviderRegistry().attach(
+            "quick_settings_popover.css"
         )
 
     def on_closed_popover(self, gtk_popver):
@@ -1,13 +1,14 @@
 import os
-from protonvpn_nm_lib.api import protonvpn
 import gi
 
 gi.require_version('Gtk', '3.0')
 
-from gi.repository import Gdk, Gtk
+from gi.repository import Gtk
 
-from ..constants import CSS_DIR_PATH, UI_DIR_PATH
+from ..constants import UI_DIR_PATH
+from ..module import Module
 from ..patterns.factory.abstract_widget_factory import WidgetFactory
+from ..patterns.factory.css_provider_registry import CssProviderRegistry
 
 
 @Gtk.Template(filename=os.path.join(UI_DIR_PATH, "server_features.ui"))
@@ -20,16 +21,7 @@ class ServerFeaturesView(Gtk.ApplicationWindow):
 
     def __init__(self, application):
         super().__init__(application=application)
-        _provider = Gtk.CssProvider()
-        _provider.load_from_path(
-            os.path.join(CSS_DIR_PATH, "server_features.css")
-        )
-        screen = Gdk.Screen.get_default()
-        Gtk.StyleContext.add_provider_for_screen(
-            screen,
-            _provider,
-            Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-        )
+        CssProviderRegistry().attach("server_features.css")
         self.set_position(Gtk.PositionType.BOTTOM)
 
     def display(self):
@@ -256,14 +248,14 @@ class CountryStreamingWidget:
     generate_widget() whenever needed.
     Otherwise, if there is no parent class/widget, it behaves as an independent widget
     that displays streaming information for a specific country.
+
+    Streaming services are read from the index of the current server
+    list (see StreamingServicesIndex) when the widget is generated.
     """
     def __init__(self, application, country_name, entry_country_code, parent_widget=False):
         self.application = application
         self.country_name = country_name
         self.entry_country_code = entry_country_code
-        self.__streaming_services = protonvpn.get_session().streaming
-        self.__streaming_icons = protonvpn.get_session().streaming_icons
-        self.__client_config = protonvpn.get_session().clientconfig
 
         if parent_widget:
             self.__view = parent_widget
@@ -329,24 +321,24 @@ class CountryStreamingWidget:
             WidgetFactory.grid or None
         """
 
-        try:
-            services = self.__streaming_services[self.entry_country_code]
-        except KeyError:
+        services = Module().server_list_model.get_streaming_services(
+            self.entry_country_code
+        )
+        if services is None:
             return
 
-        services.sort(key=lambda service: service["Name"])
         services_grid = WidgetFactory.grid("streaming_icons_container")
         x_pos = 0
         y_pos = 0
         max_items_per_row = 3
         for service in services:
-            if self.__client_config.features.streaming_logos and self.__streaming_icons[service.get("Icon")]: # noqa
+            if service.icon_path:
                 service_widget = WidgetFactory.image(
-                    "streaming_service_icon", self.__streaming_icons[service.get("Icon")]
+                    "streaming_service_icon", service.icon_path
                 )
             else:
                 service_widget = WidgetFactory.label(
-                    "streaming_title", service["Name"]
+                    "streaming_title", service.name
                 )
 
             services_grid.attach(service_widget.widget, x_pos, y_pos)
@@ -1,10 +1,13 @@
 
 from gi.repository import GLib
-from ..view_model.dataclass.dashboard import ServerListData, SwitchServerList
+from ..view_model.dataclass.dashboard import (ServerListCountry,
+                                              ServerListData, ServerLoadUpdate,
+                                              SwitchServerList)
+from .server_list_components.incremental_list_builder import IncrementalListBuilder
 from .server_list_components.non_secure_core_server_list_view import NoneSecureCoreListView
 from .server_list_components.secure_core_server_list_view import SecureCoreListView
+from ..constants import VIRTUAL_COUNTRY_ROW_HEIGHT
 from ..patterns.factory import BackgroundProcess
-import concurrent.futures
 
 
 class ServerListView():
@@ -21,42 +24,70 @@ class ServerListView():
         self.__display_secure_core_list = False
         self.__secure_core_view = SecureCoreListView()
         self.__none_secure_core_view = NoneSecureCoreListView()
+        self.__list_builder = None
         self.counter = 0
+        self.dv.server_list_scrolled_window.get_vadjustment().connect(
+            "value-changed", self.on_scroll_server_list
+        )
 
     def render_view_state(self, state):
+        if isinstance(state, ServerListCountry):
+            self.__none_secure_core_view.append_country(
+                self.dv, state.country_item
+            )
+            self.__attach_server_list()
         if isinstance(state, ServerListData):
             self.__display_secure_core_list = True if state.display_secure_core else False
+            # Dashboard resources are loaded once the fresh list
+            # replaces the cached one.
             self._populate_async(
                 state.server_list,
-                self.dashboard_view_model.on_startup_load_dashboard_resources_async
+                None if state.from_cache
+                else self.dashboard_view_model.on_startup_load_dashboard_resources_async
             )
+        if isinstance(state, ServerLoadUpdate):
+            self.__secure_core_view.update_server_loads(state.changes)
+            self.__none_secure_core_view.update_server_loads(state.changes)
         if isinstance(state, SwitchServerList):
             self.__display_secure_core_list = True if state.display_secure_core else False
             self._switch_server_list_view_async()
 
     def _populate_async(self, server_list, callback):
+        """Build the list views from the main loop.
+
+        The displayed list is built first, and is attached once its first
+        screen of rows is built. Building a previous server list is
+        cancelled, as its rows would be replaced anyway.
+        """
         self.__server_list = server_list
-        process = BackgroundProcess.factory("gtask")
-        process.setup(target=self.__populate, callback=callback)
-        process.start()
+        if self.__list_builder:
+            self.__list_builder.cancel()
 
-    def __populate(self, *_):
-        _jobs = [
-            [self.__secure_core_view, self.__server_list.secure_core, self.dv],
-            [self.__none_secure_core_view, self.__server_list.none_secure_core, self.dv],
+        jobs = [
+            (self.__none_secure_core_view, server_list.none_secure_core),
+            (self.__secure_core_view, server_list.secure_core),
         ]
+        if self.__display_secure_core_list:
+            jobs.reverse()
+
+        page_size = self.dv.server_list_scrolled_window\
+            .get_vadjustment().get_page_size()
+        self.__list_builder = IncrementalListBuilder(
+            [
+                list_view.generate_incrementally(self.dv, servers)
+                for list_view, servers in jobs
+            ],
+            first_screen_rows=int(page_size / VIRTUAL_COUNTRY_ROW_HEIGHT) + 1,
+            on_first_screen=self.__attach_server_list,
+            on_finish=lambda: self.__on_finish_populate(callback)
+        )
+        self.__list_builder.start()
 
-        with concurrent.futures.ThreadPoolExecutor() as exec:
-            exec.map(self._generate_process, _jobs)
-
-        GLib.idle_add(self.__attach_server_list)
-
-    def _generate_process(self, data):
-        instance = data[0]
-        servers = data[1]
-        dashboard_view = data[2]
-
-        instance.generate(dashboard_view, servers)
+    def __on_finish_populate(self, callback):
+        # The displayed list might have been switched while building
+        self.__attach_server_list()
+        if callback:
+            callback()
 
     def _switch_server_list_view_async(self, callback=None):
         process = BackgroundProcess.factory("gtask")
@@ -67,14 +98,23 @@ class ServerListView():
         GLib.idle_add(self.__attach_server_list)
 
     def __attach_server_list(self):
+        list_view = self.__none_secure_core_view
+        if self.__display_secure_core_list:
+            list_view = self.__secure_core_view
+
+        try:
+            widget = list_view.widget
+        except AttributeError:
+            # Not generated yet, it is attached once built
+            return False
+
         existing_child = self.dv.server_list_grid.get_child_at(0, 0)
+        if existing_child is widget:
+            return False
+
         if existing_child:
             self.dv.server_list_grid.remove_row(0)
 
-        widget = self.__none_secure_core_view.widget
-        if self.__display_secure_core_list:
-            widget = self.__secure_core_view.widget
-
         try:
             self.dv.server_list_grid.attach(
                 widget, 0, 0, 1, 1
@@ -82,10 +122,34 @@ class ServerListView():
         except Exception as e:
             print(e)
 
+        list_view.attach_reused_country_rows()
         return False
 
-    def filter_server_list(self, user_input):
+    def on_scroll_server_list(self, vadjustment):
+        list_view = self.__none_secure_core_view
         if self.__display_secure_core_list:
-            self.__secure_core_view.filter_server_list(user_input)
-        else:
-            self.__none_secure_core_view.filter_server_list(user_input)
+            list_view = self.__secure_core_view
+
+        list_view.schedule_rows_in_viewport(vadjustment)
+
+    def search(self, user_input):
+        """Search the displayed server list.
+
+        Can be called outside the main loop, the result is
+        passed to apply_search_result().
+
+        Args:
+            user_input (string): what to search for
+
+        Returns:
+            tuple: (list view, user input, search matches)
+        """
+        list_view = self.__none_secure_core_view
+        if self.__display_secure_core_list:
+            list_view = self.__secure_core_view
+
+        return list_view, user_input, list_view.search(user_input)
+
+    def apply_search_result(self, search_result):
+        list_view, user_input, search_matches = search_result
+        list_view.apply_search_result(user_input, search_matches)
@@ -1,7 +1,9 @@
 import gi
 from protonvpn_nm_lib.enums import FeatureEnum, ServerStatusEnum
 
+from ...constants import VIRTUAL_COUNTRY_ROW_HEIGHT
 from ...enums import GLibEventSourceEnum
+from ...model.feature_mask import has_feature
 from ...patterns.factory import WidgetFactory
 from ..dialog import ConnectUpgradeDialog
 from .revealer import ServerListRevealer
@@ -12,27 +14,52 @@ from gi.repository import GdkPixbuf, Gtk, Gdk
 import weakref
 
 
+def get_country_row_layout(country_item):
+    """Get what the widgets of a country row depend on.
+
+    A row can be rebound to updated data of its country as long as
+    the layout of the country did not change.
+
+    Returns:
+        tuple
+    """
+    return (
+        country_item.entry_country_code,
+        country_item.status,
+        country_item.feature_mask,
+        country_item.is_virtual,
+        all(server.has_to_upgrade for server in country_item.servers),
+        tuple((server.name, server.tier) for server in country_item.servers),
+    )
+
+
 class CountryRow:
-    def __init__(self, country_item, dashboard_view, display_sc=None):
+    def __init__(
+        self, country_item, dashboard_view,
+        display_sc=None, server_row_pool=None
+    ):
         self.__num_locations = len(country_item.servers)
-        _server_list_revealer = ServerListRevealer(
+        self.__under_maintenance = country_item.status == ServerStatusEnum.UNDER_MAINTENANCE
+        self.__layout = get_country_row_layout(country_item)
+        self.__server_list_revealer = ServerListRevealer(
             dashboard_view,
             country_item,
-            display_sc
+            display_sc,
+            server_row_pool
         )
-        server_list_revealer = weakref.proxy(_server_list_revealer)
+        server_list_revealer = weakref.proxy(self.__server_list_revealer)
 
         self.row_grid = WidgetFactory.grid("country_row")
         _left_child = CountryRowLeftGrid(country_item, display_sc)
         left_child = weakref.proxy(_left_child)
 
-        _right_child = CountryRowRightGrid(
+        self.__right_child = CountryRowRightGrid(
             country_item,
-            server_list_revealer.revealer,
+            server_list_revealer,
             dashboard_view,
             display_sc
         )
-        right_child = weakref.proxy(_right_child)
+        right_child = weakref.proxy(self.__right_child)
 
         self.row_grid.attach(left_child.grid.widget)
         self.row_grid.attach_right_next_to(
@@ -53,6 +80,58 @@ class CountryRow:
     def total_of_existing_servers(self):
         return self.__num_locations
 
+    @property
+    def row_created(self):
+        return True
+
+    @property
+    def server_rows(self):
+        """Server rows created so far, by server name."""
+        return self.__server_list_revealer.server_rows
+
+    @property
+    def is_expanded(self):
+        return self.__server_list_revealer.revealer.widget.get_reveal_child()
+
+    def rebind(self, country_item):
+        """Bind the row to updated data of its country.
+
+        Args:
+            country_item (CountryItem): country with the same name
+
+        Returns:
+            bool: False if the layout of the country changed (i.e servers
+                were added or removed), in which case a new row has
+                to be created
+        """
+        if get_country_row_layout(country_item) != self.__layout:
+            return False
+
+        self.__server_list_revealer.rebind(country_item)
+        return True
+
+    def show_search_matches(self, server_names):
+        """Expand the country and only show the matching servers.
+
+        Args:
+            server_names (frozenset)
+        """
+        if self.__under_maintenance:
+            return
+
+        self.__server_list_revealer.show_servers(server_names)
+        self.__right_child.set_revealed(True)
+
+    def clear_search_matches(self):
+        """Collapse a country that was expanded by a search.
+
+        All servers are shown again the next time it is expanded.
+        """
+        if self.__under_maintenance:
+            return
+
+        self.__right_child.set_revealed(False)
+
     def create_event_box(self, country_item, right_child):
         self.event_box = Gtk.EventBox()
         self.event_box.set_visible_window(True)
@@ -70,6 +149,137 @@ class CountryRow:
         )
 
 
+class VirtualCountryRow:
+    """VirtualCountryRow class.
+
+    Stands for a CountryRow in a virtualized server list. It only takes
+    the estimated height of a country row, until create_row() is called
+    once it gets close to the viewport. Until then the country has no
+    server row. Once it is far from the viewport again, release_row()
+    drops the CountryRow, so that only the rows close to the viewport
+    are kept.
+    """
+    def __init__(
+        self, country_item, dashboard_view,
+        display_sc=None, server_row_pool=None
+    ):
+        self.__country_item = country_item
+        self.__dashboard_view = dashboard_view
+        self.__display_sc = display_sc
+        self.__server_row_pool = server_row_pool
+        self.__country_row = None
+        self.__placeholder = None
+        self.__search_matches = None
+
+        self.event_box = Gtk.EventBox()
+        self.event_box.set_visible_window(False)
+        self.event_box.props.visible = True
+        self.__add_placeholder(VIRTUAL_COUNTRY_ROW_HEIGHT)
+
+    @property
+    def row_created(self):
+        return self.__country_row is not None
+
+    @property
+    def server_rows(self):
+        """Server rows created so far, by server name."""
+        if not self.row_created:
+            return {}
+
+        return self.__country_row.server_rows
+
+    def rebind(self, country_item):
+        """Bind the row to updated data of its country.
+
+        See CountryRow.rebind().
+        """
+        if self.row_created and not self.__country_row.rebind(country_item):
+            return False
+
+        self.__country_item = country_item
+        return True
+
+    def is_within(self, top, bottom):
+        """Check if the row is displayed between two vertical positions.
+
+        Args:
+            top (float)
+            bottom (float)
+
+        Returns:
+            bool: False if the row is not displayed at all
+        """
+        if not self.event_box.get_mapped():
+            return False
+
+        allocation = self.event_box.get_allocation()
+        return allocation.y < bottom and allocation.y + allocation.height > top
+
+    def create_row(self):
+        """Replace the placeholder with the CountryRow.
+
+        The row shows the servers that matched a search before
+        it was created, see show_search_matches().
+        """
+        if self.row_created:
+            return
+
+        self.__country_row = CountryRow(
+            self.__country_item,
+            self.__dashboard_view,
+            self.__display_sc,
+            self.__server_row_pool
+        )
+        self.event_box.remove(self.__placeholder)
+        self.__placeholder = None
+        self.__server_row_pool = None
+        self.event_box.add(self.__country_row.event_box)
+        if self.__search_matches is not None:
+            self.__country_row.show_search_matches(self.__search_matches)
+            self.__search_matches = None
+
+    def release_row(self):
+        """Replace the CountryRow with a placeholder of the same height.
+
+        Expanded rows are kept, so that they are displayed
+        as the user left them when scrolling back.
+
+        Returns:
+            bool: False if the row was not released
+        """
+        if not self.row_created or self.__country_row.is_expanded:
+            return False
+
+        height = self.event_box.get_allocation().height
+        self.event_box.remove(self.__country_row.event_box)
+        self.__country_row = None
+        self.__add_placeholder(height)
+        return True
+
+    def show_search_matches(self, server_names):
+        """Expand the country and only show the matching servers.
+
+        Countries far from the viewport are only expanded
+        once their row is created, see create_row().
+        """
+        if not self.row_created:
+            self.__search_matches = server_names
+            return
+
+        self.__country_row.show_search_matches(server_names)
+
+    def clear_search_matches(self):
+        self.__search_matches = None
+        if self.row_created:
+            self.__country_row.clear_search_matches()
+
+    def __add_placeholder(self, height):
+        self.__placeholder = Gtk.Box()
+        self.__placeholder.set_size_request(-1, height)
+        self.__placeholder.props.visible = True
+        self.event_box.add(self.__placeholder)
+
+
 class CountryRowLeftGrid:
     def __init__(self, country_item, display_sc):
         self.grid = WidgetFactory.grid("left_child_in_country_row")
@@ -98,8 +308,11 @@ class CountryRowLeftGrid:
 
 
 class CountryRowRightGrid:
-    def __init__(self, country_item, revealer, dashboard_view, display_sc):
+    def __init__(
+        self, country_item, server_list_revealer, dashboard_view, display_sc
+    ):
         self.dv = dashboard_view
+        self.server_list_revealer = server_list_revealer
         self.feature_icon_list = []
         country_under_maintenance = country_item.status == ServerStatusEnum.UNDER_MAINTENANCE
         self.grid = WidgetFactory.grid("right_child_in_country_row")
@@ -118,7 +331,7 @@ class CountryRowRightGrid:
         if country_under_maintenance:
             return
 
-        self.connect_callback(country_item, revealer)
+        self.connect_callback(country_item, server_list_revealer.revealer)
         self.attach_connect_button()
         self.set_country_features(country_item, display_sc)
 
@@ -127,13 +340,11 @@ class CountryRowRightGrid:
             FeatureEnum.TOR: "tor_icon",
             FeatureEnum.P2P: "p2p_icon",
         }
-        features = list(
-            set(
-                [FeatureEnum.TOR, FeatureEnum.P2P]
-            ) & set(
-                country_item.features
-            )
-        )
+        features = [
+            feature
+            for feature in feature_to_img_dict
+            if has_feature(country_item.feature_mask, feature)
+        ]
 
         if country_item.is_virtual:
             feature_icon = WidgetFactory.image("smart_routing_icon")
@@ -208,15 +419,34 @@ class CountryRowRightGrid:
         gtk_chevron_icon_widget, chevron_btn_ctx,
         revealer
     ):
+        reveal = chevron_btn_ctx.has_class("chevron-unfold")
+        if reveal:
+            self.server_list_revealer.show_all_servers()
+
+        self.set_revealed(reveal)
+
+    def set_revealed(self, reveal):
+        """Expand or collapse the server list.
+
+        Args:
+            reveal (bool)
+        """
+        gtk_chevron_icon_widget = self.chevron_icon.widget
+        chevron_btn_ctx = self.chevron_button.context
+        revealer = self.server_list_revealer.revealer.widget
+        if reveal == chevron_btn_ctx.has_class("chevron-fold"):
+            return
+
         dummy_object = WidgetFactory.image("dummy")
-        if chevron_btn_ctx.has_class("chevron-unfold"):
+        if reveal:
             chevron_btn_ctx.remove_class("chevron-unfold")
             chevron_btn_ctx.add_class("chevron-fold")
             revealer.set_reveal_child(True)
             chevron_pixbuf = dummy_object.create_icon_pixbuf_from_name(
                 "chevron-hover.svg",
-                width=25, height=25
-            ).rotate_simple(GdkPixbuf.PixbufRotation.UPSIDEDOWN)
+                width=25, height=25,
+                rotation=GdkPixbuf.PixbufRotation.UPSIDEDOWN
+            )
         else:
             chevron_btn_ctx.remove_class("chevron-fold")
             chevron_btn_ctx.add_class("chevron-unfold")
@@ -224,7 +454,7 @@ class CountryRowRightGrid:
             chevron_pixbuf = dummy_object.create_icon_pixbuf_from_name(
                 "chevron-default.svg",
                 width=25, height=25
-            ).rotate_simple(GdkPixbuf.PixbufRotation.NONE)
+            )
 
         gtk_chevron_icon_widget.set_from_pixbuf(chevron_pixbuf)
 
@@ -0,0 +1,91 @@
+import time
+from collections import deque
+
+from gi.repository import GLib
+
+from ...constants import SERVER_LIST_BUILD_BUDGET_SECONDS
+
+
+class IncrementalListBuilder:
+    """IncrementalListBuilder class.
+
+    Builds list views from the main loop, a few rows at a time. Each job
+    is a generator (see ServerListViewType.generate_incrementally()) that
+    yields once per row. Jobs are resumed from an idle callback until
+    SERVER_LIST_BUILD_BUDGET_SECONDS are spent, so that the main loop
+    keeps drawing frames while the rows are built.
+
+    Jobs are built one after the other. on_first_screen is called once
+    the first job built first_screen_rows rows (or finished), so that
+    the list can be displayed before it is complete. on_finish is called
+    once all jobs are done. Neither is called if the builder is cancelled.
+
+    Methods:
+        start()
+            start building from the main loop
+        cancel()
+            stop building, i.e when a newer list has to be built
+    """
+    def __init__(
+        self, jobs, first_screen_rows=0,
+        on_first_screen=None, on_finish=None
+    ):
+        self.__jobs = deque(jobs)
+        self.__first_screen_rows = first_screen_rows
+        self.__on_first_screen = on_first_screen
+        self.__on_finish = on_finish
+        self.__first_job_rows = 0
+        self.__first_job_finished = False
+        self.__first_screen_built = False
+        self.__source_id = None
+
+    @property
+    def is_building(self):
+        return self.__source_id is not None
+
+    def start(self):
+        if self.is_building:
+            return
+
+        self.__source_id = GLib.idle_add(self.__on_idle)
+
+    def cancel(self):
+        if not self.is_building:
+            return
+
+        GLib.source_remove(self.__source_id)
+        self.__source_id = None
+
+    def __on_idle(self):
+        deadline = time.monotonic() + SERVER_LIST_BUILD_BUDGET_SECONDS
+        while self.__jobs and time.monotonic() < deadline:
+            self.__build_row()
+
+        if not self.__first_screen_built and (
+            self.__first_job_finished
+            or not self.__jobs
+            or self.__first_job_rows >= self.__first_screen_rows
+        ):
+            self.__first_screen_built = True
+            if self.__on_first_screen:
+                self.__on_first_screen()
+
+        if self.__jobs:
+            return True
+
+        self.__source_id = None
+        if self.__on_finish:
+            self.__on_finish()
+
+        return False
+
+    def __build_row(self):
+        try:
+            next(self.__jobs[0])
+        except StopIteration:
+            self.__jobs.popleft()
+            self.__first_job_finished = True
+            return
+
+        if not self.__first_job_finished:
+            self.__first_job_rows += 1
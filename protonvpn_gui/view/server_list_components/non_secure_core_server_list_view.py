@@ -1,5 +1,4 @@
 from ...patterns.factory import WidgetFactory
-from .country_row import CountryRow
 from .country_header import CountryHeader
 from .server_list_view_type import ServerListViewType
 
@@ -10,23 +9,45 @@ class NoneSecureCoreListView(ServerListViewType):
         self.__grid = None
         super().__init__()
 
-    def generate(self, dashboard_view, server_list=None):
+    def generate_incrementally(self, dashboard_view, server_list=None):
+        country_row_pool = self.release_country_rows()
         if self.__grid:
             self.destroy_existing_widgets()
 
         if server_list:
             self.update_server_list(server_list)
 
-        self.__generate(dashboard_view)
+        yield from self.__generate(dashboard_view, country_row_pool)
+
+    def append_country(self, dashboard_view, country_item):
+        """Append the row of a country to a list that is being generated.
+
+        Used to display countries while the server list is still being
+        generated, see ServerList.stream_list(). Countries are expected to
+        arrive in list order. Headers and search are only available once
+        the whole list is generated, which reuses the appended rows.
+        """
+        if len(country_item) < 1:
+            return
+
+        if self.__grid is None:
+            self.__create_grid(dashboard_view)
+
+        self.__attach_country_row(
+            dashboard_view, country_item, {},
+            len(self.country_row_positions) + 1
+        )
 
     @property
     def widget(self):
         return self.__grid.widget
 
-    def __generate(self, dashboard_view):
-        self.__grid = WidgetFactory.grid("dummy")
-        self.__grid.show = True
+    @property
+    def grid(self):
+        return self.__grid
 
+    def __generate(self, dashboard_view, country_row_pool):
+        self.__create_grid(dashboard_view)
         country_header = CountryHeader(dashboard_view.application)
         row_counter = 0
         for country_item in self.yield_countries():
@@ -46,19 +67,40 @@ class NoneSecureCoreListView(ServerListViewType):
                 )
                 self.header_tracker.append(header)
 
-            country_grid_row = CountryRow(country_item, dashboard_view)
             row_counter += 1 + (1 if add_header else 0)
-
-            self.__grid.attach(
-                country_grid_row.event_box, col=0,
-                row=row_counter, width=1, height=1
+            self.__attach_country_row(
+                dashboard_view, country_item, country_row_pool, row_counter
             )
-            self.widget_position_tracker[
-                country_item.country_name
-            ] = country_grid_row
+            yield
 
         self.country_rows = self.server_list.total_countries_count
 
+    def __create_grid(self, dashboard_view):
+        self.__grid = WidgetFactory.grid("dummy")
+        self.__grid.show = True
+        vadjustment = dashboard_view.server_list_scrolled_window\
+            .get_vadjustment()
+        self.__grid.widget.connect(
+            "size-allocate",
+            lambda *_: self.schedule_rows_in_viewport(vadjustment)
+        )
+
+    def __attach_country_row(
+        self, dashboard_view, country_item, country_row_pool, row
+    ):
+        country_grid_row = self.create_country_row(
+            country_item, dashboard_view, country_row_pool
+        )
+        self.attach_country_row(country_grid_row, row)
+        self.widget_position_tracker[
+            country_item.country_name
+        ] = country_grid_row
+        self.country_row_positions[country_item.country_name] = row
+        self.country_row_by_server_name.update(
+            (server.name, country_grid_row)
+            for server in country_item.servers
+        )
+
     def destroy_existing_widgets(self):
         for _widget in self.header_tracker:
             try:
@@ -67,13 +109,6 @@ class NoneSecureCoreListView(ServerListViewType):
                 pass
             _widget = None
 
-        for _, widget in self.widget_position_tracker.items():
-            try:
-                widget.__delete__()
-            except Exception:
-                pass
-            widget = None
-
         self.__grid = None
         self.server_list = None
         self.country_rows = None
@@ -81,3 +116,7 @@ class NoneSecureCoreListView(ServerListViewType):
         self.header_tracker = None
         self.widget_position_tracker = {}
         self.header_tracker = []
+        self.country_row_by_server_name = {}
+        self.country_row_positions = {}
+        self.pending_country_names = set()
+        self.created_country_names = set()
@@ -1,44 +1,212 @@
+from gi.repository import GLib
+
+from ...constants import (SERVER_ROWS_CREATED_ON_EXPAND,
+                          SERVER_ROWS_CREATED_PER_IDLE)
 from ...patterns.factory import WidgetFactory
 from .server_row import ServerRow
 from .server_header import ServerHeader
+from itertools import islice
 import weakref
 
 
 class ServerListRevealer:
-    def __init__(self, dasbhoard_view, country_item, display_sc):
+    """ServerListRevealer class.
+
+    Holds the server rows of a country. Rows are only created once they
+    have to be displayed: all of them with show_all_servers(), or only
+    the ones matching a search with show_servers(). Countries that are
+    never expanded do not create any row.
+
+    Each server keeps the grid row it would have if all rows were
+    created, so that rows can be created in any order.
+
+    Expanding a country, or showing the servers matching a search, only
+    creates the first SERVER_ROWS_CREATED_ON_EXPAND rows right away, the
+    remaining ones are created in small chunks once the main loop is
+    idle, so that countries with hundreds of servers expand without
+    blocking the UI.
+
+    Rows of server_row_pool (i.e the rows of the same country in the
+    previous server list) are reused instead of being created again, as
+    long as they can display the updated server.
+    """
+    def __init__(
+        self, dasbhoard_view, country_item, display_sc, server_row_pool=None
+    ):
         self.revealer = WidgetFactory.revealer("server_list")
+        self.server_rows = {}
+        self.__dashboard_view = dasbhoard_view
+        self.__country_item = country_item
+        self.__display_sc = display_sc
+        self.__revealer_child_grid = None
+        self.__headers = []
+        self.__row_positions = {}
+        self.__shown_server_names = None
+        self.__pending_servers = iter(())
+        self.__creating_in_idle = False
+        self.__server_row_pool = dict(server_row_pool or {})
+
+    def show_all_servers(self):
+        """Create missing rows and show all of them.
+
+        Rows that are not created right away are
+        shown once they are created in idle time.
+        """
+        self.__show_servers(None)
+        for header in self.__headers:
+            header.show = True
+
+    def show_servers(self, server_names):
+        """Create the rows of some servers and only show them.
+
+        Rows are created as with show_all_servers().
+
+        Args:
+            server_names (frozenset): names of the servers to show
+        """
+        self.__show_servers(server_names)
+        for header in self.__headers:
+            header.show = False
+
+    def rebind(self, country_item):
+        """Bind the created rows to updated data of the country.
 
-        _revealer_child_grid = WidgetFactory.grid("revealer_child")
-        revealer_child_grid = weakref.proxy(_revealer_child_grid)
-        revealer_child_grid.add_class("server-names-grid")
+        The country is expected to have the same servers in the same
+        order, see CountryRow.rebind(). Rows that can not display their
+        updated server are replaced.
+        """
+        self.__country_item = country_item
+        for server in country_item.servers:
+            server_row = self.server_rows.get(server.name)
+            if server_row is None or server_row.rebind(server):
+                continue
+
+            visible = server_row.event_box.props.visible
+            self.__revealer_child_grid.widget.remove(server_row.event_box)
+            del self.server_rows[server.name]
+            for new_server_row in self.__create_server_rows([server]):
+                new_server_row.event_box.props.visible = visible
+
+        if self.__creating_in_idle:
+            self.__pending_servers = self.__get_missing_servers()
+
+    def __show_servers(self, server_names):
+        """Create missing rows of the shown servers and show them.
+
+        Args:
+            server_names (frozenset|None): None to show all servers
+        """
+        self.__shown_server_names = server_names
+        self.__pending_servers = self.__get_missing_servers()
+        if self.__create_pending_server_rows(
+            SERVER_ROWS_CREATED_ON_EXPAND
+        ) and not self.__creating_in_idle:
+            self.__creating_in_idle = True
+            GLib.idle_add(self.__on_idle_create_server_rows)
+
+        for server_name, server_row in self.server_rows.items():
+            server_row.event_box.props.visible = self.__is_shown(server_name)
+
+    def __is_shown(self, server_name):
+        return self.__shown_server_names is None\
+            or server_name in self.__shown_server_names
+
+    def __get_missing_servers(self):
+        """Get the shown servers that do not have a row yet.
+
+        Returns:
+            iterator
+        """
+        return iter([
+            server
+            for server in self.__country_item.servers
+            if server.name not in self.server_rows
+            and self.__is_shown(server.name)
+        ])
+
+    def __on_idle_create_server_rows(self):
+        # Rows are no longer created once the server list this revealer
+        # belongs to is removed from the window, until it is expanded again.
+        self.__creating_in_idle = (
+            self.revealer.widget.get_toplevel().is_toplevel()
+            and self.__create_pending_server_rows(
+                SERVER_ROWS_CREATED_PER_IDLE
+            )
+        )
+        return self.__creating_in_idle
 
-        _server_header = ServerHeader(dasbhoard_view.application)
+    def __create_pending_server_rows(self, count):
+        """Create the next pending rows.
+
+        Returns:
+            bool: True if some rows might still be pending
+        """
+        servers = list(islice(self.__pending_servers, count))
+        self.__create_server_rows(servers)
+        for server in servers:
+            self.server_rows[server.name].event_box.props.visible = True
+
+        return len(servers) == count
+
+    def __create_server_rows(self, servers):
+        """Create the rows of servers that do not have one yet.
+
+        Returns:
+            list: created ServerRow
+        """
+        if self.__revealer_child_grid is None:
+            self.__create_grid()
+
+        created_server_rows = []
+        for server in servers:
+            if server.name in self.server_rows:
+                continue
+
+            _server_row = self.__server_row_pool.pop(server.name, None)
+            if _server_row is not None and _server_row.rebind(server):
+                parent = _server_row.event_box.get_parent()
+                if parent:
+                    parent.remove(_server_row.event_box)
+            else:
+                _server_row = ServerRow(
+                    self.__dashboard_view,
+                    self.__country_item,
+                    server,
+                    self.__display_sc
+                )
+
+            server_row = weakref.proxy(_server_row)
+            self.server_rows[server.name] = _server_row
+
+            self.__revealer_child_grid.attach(
+                server_row.event_box,
+                row=self.__row_positions[server.name]
+            )
+            created_server_rows.append(_server_row)
+
+        return created_server_rows
+
+    def __create_grid(self):
+        self.__revealer_child_grid = WidgetFactory.grid("revealer_child")
+        self.__revealer_child_grid.add_class("server-names-grid")
+
+        _server_header = ServerHeader(self.__dashboard_view.application)
         server_header = weakref.proxy(_server_header)
 
         row_counter = 0
-        for server in country_item.servers:
+        for server in self.__country_item.servers:
 
             add_header = False
-            header = server_header.create(server, country_item)
-            if header and not display_sc:
+            header = server_header.create(server, self.__country_item)
+            if header and not self.__display_sc:
                 add_header = True
-                revealer_child_grid.attach(
+                self.__revealer_child_grid.attach(
                     header.widget, col=0,
                     row=row_counter + 1, width=1, height=1
                 )
+                self.__headers.append(header)
 
             row_counter += 1 + (1 if add_header else 0)
-            _server_row = ServerRow(
-                dasbhoard_view,
-                country_item,
-                server,
-                display_sc
-            )
-            server_row = weakref.proxy(_server_row)
-
-            revealer_child_grid.attach(
-                server_row.event_box,
-                row=row_counter
-            )
+            self.__row_positions[server.name] = row_counter
 
-        self.revealer.add(revealer_child_grid.widget)
+        self.revealer.add(self.__revealer_child_grid.widget)
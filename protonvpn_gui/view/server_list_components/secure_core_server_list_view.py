@@ -1,5 +1,4 @@
 from ...patterns.factory import WidgetFactory
-from .country_row import CountryRow
 from .server_list_view_type import ServerListViewType
 
 
@@ -9,45 +8,60 @@ class SecureCoreListView(ServerListViewType):
         self.__grid = None
         super().__init__()
 
-    def generate(self, dashboard_view, server_list=None):
+    def generate_incrementally(self, dashboard_view, server_list=None):
+        country_row_pool = self.release_country_rows()
         if self.__grid:
             self.destroy_existing_widgets()
 
         if server_list:
             self.update_server_list(server_list)
 
-        self.__generate(dashboard_view)
+        yield from self.__generate(dashboard_view, country_row_pool)
 
     @property
     def widget(self):
         return self.__grid.widget
 
-    def __generate(self, dashboard_view):
+    @property
+    def grid(self):
+        return self.__grid
+
+    def __generate(self, dashboard_view, country_row_pool):
         self.__grid = WidgetFactory.grid("dummy")
         self.__grid.show = True
+        vadjustment = dashboard_view.server_list_scrolled_window\
+            .get_vadjustment()
+        self.__grid.widget.connect(
+            "size-allocate",
+            lambda *_: self.schedule_rows_in_viewport(vadjustment)
+        )
 
         row_counter = 0
         for country_item in self.yield_countries():
             if len(country_item) < 1:
                 continue
 
-            country_grid_row = CountryRow(country_item, dashboard_view, True)
+            country_grid_row = self.create_country_row(
+                country_item, dashboard_view, country_row_pool, True
+            )
             row_counter += 1
 
-            self.__grid.attach(
-                country_grid_row.event_box, col=0,
-                row=row_counter, width=1, height=1
-            )
+            self.attach_country_row(country_grid_row, row_counter)
             self.widget_position_tracker[
                 country_item.country_name
             ] = country_grid_row
+            self.country_row_positions[
+                country_item.country_name
+            ] = row_counter
+            self.country_row_by_server_name.update(
+                (server.name, country_grid_row)
+                for server in country_item.servers
+            )
+            yield
 
         self.country_rows = self.server_list.total_countries_count
 
     def destroy_existing_widgets(self):
-        for _, widget in self.widget_position_tracker.items():
-            widget.__delete__()
-
         self.__grid = None
         self.server_list = None
         self.country_rows = None
@@ -55,3 +69,7 @@ class SecureCoreListView(ServerListViewType):
         self.header_tracker = None
         self.widget_position_tracker = {}
         self.header_tracker = []
+        self.country_row_by_server_name = {}
+        self.country_row_positions = {}
+        self.pending_country_names = set()
+        self.created_country_names = set()
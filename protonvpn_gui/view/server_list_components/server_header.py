@@ -1,7 +1,7 @@
 from protonvpn_nm_lib.enums import ServerTierEnum
 from .header import Header
 from ..server_features import PlusFeatures, ServerFeaturesView
-from protonvpn_nm_lib.api import protonvpn
+from ...module import Module
 
 
 class ServerHeader:
@@ -41,12 +41,11 @@ class ServerHeader:
             h = Header(self.app)
             h.title = "PLUS Servers ({})".format(country_item.ammount_of_plus_servers)
             self.__header_tracker.append(ServerTierEnum.PLUS_VISIONARY)
-            try:
-                protonvpn.get_session().streaming[country_item.entry_country_code]
+            if Module().server_list_model.get_streaming_services(
+                country_item.entry_country_code
+            ) is not None:
                 h.info_icon_visibility = True
                 h.connect_button(self.on_display_plus_features, country_item)
-            except KeyError:
-                pass
 
             return h
         elif (
@@ -1,61 +1,404 @@
 from abc import abstractmethod
 
+from gi.repository import GLib
+
+from ...constants import (SERVER_LIST_VIRTUALIZED,
+                          VIRTUAL_COUNTRY_ROW_OVERSCAN_PAGES)
+from .country_row import CountryRow, VirtualCountryRow
+
 
 class ServerListViewType:
 
     def __init__(self):
+        self.server_list = None
         self.header_tracker = []
         self.country_rows = 0
         self.widget_position_tracker = {}
+        self.country_row_by_server_name = {}
+        self.visible_country_names = None
+        self.headers_visible = True
+        self.country_row_positions = {}
+        self.reordered_country_names = []
+        self.expanded_search_matches = {}
+        self.pending_country_names = set()
+        self.created_country_names = set()
+        self.__rows_in_viewport_scheduled = False
+        self.__rows_to_attach = {}
+        self.__released_search_rows = set()
+        self.__released_grids = []
 
     @property
     @abstractmethod
     def widget():
         pass
 
+    @property
     @abstractmethod
-    def generate():
+    def grid():
+        """Grid of the list being generated, None until it is created."""
+        pass
+
+    @abstractmethod
+    def generate_incrementally():
+        """Generate the list, yielding once per country row.
+
+        Has to be resumed from the main loop, see IncrementalListBuilder.
+        """
         pass
 
     def update_server_list(self, server_list):
         self.server_list = None
         self.server_list = server_list
+        # Newly generated rows are all visible and in list order
+        self.visible_country_names = None
+        self.headers_visible = True
+        self.reordered_country_names = []
+        self.expanded_search_matches = {}
 
     def yield_countries(self):
         for country_item in self.server_list.servers:
             yield country_item
 
-    def filter_server_list(self, user_input):
-        """Filter server list based on user input.
+    def release_country_rows(self):
+        """Hand the country rows over to the next generation.
+
+        The next generation reuses these rows (see create_country_row()).
+        If the list is displayed, its rows stay in place until the newly
+        generated list replaces it (see attach_reused_country_rows()), so
+        that the list is not blank while the new one is being generated.
+
+        Returns:
+            dict: country rows by country name
+        """
+        if not self.__released_grids:
+            self.__released_search_rows = set()
+
+        # Rows of a generation that was never displayed are
+        # still in the list displayed before it, if any.
+        self.__rows_to_attach = {}
+        self.__released_search_rows.update(
+            self.widget_position_tracker[country_name]
+            for country_name in self.expanded_search_matches
+            if country_name in self.widget_position_tracker
+        )
+
+        if self.grid is not None:
+            if self.grid.widget.get_mapped():
+                self.__released_grids.append(self.grid)
+            else:
+                self.__detach_rows(self.grid)
+
+        return self.widget_position_tracker
+
+    def attach_country_row(self, country_row, row):
+        """Attach a country row to the grid of the list being generated.
+
+        Rows that are still displayed in the previous list are only
+        moved once the generated list replaces it. Rows expanded by a
+        search are collapsed, and rows hidden by a search are shown again.
+
+        Args:
+            country_row (CountryRow|VirtualCountryRow)
+            row (int): row of the grid
+        """
+        if country_row.event_box.get_parent():
+            self.__rows_to_attach[country_row] = row
+            return
+
+        if country_row in self.__released_search_rows:
+            self.__released_search_rows.discard(country_row)
+            country_row.clear_search_matches()
+
+        self.grid.attach(
+            country_row.event_box, col=0,
+            row=row, width=1, height=1
+        )
+
+    def attach_reused_country_rows(self):
+        """Move the reused rows into the generated list.
+
+        Has to be called once the generated list is displayed in place of
+        the previous one, which is then released.
+        """
+        for grid in self.__released_grids:
+            self.__detach_rows(grid)
+
+        self.__released_grids = []
+        rows_to_attach, self.__rows_to_attach = self.__rows_to_attach, {}
+        for country_row, row in rows_to_attach.items():
+            self.attach_country_row(country_row, row)
+
+    def move_country_row(self, country_row, row):
+        if country_row in self.__rows_to_attach:
+            self.__rows_to_attach[country_row] = row
+            return
+
+        self.grid.move_to_row(country_row.event_box, row)
+
+    def create_country_row(
+        self, country_item, dashboard_view, country_row_pool, display_sc=None
+    ):
+        """Create the row of a country, or reuse the one of the previous list.
+
+        A row of country_row_pool is reused if it can display the updated
+        country (see CountryRow.rebind()), otherwise its server rows are
+        reused by the new row. Thus refreshing the list only creates rows
+        for countries and servers that appeared or changed.
+
+        If the server list is virtualized, new rows are only placeholders,
+        see create_rows_in_viewport().
+
+        Args:
+            country_row_pool (dict): result of release_country_rows(),
+                reused rows are removed from it
+
+        Returns:
+            CountryRow|VirtualCountryRow
+        """
+        country_row = country_row_pool.pop(country_item.country_name, None)
+        server_row_pool = None
+        if country_row is not None:
+            if country_row.rebind(country_item):
+                # Created rows are tracked by create_rows_in_viewport()
+                if SERVER_LIST_VIRTUALIZED:
+                    self.pending_country_names.add(country_item.country_name)
+
+                return country_row
+
+            server_row_pool = country_row.server_rows
+
+        if not SERVER_LIST_VIRTUALIZED:
+            return CountryRow(
+                country_item, dashboard_view, display_sc, server_row_pool
+            )
+
+        self.pending_country_names.add(country_item.country_name)
+        return VirtualCountryRow(
+            country_item, dashboard_view, display_sc, server_row_pool
+        )
+
+    def schedule_rows_in_viewport(self, adjustment):
+        """Create the rows close to the viewport from the main loop.
+
+        Can be called from signal handlers (i.e size-allocate), as rows
+        are only created once the main loop is idle.
+
+        Args:
+            adjustment (Gtk.Adjustment): vertical adjustment
+                of the scrolled window
+        """
+        if self.__rows_in_viewport_scheduled or not (
+            self.pending_country_names or self.created_country_names
+        ):
+            return
+
+        self.__rows_in_viewport_scheduled = True
+        GLib.idle_add(self.create_rows_in_viewport, adjustment)
+
+    def create_rows_in_viewport(self, adjustment):
+        """Create the virtual rows that are in or close to the viewport.
+
+        Placeholders are replaced by their CountryRow once they are within
+        VIRTUAL_COUNTRY_ROW_OVERSCAN_PAGES of the viewport, and rows that
+        are no longer within it are released (see
+        VirtualCountryRow.release_row()). Thus the amount of rows depends
+        on the height of the viewport, and not on how far the user
+        scrolled or on the size of the server list. Hidden rows are never
+        created.
+        """
+        self.__rows_in_viewport_scheduled = False
+        page_size = adjustment.get_page_size()
+        top = adjustment.get_value()\
+            - page_size * VIRTUAL_COUNTRY_ROW_OVERSCAN_PAGES
+        bottom = adjustment.get_value()\
+            + page_size * (1 + VIRTUAL_COUNTRY_ROW_OVERSCAN_PAGES)
+
+        for country_name in list(self.pending_country_names):
+            country_row = self.widget_position_tracker.get(country_name)
+            if country_row is None:
+                self.pending_country_names.discard(country_name)
+            elif country_row.row_created or country_row.is_within(
+                top, bottom
+            ):
+                country_row.create_row()
+                self.pending_country_names.discard(country_name)
+                self.created_country_names.add(country_name)
+
+        for country_name in list(self.created_country_names):
+            country_row = self.widget_position_tracker.get(country_name)
+            if country_row is None:
+                self.created_country_names.discard(country_name)
+            # Rows that are not displayed yet (i.e moved to a newly
+            # generated list) have no position to compare.
+            elif country_row.event_box.get_mapped()\
+                    and not country_row.is_within(top, bottom)\
+                    and country_row.release_row():
+                self.created_country_names.discard(country_name)
+                self.pending_country_names.add(country_name)
+
+        return False
+
+    def update_server_loads(self, changes):
+        """Update server rows in place.
+
+        Rows that were not created yet are skipped, they read
+        the current load once they are created.
+
+        Args:
+            changes (list): (server, load, status) for each changed server
+        """
+        for server, load, status in changes:
+            try:
+                server_row = self.country_row_by_server_name[
+                    server.name
+                ].server_rows[server.name]
+            except KeyError:
+                continue
+
+            server_row.update_load(load, status)
+
+    def search(self, user_input):
+        """Search countries matching user input.
+
+        Only reads the search index of the server list (see
+        ServerSearchIndex), thus it can be called outside the main loop.
 
         Args:
             user_input (string): what to search for
 
-        It either hides or shows the grid/row for a specific country.
+        Returns:
+            tuple|None: CountrySearchMatch, best matches first,
+                or None if all countries match
+        """
+        server_list = self.server_list
+        if not server_list or not user_input:
+            return None
+
+        return server_list.search_index.search(user_input)
+
+    def apply_search_result(self, user_input, search_matches):
+        """Show the rows of the matching countries.
 
-        06/2021: Search is only possible for country names
+        Only the rows whose visibility changed since the previous search
+        are updated. If the best matches are not in list order, their rows
+        are moved above the others. Countries that only match through some
+        of their servers are expanded to show these servers.
+        Has to be called from the main loop.
+
+        Args:
+            user_input (string): what was searched for
+            search_matches (tuple|None): result of search()
         """
-        filtered_country_widgets = [
-            country_row
-            for country_name, country_row
-            in self.widget_position_tracker.items()
-            if user_input.lower() in country_name.lower()
-        ]
+        matching_country_names = None
+        ranked_country_names = ()
+        server_names_by_country_name = {}
+        if search_matches is not None:
+            ranked_country_names = tuple(
+                match.country_name for match in search_matches
+            )
+            matching_country_names = frozenset(ranked_country_names)
+            server_names_by_country_name = {
+                match.country_name: match.server_names
+                for match in search_matches
+                if match.server_names is not None
+            }
 
-        try:
-            self.__show_headers(False)
-        except: # noqa
-            pass
+        if self.visible_country_names is None:
+            changed_country_names = (
+                () if matching_country_names is None
+                else self.widget_position_tracker.keys()
+            )
+        elif matching_country_names is None:
+            changed_country_names = self.widget_position_tracker.keys()\
+                - self.visible_country_names
         else:
-            if len(user_input) < 1:
-                self.__show_headers(True)
+            changed_country_names = self.visible_country_names\
+                ^ matching_country_names
 
-        for _, country_row in self.widget_position_tracker.items():
-            if country_row in filtered_country_widgets:
-                country_row.row_grid.show = True
+        for country_name in changed_country_names:
+            try:
+                country_row = self.widget_position_tracker[country_name]
+            except KeyError:
                 continue
 
-            country_row.row_grid.show = False
+            country_row.event_box.props.visible = (
+                matching_country_names is None
+                or country_name in matching_country_names
+            )
+
+        self.visible_country_names = matching_country_names
+        self.__reorder_country_rows(ranked_country_names)
+        self.__expand_search_matches(server_names_by_country_name)
+
+        headers_visible = len(user_input) < 1
+        if headers_visible != self.headers_visible:
+            self.__show_headers(headers_visible)
+            self.headers_visible = headers_visible
+
+    def __reorder_country_rows(self, ranked_country_names):
+        """Move the rows of ranked countries above all the other rows.
+
+        Rows are only moved when the ranking differs from the list order,
+        and are moved back to their own row once it matches again. Rows are
+        moved to negative row numbers, so that they never share a row with
+        any other widget of the grid.
+        """
+        ranked_country_names = [
+            country_name
+            for country_name in ranked_country_names
+            if country_name in self.country_row_positions
+        ]
+        if ranked_country_names == sorted(
+            ranked_country_names, key=self.country_row_positions.get
+        ):
+            ranked_country_names = []
+
+        if ranked_country_names == self.reordered_country_names:
+            return
+
+        for country_name in self.reordered_country_names:
+            self.move_country_row(
+                self.widget_position_tracker[country_name],
+                self.country_row_positions[country_name]
+            )
+
+        for row, country_name in enumerate(
+            ranked_country_names, -len(ranked_country_names)
+        ):
+            self.move_country_row(
+                self.widget_position_tracker[country_name], row
+            )
+
+        self.reordered_country_names = ranked_country_names
+
+    def __expand_search_matches(self, server_names_by_country_name):
+        """Expand countries to show their matching servers.
+
+        Countries expanded by the previous search that no longer
+        have matching servers are collapsed.
+        """
+        for country_name in self.expanded_search_matches.keys()\
+                - server_names_by_country_name.keys():
+            country_row = self.widget_position_tracker.get(country_name)
+            if country_row:
+                country_row.clear_search_matches()
+
+        for country_name, server_names in server_names_by_country_name.items():
+            if self.expanded_search_matches.get(country_name) == server_names:
+                continue
+
+            country_row = self.widget_position_tracker.get(country_name)
+            if country_row:
+                country_row.show_search_matches(server_names)
+
+        self.expanded_search_matches = server_names_by_country_name
+
+    def __detach_rows(self, grid):
+        # Releasing a grid destroys the widgets it still contains,
+        # thus rows are detached so that they can still be reused.
+        for widget in grid.widget.get_children():
+            grid.widget.remove(widget)
+            widget.props.visible = True
 
     def __show_headers(self, bool_val):
         """Sets header visibility.
@@ -1,9 +1,12 @@
+import os
+
 import gi
 from math import pi
 gi.require_version('Gtk', '3.0')
 import cairo
 from gi.repository import Gtk, Gdk
-from ...patterns.factory import WidgetFactory
+from ...constants import ICON_DIR_PATH
+from ...patterns.factory.pixbuf_cache import PixbufCache
 
 
 class ServerLoad(Gtk.Frame):
@@ -19,6 +22,10 @@ class ServerLoad(Gtk.Frame):
 
     Since set_source_rgb() method only accepts values from 0-1,
     percentages of rgb values have to be used instead.
+
+    The icon and circle are pre-rendered once per colour, size and
+    scale factor (see get_surface()), thus redrawing a server load
+    never rasterizes the info icon again.
     """
 
     # _green = (0.302, 0.6392, 0.3451)
@@ -38,13 +45,15 @@ class ServerLoad(Gtk.Frame):
     __ARC_SIZE = 10
     __INFO_ICON_SIZE = 12
 
+    # Pre-rendered surfaces by (colour, width, height, scale)
+    __surfaces = {}
+
     def __init__(self, server_load):
         super().__init__()
         self.server_load = int(server_load)
         self.set_border_width(0)
         # Size was manually configured
         self.set_size_request(26, 0)
-        self.surface = None
         self.set_property("has-tooltip", True)
         self.set_tooltip_text("{}%".format(server_load))
 
@@ -52,78 +61,96 @@ class ServerLoad(Gtk.Frame):
         self.add(self.area)
 
         self.area.connect("draw", self.on_draw)
-        self.area.connect('configure-event', self.on_configure)
 
     @property
     def widget(self):
         return self
 
-    def init_surface(self, area):
-        # Destroy previous buffer
-        if self.surface is not None:
-            self.surface.finish()
-            self.surface = None
-
-        # Create a new buffer
-        self.surface = cairo.ImageSurface(
-            cairo.FORMAT_ARGB32, area.get_allocated_width(),
-            area.get_allocated_height()
-        )
-
-    def redraw(self):
-        self.init_surface(self.area)
-        context = cairo.Context(self.surface)
-        context.scale(self.surface.get_width(), self.surface.get_height())
-        self.do_drawing(context)
-        self.surface.flush()
-
-    def on_configure(self, area, event, data=None):
-        self.redraw()
-        return False
+    def update_load(self, server_load):
+        """Update displayed load and redraw the circle."""
+        self.server_load = int(server_load)
+        self.set_tooltip_text("{}%".format(server_load))
+        self.area.queue_draw()
 
     def on_draw(self, area, context):
-        if self.surface is not None:
-            context.set_source_surface(self.surface, 0.0, 0.0)
-            self.draw_radial_gradient_rect(context)
-        return False
-
-    def do_drawing(self, ctx):
-        self.draw_radial_gradient_rect(ctx)
-
-    def draw_radial_gradient_rect(self, ctx):
-        self.create_info_icon(ctx)
-        self.set_colour_according_to_load_value(ctx)
-        self.create_load_circle(ctx)
-
-    def create_info_icon(self, ctx):
-        dummy = WidgetFactory.image("dummy")
-        info_pixbuf = dummy.create_icon_pixbuf_from_name(
-            "info-icon.svg",
-            width=self.__INFO_ICON_SIZE, height=self.__INFO_ICON_SIZE
+        context.set_source_surface(
+            self.get_surface(
+                self.get_colour_according_to_load_value(),
+                area.get_allocated_width(),
+                area.get_allocated_height(),
+                area.get_scale_factor()
+            ),
+            0.0, 0.0
         )
+        context.paint()
+        return False
 
-        Gdk.cairo_set_source_pixbuf(
-            ctx, info_pixbuf,
-            self.__BASE_ICON_POSITION[0] + self.__pos_modifier,
-            self.__BASE_ICON_POSITION[1] + self.__pos_modifier
-        )
-        ctx.paint()
-
-    def set_colour_according_to_load_value(self, ctx):
-        ctx.set_source_rgb(*self._green)
+    def get_colour_according_to_load_value(self):
         if self.server_load > 75 and self.server_load < 91:
-            ctx.set_source_rgb(*self._yellow)
+            return self._yellow
         elif self.server_load > 90:
-            ctx.set_source_rgb(*self._red)
+            return self._red
         elif self.server_load == 0:
-            ctx.set_source_rgb(*self._inactive)
+            return self._inactive
+
+        return self._green
+
+    @classmethod
+    def get_surface(cls, colour, width, height, scale):
+        """Get the pre-rendered icon and circle.
+
+        Surfaces are shared by all server loads, so that drawing a server
+        load only paints a cached surface, and the info icon is only
+        rasterized once per scale factor.
+
+        Args:
+            colour (tuple): rgb colour of the circle
+            width (int): area width
+            height (int): area height
+            scale (int): scale factor of the area
+
+        Returns:
+            cairo.ImageSurface
+        """
+        key = (colour, width, height, scale)
+        surface = cls.__surfaces.get(key)
+        if surface is not None:
+            return surface
+
+        surface = cairo.ImageSurface(
+            cairo.FORMAT_ARGB32, width * scale, height * scale
+        )
+        surface.set_device_scale(scale, scale)
+        ctx = cairo.Context(surface)
+        cls.create_info_icon(ctx, scale)
+        ctx.set_source_rgb(*colour)
+        cls.create_load_circle(ctx)
+        surface.flush()
+
+        cls.__surfaces[key] = surface
+        return surface
+
+    @classmethod
+    def create_info_icon(cls, ctx, scale):
+        info_pixbuf = PixbufCache().get(
+            os.path.join(ICON_DIR_PATH, "info-icon.svg"),
+            width=cls.__INFO_ICON_SIZE, height=cls.__INFO_ICON_SIZE,
+            scale=scale
+        )
+        ctx.set_source_surface(
+            Gdk.cairo_surface_create_from_pixbuf(info_pixbuf, scale, None),
+            cls.__BASE_ICON_POSITION[0] + cls.__pos_modifier,
+            cls.__BASE_ICON_POSITION[1] + cls.__pos_modifier
+        )
+        ctx.paint()
 
-    def create_load_circle(self, ctx):
+    @classmethod
+    def create_load_circle(cls, ctx):
         # y_pos, x_pos, radius, start_angle, stop_angle
         ctx.arc(
-            self.__BASE_ARC__POSITION[0] + self.__pos_modifier,
-            self.__BASE_ARC__POSITION[1] + self.__pos_modifier,
-            self.__ARC_SIZE,
+            cls.__BASE_ARC__POSITION[0] + cls.__pos_modifier,
+            cls.__BASE_ARC__POSITION[1] + cls.__pos_modifier,
+            cls.__ARC_SIZE,
             0,
             2 * pi
         )
@@ -2,6 +2,7 @@ import gi
 from protonvpn_nm_lib.enums import FeatureEnum, ServerStatusEnum
 
 from ...enums import GLibEventSourceEnum
+from ...model.feature_mask import has_feature
 from ...patterns.factory import WidgetFactory
 from ..dialog import ConnectUpgradeDialog
 from .server_load import ServerLoad
@@ -14,32 +15,62 @@ import weakref
 
 class ServerRow:
     def __init__(self, dasbhoard_view, country, server, display_sc):
+        self.__feature_mask = server.feature_mask
+        self.__entry_country_code = server.entry_country_code
         _grid = WidgetFactory.grid("server_row")
         grid = weakref.proxy(_grid)
         grid.add_class("server-row")
 
-        _left_child = ServerRowLeftGrid(dasbhoard_view, country, server, display_sc)
-        left_child = weakref.proxy(_left_child)
+        self.__left_child = ServerRowLeftGrid(dasbhoard_view, country, server, display_sc)
+        left_child = weakref.proxy(self.__left_child)
 
-        _right_child = ServerRowRightGrid(dasbhoard_view, server)
-        right_child = weakref.proxy(_right_child)
+        self.__right_child = ServerRowRightGrid(dasbhoard_view, server)
+        right_child = weakref.proxy(self.__right_child)
 
         grid.attach(left_child.grid.widget)
         grid.attach_right_next_to(
             right_child.grid.widget,
             left_child.grid.widget,
         )
-        self.create_event_box(server, grid, right_child)
+        self.create_event_box(grid, right_child)
 
-    def create_event_box(self, server, grid, right_child):
+    def rebind(self, server):
+        """Bind the row to updated data of its server.
+
+        Args:
+            server (ServerTableRow): server with the same name
+
+        Returns:
+            bool: False if the row can not display the server (i.e its
+                features changed), in which case a new row has to be created
+        """
+        if (
+            server.feature_mask != self.__feature_mask
+            or server.entry_country_code != self.__entry_country_code
+        ):
+            return False
+
+        self.__left_child.server = server
+        self.__left_child.update_load(server.load, server.status)
+        self.__right_child.bind(server)
+        return True
+
+    def update_load(self, load, status):
+        """Update server load and maintenance state in place.
+
+        Args:
+            load (str): server load
+            status (ServerStatusEnum): server status
+        """
+        self.__left_child.update_load(load, status)
+        self.__right_child.update_status(status)
+
+    def create_event_box(self, grid, right_child):
         self.event_box = Gtk.EventBox()
         self.event_box.set_visible_window(True)
         self.event_box.add(grid.widget)
         self.event_box.props.visible = True
 
-        if server.status == ServerStatusEnum.UNDER_MAINTENANCE:
-            return
-
         self.event_box.connect(
             "enter-notify-event", right_child.on_server_enter
         )
@@ -57,14 +88,14 @@ class ServerRowLeftGrid:
         self.populate_left_grid(dasbhoard_view, country)
 
     def populate_left_grid(self, dasbhoard_view, country):
-        _load_icon = self.create_load_icon()
-        load_icon = weakref.proxy(_load_icon)
+        self.load_icon = self.create_load_icon()
+        load_icon = weakref.proxy(self.load_icon)
 
         _country_flag = self.create_exit_flag()
         country_flag = weakref.proxy(_country_flag)
 
-        _servername_label = self.create_servername_label()
-        servername_label = weakref.proxy(_servername_label)
+        self.servername_label = self.create_servername_label()
+        servername_label = weakref.proxy(self.servername_label)
 
         _secure_core_chevron = self.create_secure_core_chevron()
         secure_core_chevron = weakref.proxy(_secure_core_chevron)
@@ -85,6 +116,13 @@ class ServerRowLeftGrid:
         if not self.display_sc:
             self.set_server_features(dasbhoard_view, country, servername_label)
 
+    def update_load(self, load, status):
+        self.load_icon.update_load(load)
+        if status == ServerStatusEnum.UNDER_MAINTENANCE:
+            self.servername_label.add_class("disabled-label")
+        else:
+            self.servername_label.remove_class("disabled-label")
+
     def create_load_icon(self):
         load_icon = ServerLoad(self.server.load)
         load_icon.show_all()
@@ -143,34 +181,45 @@ class ServerRowLeftGrid:
         ):
             return
 
-        for feature in features:
-            try:
-                _pixbuf_feature_icon = WidgetFactory.image(
-                    feature_to_img_dict[feature][0]
-                )
-                pixbuf_feature_icon = weakref.proxy(_pixbuf_feature_icon)
-            except KeyError:
+        for feature in feature_to_img_dict:
+            if not has_feature(self.server.feature_mask, feature):
                 continue
+
+            _pixbuf_feature_icon = WidgetFactory.image(
+                feature_to_img_dict[feature][0]
+            )
+            pixbuf_feature_icon = weakref.proxy(_pixbuf_feature_icon)
             pixbuf_feature_icon.tooltip = True
             pixbuf_feature_icon.tooltip_text = feature_to_img_dict[feature][1]
 
             if feature == FeatureEnum.STREAMING:
                 _button_ = WidgetFactory.button("server_row_streaming_feature")
                 _button = weakref.proxy(_button_)
-                _w_ = CountryStreamingWidget(
-                    dasbhoard_view.application,
-                    country.country_name,
-                    country.entry_country_code
-                )
-                _w = weakref.proxy(_w_)
                 _button.custom_content(pixbuf_feature_icon.widget)
                 _button.connect(
-                    "clicked", _w.display
+                    "clicked", self.display_streaming_services,
+                    dasbhoard_view.application, country.entry_country_code
                 )
                 pixbuf_feature_icon = _button
 
             self.attach_feature_icon(pixbuf_feature_icon.widget, servername_label)
 
+    def display_streaming_services(
+        self, gtk_button_object, application, entry_country_code
+    ):
+        """Display the streaming services of a country.
+
+        Rows only hold the country code, the widget is
+        created when the user asks for it.
+        """
+        from protonvpn_nm_lib.country_codes import country_codes
+
+        CountryStreamingWidget(
+            application,
+            country_codes.get(entry_country_code, entry_country_code),
+            entry_country_code
+        ).display()
+
     def attach_feature_icon(self, pixbuf_feature_icon, servername_label):
         if len(self.feature_icon_list) < 1:
             self.grid.attach_right_next_to(
@@ -188,58 +237,70 @@ class ServerRowRightGrid:
     def __init__(self, dasbhoard_view, server):
         self.dv = dasbhoard_view
         self.grid = WidgetFactory.grid("right_child_in_server_row")
+        self.server_under_maintenance = False
 
-        _maintenance_icon = WidgetFactory.image("maintenance_icon")
-        maintenance_icon = weakref.proxy(_maintenance_icon)
-
+        self.maintenance_icon = WidgetFactory.image("maintenance_icon")
         self.connect_server_button = WidgetFactory.button("connect_server")
         self.city_label = WidgetFactory.label("city", server.city)
-        maintenance_icon.tooltip = True
-        maintenance_icon.tooltip_text = "Under maintenance"
-        server_under_maintenance = server.status == ServerStatusEnum.UNDER_MAINTENANCE
-
-        maintenance_icon.show = server_under_maintenance
-        self.city_label.show = not server_under_maintenance
-        object_to_attach = (
-            maintenance_icon
-            if server_under_maintenance
-            else self.connect_server_button
-        )
+        self.maintenance_icon.tooltip = True
+        self.maintenance_icon.tooltip_text = "Under maintenance"
+        self.__connect_label = self.connect_server_button.label
 
-        # Both widgets are attached to the same position
+        # All widgets are attached to the same position
         # as they are mutually exclusive. Only one at the
         # time can be displayed.
         self.grid.attach(self.city_label.widget)
-        self.grid.attach(object_to_attach.widget)
-
-        if server_under_maintenance:
-            return
+        self.grid.attach(self.maintenance_icon.widget)
+        self.grid.attach(self.connect_server_button.widget)
+        self.bind(server)
 
         self.connect_server_button.connect(
-            "clicked", self.connect_to_server,
-            server.name, server.has_to_upgrade
+            "clicked", self.connect_to_server
         )
 
+    def bind(self, server):
+        """Display the city, upgrade and maintenance state of a server."""
+        self.server = server
         if server.has_to_upgrade:
             self.connect_server_button.label = "UPGRADE"
             self.city_label.content = "Upgrade"
+        else:
+            self.connect_server_button.label = self.__connect_label
+            self.city_label.content = server.city
 
-    def connect_to_server(self, gtk_button_object, servername, user_has_to_upgrade):
-        if user_has_to_upgrade:
+        self.update_status(server.status)
+
+    def update_status(self, status):
+        """Toggle between maintenance and connectable state."""
+        self.server_under_maintenance = status == ServerStatusEnum.UNDER_MAINTENANCE
+        self.maintenance_icon.show = self.server_under_maintenance
+        self.city_label.show = not self.server_under_maintenance
+        self.connect_server_button.show = False
+
+    def connect_to_server(self, gtk_button_object):
+        if self.server.has_to_upgrade:
             ConnectUpgradeDialog(self.dv.application)
         else:
             self.dv.remove_background_glib(
                 GLibEventSourceEnum.ON_MONITOR_VPN
             )
-            self.dv.dashboard_view_model.on_servername_connect(servername)
+            self.dv.dashboard_view_model.on_servername_connect(
+                self.server.name
+            )
 
     def on_server_enter(self, gtk_widget, event_crossing):
         """Show connect button on enter country row."""
+        if self.server_under_maintenance:
+            return
+
         self.city_label.show = False
         self.connect_server_button.show = True
 
     def on_server_leave(self, gtk_widget, event_crossing):
         """Hide connect button on leave country row."""
+        if self.server_under_maintenance:
+            return
+
         if event_crossing.detail in [
             Gdk.NotifyType.NONLINEAR,
             Gdk.NotifyType.NONLINEAR_VIRTUAL,
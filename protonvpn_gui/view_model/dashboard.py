@@ -174,14 +174,20 @@ class DashboardViewModel:
         """Load initial UI components such as quick settings and
         server list.
 
-        This needs to be pre-loaded before displaying the dashboard."""
+        This needs to be pre-loaded before displaying the dashboard.
+
+        The cached server list does not need the API, thus it is displayed
+        first, so that it does not wait for notifications to be fetched,
+        nor gets hidden if fetching them fails.
+        """
+        self.state.on_next(self.get_quick_settings_state())
+        self.__server_list_vm.on_load_cached_servers()
+
         try:
             self.check_if_events_should_be_displayed()
         except: # noqa
             return
 
-        self.state.on_next(self.get_quick_settings_state())
-
         try:
             self.__server_list_vm.on_load_servers()
         except exceptions.APISessionIsNotValidError as e:
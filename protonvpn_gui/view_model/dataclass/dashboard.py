@@ -61,6 +61,17 @@ class NotConnectedToVPNInfo:
 class ServerListData:
     server_list: list
     display_secure_core: bool
+    from_cache: bool = False
+
+
+@dataclass
+class ServerListCountry:
+    country_item: object  # non-Secure Core CountryItem, in list order
+
+
+@dataclass
+class ServerLoadUpdate:
+    changes: list  # (server, load, status)
 
 
 @dataclass
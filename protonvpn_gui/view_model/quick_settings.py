@@ -1,6 +1,7 @@
 from protonvpn_nm_lib.api import protonvpn
 from protonvpn_nm_lib.enums import (ConnectionMetadataEnum, ConnectionTypeEnum,
-                                    KillswitchStatusEnum, SecureCoreStatusEnum)
+                                    FeatureEnum, KillswitchStatusEnum,
+                                    SecureCoreStatusEnum)
 
 from ..logger import logger
 
@@ -60,22 +61,12 @@ class QuickSettingsViewModel:
 
         server = None
         if secure_core_enum == SecureCoreStatusEnum.ON:
-            servers_list = list(map(
-                lambda country: list(filter(
-                    lambda server:
-                    server.exit_country_code.lower() == exit_country.lower(),
-                    country.servers
-                )),
-                self.dashboard_vm.server_list_view_model.server_list_model.secure_core.servers
-            ))
-            flattened_servers = [
-                server for sub in servers_list for server in sub
-            ]
-            if len(flattened_servers) > 0:
-                flattened_servers.sort(
-                    key=lambda server: server.score, reverse=True
+            best_servers = self.dashboard_vm.server_list_view_model\
+                .server_list_model.get_best_servers(
+                    exit_country, [FeatureEnum.SECURE_CORE]
                 )
-                server = flattened_servers[0]
+            if best_servers:
+                server = best_servers[0]
 
         if not server:
             server = protonvpn.config_for_fastest_server()
@@ -2,8 +2,10 @@ from ..patterns.factory import BackgroundProcess
 from protonvpn_nm_lib.api import protonvpn
 from protonvpn_nm_lib import exceptions as lib_exceptions
 from protonvpn_nm_lib.enums import ServerTierEnum, SecureCoreStatusEnum
-from .dataclass.dashboard import ServerListData, SwitchServerList
+from .dataclass.dashboard import (ServerListCountry, ServerListData,
+                                  ServerLoadUpdate, SwitchServerList)
 from ..logger import logger
+from ..model.server_list import ServerListSnapshot
 from ..module import Module
 
 
@@ -12,6 +14,7 @@ class ServerListViewModel:
         self.__dashboard_vm = None
         self.__update_server_load = False
         self.server_list_model = Module().server_list_model
+        self.server_list_cache = Module().server_list_cache_model
 
     @property
     def dashboard_view_model(self):
@@ -38,17 +41,111 @@ class ServerListViewModel:
         process.start()
 
     def on_load_servers(self, *_):
-        self.__generate_server_list()
+        """Generate the server list and display it.
+
+        If no list is displayed yet (i.e there was no cached list to
+        display at startup), countries are displayed one by one as they
+        are generated, see ServerList.stream_list().
+
+        Search indexes are built once the list is displayed, from the
+        same background thread, so that the first search does not have
+        to build them.
+        """
+        display_secure_core = protonvpn.get_settings().secure_core == SecureCoreStatusEnum.ON
+        snapshot = self.__generate_server_list(
+            stream=(
+                not display_secure_core
+                and self.server_list_model.snapshot.server_table is None
+            )
+        )
+        if snapshot is None:
+            logger.info("Discarding outdated server list")
+            return
+
         state = ServerListData(
-            server_list=self.server_list_model,
-            display_secure_core=protonvpn.get_settings().secure_core == SecureCoreStatusEnum.ON
+            server_list=snapshot,
+            display_secure_core=display_secure_core
         )
         self.__dashboard_vm.state.on_next(state)
 
-    def __generate_server_list(self):
-        self.server_list_model.generate_list(
-            ServerTierEnum(protonvpn.get_session().vpn_tier)
+        for server_type in (snapshot.none_secure_core, snapshot.secure_core):
+            server_type.search_index.build()
+
+    def on_load_cached_servers(self, *_):
+        """Display the server list cached from the previous session.
+
+        This is only meant to be called at startup, before on_load_servers(),
+        which replaces the cached list with a freshly generated one.
+        """
+        try:
+            cache_was_loaded = self.server_list_cache.load(
+                self.server_list_model,
+                ServerTierEnum(protonvpn.get_session().vpn_tier)
+            )
+        except Exception as e:
+            logger.exception(e)
+            return
+
+        if not cache_was_loaded:
+            return
+
+        state = ServerListData(
+            server_list=self.server_list_model.snapshot,
+            display_secure_core=protonvpn.get_settings().secure_core == SecureCoreStatusEnum.ON,
+            from_cache=True
         )
+        self.__dashboard_vm.state.on_next(state)
+
+    def on_update_server_loads(self, *_):
+        """Update loads of the current server list in place.
+
+        Falls back to regenerating the whole list if the servers
+        can not be updated in place.
+        """
+        changes = self.server_list_model.update_server_loads()
+        if changes is None:
+            self.on_load_servers_async(False)
+            return
+
+        if changes:
+            self.__dashboard_vm.state.on_next(ServerLoadUpdate(changes=changes))
+
+    def __generate_server_list(self, stream=False):
+        user_tier = ServerTierEnum(protonvpn.get_session().vpn_tier)
+        if stream:
+            snapshot = self.__stream_server_list(user_tier)
+        else:
+            snapshot = self.server_list_model.generate_list(user_tier)
+
+        if snapshot is None:
+            return None
+
+        try:
+            self.server_list_cache.save(self.server_list_model)
+        except Exception as e:
+            logger.exception(e)
+
+        return snapshot
+
+    def __stream_server_list(self, user_tier):
+        """Generate the server list while displaying its countries.
+
+        Returns:
+            ServerListSnapshot|None: same as ServerList.generate_list()
+        """
+        snapshots = []
+
+        def on_next(item):
+            if isinstance(item, ServerListSnapshot):
+                snapshots.append(item)
+                return
+
+            self.__dashboard_vm.state.on_next(
+                ServerListCountry(country_item=item)
+            )
+
+        self.server_list_model.stream_list(user_tier).subscribe(on_next)
+        return snapshots[0] if snapshots else None
 
     def __finish_on_update_server_load(self, self_thread=None, task=None, data=None):
         if self_thread and task:
@@ -108,7 +205,7 @@ class ServerListViewModel:
                 task.return_int(0)
         else:
             try:
-                self.on_load_servers_async(False)
+                self.on_update_server_loads()
             except Exception as e:
                 logger.exception(e)
                 if task:
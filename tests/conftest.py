@@ -0,0 +1,148 @@
+"""Shared test setup.
+
+The model tests only need the enums and constants of protonvpn_nm_lib.
+When the library is not installed (i.e outside of the distribution
+images), a minimal stand-in with the same values is registered instead,
+so that the model layer can still be tested.
+"""
+import os
+import sys
+import tempfile
+import types
+from enum import Enum, IntEnum
+
+try:
+    import protonvpn_nm_lib # noqa
+except ImportError:
+    class ServerTierEnum(Enum):
+        FREE = 0
+        BASIC = 1
+        PLUS_VISIONARY = 2
+        PM = 3
+
+    class ServerStatusEnum(Enum):
+        UNDER_MAINTENANCE = 0
+        ACTIVE = 1
+
+    class FeatureEnum(IntEnum):
+        NORMAL = 0
+        SECURE_CORE = 1
+        TOR = 2
+        P2P = 4
+        STREAMING = 8
+        IPv6 = 16
+
+    class SecureCoreStatusEnum(Enum):
+        OFF = 0
+        ON = 1
+
+    class _ProtonVPN:
+        def get_session(self):
+            raise NotImplementedError()
+
+        def get_country(self):
+            raise NotImplementedError()
+
+    _cache_dir = os.path.join(tempfile.gettempdir(), "protonvpn-gui-tests")
+
+    _modules = {
+        "protonvpn_nm_lib": {},
+        "protonvpn_nm_lib.enums": {
+            "ServerTierEnum": ServerTierEnum,
+            "ServerStatusEnum": ServerStatusEnum,
+            "FeatureEnum": FeatureEnum,
+            "SecureCoreStatusEnum": SecureCoreStatusEnum,
+        },
+        "protonvpn_nm_lib.constants": {
+            "PROTON_XDG_CACHE_HOME": _cache_dir,
+            "PROTON_XDG_CACHE_HOME_LOGS": os.path.join(_cache_dir, "logs"),
+            "VIRTUAL_DEVICE_NAME": "proton0",
+        },
+        "protonvpn_nm_lib.country_codes": {
+            "country_codes": {
+                "CH": "Switzerland", "DE": "Germany", "IS": "Iceland",
+                "SE": "Sweden", "US": "United States",
+            },
+        },
+        "protonvpn_nm_lib.api": {"protonvpn": _ProtonVPN()},
+    }
+    for _name, _attributes in _modules.items():
+        _module = types.ModuleType(_name)
+        _module.__dict__.update(_attributes)
+        sys.modules[_name] = _module
+
+from contextlib import contextmanager
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+from protonvpn_nm_lib.api import protonvpn
+from protonvpn_nm_lib.enums import FeatureEnum, ServerTierEnum
+
+
+def logical_server(
+    name, exit_country="CH", tier=ServerTierEnum.PLUS_VISIONARY,
+    features=(FeatureEnum.NORMAL,), load=10, score=1.0, enabled=1,
+    city="City"
+):
+    """Create a logical server, as listed by a session.
+
+    Secure Core servers enter through Iceland.
+    """
+    return SimpleNamespace(
+        name=name, load=load, score=score, city=city,
+        features=list(features), tier=tier.value, enabled=enabled,
+        exit_country=exit_country,
+        entry_country="IS" if FeatureEnum.SECURE_CORE in features
+        else exit_country,
+        host_country=None
+    )
+
+
+class FakeCountry:
+    def get_dict_with_country_code_servername(self, server_list):
+        country_servernames = {}
+        for server in server_list:
+            country_servernames.setdefault(server.exit_country, []).append(
+                server.name
+            )
+
+        return country_servernames
+
+
+class FakeSession:
+    def __init__(self, servers=(), vpn_tier=ServerTierEnum.PLUS_VISIONARY):
+        self.servers = list(servers)
+        self.vpn_tier = vpn_tier.value
+        self.streaming = {}
+        self.streaming_icons = {}
+        self.clientconfig = None
+
+
+@contextmanager
+def fake_session(servers=(), vpn_tier=ServerTierEnum.PLUS_VISIONARY):
+    """Make protonvpn return a FakeSession with the given servers.
+
+    Also used by the benchmarks, thus it does not depend on pytest.
+
+    Args:
+        servers (list): logical servers, see logical_server()
+        vpn_tier (ServerTierEnum)
+
+    Returns:
+        FakeSession
+    """
+    session = FakeSession(servers, vpn_tier)
+    with mock.patch.object(
+        protonvpn, "get_session", return_value=session
+    ), mock.patch.object(
+        protonvpn, "get_country", return_value=FakeCountry()
+    ):
+        yield session
+
+
+@pytest.fixture
+def session():
+    """FakeSession without servers, tests add their own."""
+    with fake_session() as session:
+        yield session
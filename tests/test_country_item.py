@@ -0,0 +1,72 @@
+from conftest import logical_server
+from protonvpn_nm_lib.enums import FeatureEnum, ServerTierEnum
+
+from protonvpn_gui.model import CountryItemFactory, ServerTable
+
+SECURE_CORE = (FeatureEnum.SECURE_CORE,)
+
+
+def create_country(servers, user_tier=ServerTierEnum.PLUS_VISIONARY):
+    country_item = CountryItemFactory.factory()()
+    country_item.create(
+        [server.name for server in servers],
+        {server.name.lower(): server for server in servers},
+        ServerTable(user_tier), user_tier, "CH"
+    )
+
+    return country_item
+
+
+def get_tier_counts(country_item):
+    return (
+        country_item.ammount_of_free_servers,
+        country_item.ammount_of_basic_servers,
+        country_item.ammount_of_plus_servers,
+        country_item.ammount_of_internal_servers,
+    )
+
+
+def test_split_by_secure_core_counts_servers_per_tier():
+    country_item = create_country([
+        logical_server("CH-FREE#1", tier=ServerTierEnum.FREE),
+        logical_server("CH-FREE#2", tier=ServerTierEnum.FREE),
+        logical_server("CH#1", tier=ServerTierEnum.BASIC),
+        logical_server("CH#2", tier=ServerTierEnum.PLUS_VISIONARY),
+        logical_server("CH#3", tier=ServerTierEnum.PM),
+        logical_server(
+            "IS-CH#1", tier=ServerTierEnum.PLUS_VISIONARY,
+            features=SECURE_CORE
+        ),
+        logical_server(
+            "IS-CH#2", tier=ServerTierEnum.PLUS_VISIONARY,
+            features=SECURE_CORE
+        ),
+        logical_server("IS-CH#3", tier=ServerTierEnum.PM, features=SECURE_CORE),
+    ])
+
+    secure_core, non_secure_core = country_item.split_by_secure_core()
+
+    assert get_tier_counts(country_item) == (2, 1, 3, 2)
+    assert get_tier_counts(secure_core) == (0, 0, 2, 1)
+    assert get_tier_counts(non_secure_core) == (2, 1, 1, 1)
+    assert [server.name for server in secure_core.servers] == [
+        "IS-CH#1", "IS-CH#2", "IS-CH#3"
+    ]
+    assert [server.name for server in non_secure_core.servers] == [
+        "CH-FREE#1", "CH-FREE#2", "CH#1", "CH#2", "CH#3"
+    ]
+
+
+def test_split_by_secure_core_without_secure_core_servers():
+    country_item = create_country([
+        logical_server("CH#1", tier=ServerTierEnum.BASIC),
+    ])
+
+    secure_core, non_secure_core = country_item.split_by_secure_core()
+
+    assert len(secure_core) == 0
+    assert get_tier_counts(secure_core) == (0, 0, 0, 0)
+    assert get_tier_counts(non_secure_core) == (0, 1, 0, 0)
+    # Views share the country information
+    assert non_secure_core.country_name == country_item.country_name
+    assert non_secure_core.minimum_country_tier == ServerTierEnum.BASIC
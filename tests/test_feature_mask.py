@@ -0,0 +1,55 @@
+from itertools import combinations
+
+import pytest
+from protonvpn_nm_lib.enums import FeatureEnum
+
+from protonvpn_gui.model.feature_mask import (get_feature_mask,
+                                              get_features_from_mask,
+                                              has_feature)
+
+FEATURE_COMBINATIONS = [
+    list(features)
+    for count in range(len(FeatureEnum) + 1)
+    for features in combinations(FeatureEnum, count)
+]
+
+
+@pytest.mark.parametrize("features", FEATURE_COMBINATIONS)
+def test_feature_mask_round_trip(features):
+    assert get_features_from_mask(get_feature_mask(features)) == features
+
+
+def test_normal_feature_has_its_own_bit():
+    # FeatureEnum.NORMAL has value 0, it must still be encoded
+    assert get_feature_mask([FeatureEnum.NORMAL]) != 0
+    assert get_features_from_mask(
+        get_feature_mask([FeatureEnum.NORMAL])
+    ) == [FeatureEnum.NORMAL]
+
+
+def test_empty_mask():
+    assert get_feature_mask([]) == 0
+    assert get_features_from_mask(0) == []
+
+
+def test_features_are_decoded_in_enum_order():
+    feature_mask = get_feature_mask(
+        [FeatureEnum.STREAMING, FeatureEnum.SECURE_CORE, FeatureEnum.P2P]
+    )
+    assert get_features_from_mask(feature_mask) == [
+        FeatureEnum.SECURE_CORE, FeatureEnum.P2P, FeatureEnum.STREAMING
+    ]
+
+
+def test_duplicated_features_are_encoded_once():
+    assert get_feature_mask(
+        [FeatureEnum.TOR, FeatureEnum.TOR]
+    ) == get_feature_mask([FeatureEnum.TOR])
+
+
+def test_has_feature():
+    feature_mask = get_feature_mask([FeatureEnum.TOR, FeatureEnum.P2P])
+    assert has_feature(feature_mask, FeatureEnum.TOR)
+    assert has_feature(feature_mask, FeatureEnum.P2P)
+    assert not has_feature(feature_mask, FeatureEnum.SECURE_CORE)
+    assert not has_feature(feature_mask, FeatureEnum.NORMAL)
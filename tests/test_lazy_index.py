@@ -0,0 +1,42 @@
+from protonvpn_gui.model.lazy_index import LazyIndex
+
+
+class CountingIndex(LazyIndex):
+    def __init__(self):
+        super().__init__()
+        self.builds = 0
+
+    def get(self):
+        return self._get_index()
+
+    def _build(self):
+        self.builds += 1
+        return {"build": self.builds}
+
+
+def test_index_is_built_on_first_access_only():
+    index = CountingIndex()
+    assert not index.is_built
+
+    assert index.get() == {"build": 1}
+    assert index.get() == {"build": 1}
+    assert index.is_built
+    assert index.builds == 1
+
+
+def test_index_can_be_built_ahead_of_time():
+    index = CountingIndex()
+    index.build()
+    index.build()
+
+    assert index.is_built
+    assert index.get() == {"build": 1}
+
+
+def test_reset_index_is_built_again():
+    index = CountingIndex()
+    index.get()
+    index.reset()
+
+    assert not index.is_built
+    assert index.get() == {"build": 2}
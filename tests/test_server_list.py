@@ -0,0 +1,102 @@
+from contextlib import contextmanager
+from unittest import mock
+
+from conftest import logical_server
+from protonvpn_nm_lib.api import protonvpn
+from protonvpn_nm_lib.enums import ServerTierEnum
+
+from protonvpn_gui.model import ServerList, ServerListSnapshot
+
+
+def create_servers():
+    return [
+        logical_server("CH#1", "CH"),
+        logical_server("DE#1", "DE"),
+        logical_server("SE#1", "SE"),
+        logical_server("US#1", "US"),
+    ]
+
+
+def stream(server_list, on_country=None):
+    items = []
+
+    def on_next(item):
+        items.append(item)
+        if on_country and not isinstance(item, ServerListSnapshot):
+            on_country(item)
+
+    server_list.stream_list(ServerTierEnum.PLUS_VISIONARY).subscribe(on_next)
+    return items
+
+
+def test_stream_emits_countries_then_snapshot(session):
+    session.servers = create_servers()
+    server_list = ServerList()
+
+    *countries, snapshot = stream(server_list)
+    assert [country_item.country_name for country_item in countries] == [
+        "Germany", "Sweden", "Switzerland", "United States"
+    ]
+    assert snapshot is server_list.snapshot
+
+
+def test_stream_stops_once_superseded(session):
+    session.servers = create_servers()
+    server_list = ServerList()
+
+    def on_country(country_item):
+        # A newer list is published while the first country is displayed
+        if country_item.country_name == "Germany":
+            server_list.generate_list(ServerTierEnum.PLUS_VISIONARY)
+
+    items = stream(server_list, on_country)
+    assert [country_item.country_name for country_item in items] == [
+        "Germany"
+    ]
+    # The newer list is kept
+    assert server_list.snapshot.version == 2
+
+
+@contextmanager
+def publish_newer_list_on_get_session(server_list, session):
+    """Publish a newer list once the session is first read.
+
+    Lists read the session after taking their version, thus
+    the list being generated is superseded by the newer one.
+    """
+    def get_session():
+        get_session_mock.side_effect = None
+        assert server_list.generate_list(ServerTierEnum.PLUS_VISIONARY)
+        return session
+
+    with mock.patch.object(
+        protonvpn, "get_session", return_value=session
+    ) as get_session_mock:
+        get_session_mock.side_effect = get_session
+        yield
+
+
+def test_stale_list_is_not_published(session):
+    session.servers = create_servers()
+    server_list = ServerList()
+
+    with publish_newer_list_on_get_session(server_list, session):
+        assert server_list.generate_list(ServerTierEnum.BASIC) is None
+
+    assert server_list.snapshot.version == 2
+    assert server_list.snapshot.server_table.user_tier == \
+        ServerTierEnum.PLUS_VISIONARY
+
+
+def test_stale_restored_list_is_not_published(session):
+    session.servers = create_servers()
+    server_list = ServerList()
+    server_list.generate_list(ServerTierEnum.PLUS_VISIONARY)
+    data = server_list.dump()
+
+    with publish_newer_list_on_get_session(server_list, session):
+        assert server_list.restore(data) is None
+
+    assert server_list.snapshot.version == 3
+    # Restored lists do not have countries, generated ones do
+    assert server_list.snapshot.countries is not None
@@ -0,0 +1,179 @@
+import json
+import struct
+import zlib
+
+import pytest
+from conftest import logical_server
+from protonvpn_nm_lib.enums import FeatureEnum, ServerTierEnum
+
+from protonvpn_gui.model import ServerList, ServerListCache
+
+DUMPED_LIST = {
+    "server_table": {"user_tier": ServerTierEnum.PLUS_VISIONARY.value},
+    "secure_core": [],
+    "non_secure_core": [{"entry_country_code": "CH", "servers": [0, 1]}],
+}
+
+
+class StubServerList:
+    """Records what is restored, restore() returns None when rejected."""
+    def __init__(self, data=None, accept_restore=True):
+        self.data = data
+        self.restored = None
+        self.__accept_restore = accept_restore
+
+    def dump(self):
+        return self.data
+
+    def restore(self, data):
+        self.restored = data
+        return object() if self.__accept_restore else None
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ServerListCache(str(tmp_path / "cache" / "server_list.cache"))
+
+
+def write_cache(cache, content):
+    with open(cache.filepath, "wb") as f:
+        f.write(content)
+
+
+def read_cache(cache):
+    with open(cache.filepath, "rb") as f:
+        return f.read()
+
+
+def header(magic=ServerListCache.MAGIC, version=ServerListCache.FORMAT_VERSION):
+    return struct.pack(">7sH", magic, version)
+
+
+def test_round_trip(cache):
+    cache.save(StubServerList(DUMPED_LIST))
+    server_list = StubServerList()
+
+    assert cache.load(server_list, ServerTierEnum.PLUS_VISIONARY)
+    assert server_list.restored == DUMPED_LIST
+
+
+def test_save_replaces_previous_cache(cache):
+    cache.save(StubServerList(DUMPED_LIST))
+    data = dict(DUMPED_LIST, secure_core=[{"entry_country_code": "IS"}])
+    cache.save(StubServerList(data))
+    server_list = StubServerList()
+
+    assert cache.load(server_list, ServerTierEnum.PLUS_VISIONARY)
+    assert server_list.restored == data
+
+
+def test_nothing_is_saved_without_a_generated_list(cache, tmp_path):
+    cache.save(StubServerList(None))
+
+    assert not (tmp_path / "cache").exists()
+    assert not cache.load(StubServerList(), ServerTierEnum.PLUS_VISIONARY)
+
+
+def test_cache_of_another_tier_is_ignored(cache):
+    cache.save(StubServerList(DUMPED_LIST))
+    server_list = StubServerList()
+
+    assert not cache.load(server_list, ServerTierEnum.FREE)
+    assert server_list.restored is None
+
+
+def test_outdated_restore_is_reported(cache):
+    cache.save(StubServerList(DUMPED_LIST))
+
+    assert not cache.load(
+        StubServerList(accept_restore=False), ServerTierEnum.PLUS_VISIONARY
+    )
+
+
+def test_missing_cache(cache):
+    assert not cache.load(StubServerList(), ServerTierEnum.PLUS_VISIONARY)
+
+
+@pytest.mark.parametrize("corrupt", [
+    # wrong magic
+    lambda content: header(magic=b"XXXXXXX") + content[9:],
+    # other format version
+    lambda content: header(version=ServerListCache.FORMAT_VERSION + 1)
+    + content[9:],
+    # truncated header
+    lambda content: content[:5],
+    # header only
+    lambda content: content[:9],
+    # truncated payload
+    lambda content: content[:-4],
+    # corrupted payload
+    lambda content: content[:9] + bytes(
+        byte ^ 0xFF for byte in content[9:]
+    ),
+    # compressed payload that is not JSON
+    lambda content: header() + zlib.compress(b"\xff\xfe not json"),
+    # JSON that is not a dumped server list
+    lambda content: header() + zlib.compress(b"[1, 2, 3]"),
+    lambda content: header() + zlib.compress(b'{"server_table": {}}'),
+])
+def test_corrupted_cache_is_rejected(cache, corrupt):
+    cache.save(StubServerList(DUMPED_LIST))
+    write_cache(cache, corrupt(read_cache(cache)))
+    server_list = StubServerList()
+
+    assert not cache.load(server_list, ServerTierEnum.PLUS_VISIONARY)
+    assert server_list.restored is None
+
+
+def test_invalid_server_list_is_rejected(cache):
+    cache.save(StubServerList({
+        "server_table": {"user_tier": ServerTierEnum.PLUS_VISIONARY.value}
+    }))
+    server_list = StubServerList()
+    server_list.restore = lambda data: data["non_secure_core"]
+
+    assert not cache.load(server_list, ServerTierEnum.PLUS_VISIONARY)
+
+
+def create_servers():
+    return [
+        logical_server("CH#1", "CH", ServerTierEnum.FREE),
+        logical_server("CH#2", "CH", ServerTierEnum.PLUS_VISIONARY),
+        logical_server(
+            "IS-CH#1", "CH", ServerTierEnum.PLUS_VISIONARY,
+            (FeatureEnum.SECURE_CORE,)
+        ),
+        logical_server("DE#1", "DE", ServerTierEnum.BASIC),
+    ]
+
+
+def describe(server_list):
+    return [
+        [
+            (
+                country_item.country_name, country_item.status,
+                country_item.minimum_country_tier,
+                country_item.ammount_of_plus_servers,
+                [
+                    (server.name, server.load, server.tier, server.features)
+                    for server in country_item.servers
+                ]
+            )
+            for country_item in server_type.servers
+        ]
+        for server_type in (server_list.secure_core, server_list.none_secure_core)
+    ]
+
+
+def test_server_list_round_trip(cache, session):
+    session.servers = create_servers()
+    server_list = ServerList()
+    server_list.generate_list(ServerTierEnum.BASIC)
+    cache.save(server_list)
+
+    restored_server_list = ServerList()
+    assert cache.load(restored_server_list, ServerTierEnum.BASIC)
+    assert describe(restored_server_list) == describe(server_list)
+    assert restored_server_list.dump() == json.loads(
+        json.dumps(server_list.dump())
+    )
@@ -0,0 +1,88 @@
+import random
+
+import pytest
+from conftest import logical_server
+from protonvpn_nm_lib.enums import FeatureEnum, ServerTierEnum
+
+from protonvpn_gui.model import ServerScoreIndex, ServerTable
+
+
+def create_table(servers):
+    table = ServerTable(ServerTierEnum.PLUS_VISIONARY)
+    for server in servers:
+        table.append(server)
+
+    return table
+
+
+def test_scores_keep_their_fraction():
+    table = create_table([
+        logical_server("CH#1", score=1.2),
+        logical_server("CH#2", score=1.7),
+    ])
+
+    assert [
+        server.name
+        for server in ServerScoreIndex(table).get_best_servers("CH", count=2)
+    ] == ["CH#2", "CH#1"]
+    assert ServerTable.restore(table.dump()).scores.tolist() == [1.2, 1.7]
+
+
+def create_servers():
+    """Servers of two countries with every tier and feature combination.
+
+    Scores only take a few values, so that many servers share a score.
+    """
+    rand = random.Random(1)
+    feature_sets = [
+        (FeatureEnum.NORMAL,), (FeatureEnum.P2P,), (FeatureEnum.STREAMING,),
+        (FeatureEnum.P2P, FeatureEnum.STREAMING),
+        (FeatureEnum.SECURE_CORE,), (FeatureEnum.TOR, FeatureEnum.P2P),
+    ]
+    return [
+        logical_server(
+            "{}#{}".format(exit_country, index), exit_country,
+            rand.choice(list(ServerTierEnum)), rand.choice(feature_sets),
+            score=rand.choice([0.5, 1.0, 1.5])
+        )
+        for index in range(200)
+        for exit_country in ("CH", "DE")
+    ]
+
+
+def get_best_servers(servers, exit_country_code, features, max_tier, count):
+    """Reference implementation, going through all the servers."""
+    matching_servers = [
+        server
+        for server in servers
+        if server.exit_country == exit_country_code
+        and set(features) <= set(server.features) | {FeatureEnum.NORMAL}
+        and (max_tier is None or server.tier <= max_tier.value)
+    ]
+    # Stable sort, ties keep the order of the table
+    matching_servers.sort(key=lambda server: server.score, reverse=True)
+
+    return [server.name for server in matching_servers[:count]]
+
+
+@pytest.mark.parametrize("count", [1, 5, 1000])
+@pytest.mark.parametrize("max_tier", [None] + list(ServerTierEnum))
+@pytest.mark.parametrize("features", [
+    [], [FeatureEnum.NORMAL], [FeatureEnum.P2P], [FeatureEnum.SECURE_CORE],
+    [FeatureEnum.P2P, FeatureEnum.STREAMING],
+    [FeatureEnum.STREAMING, FeatureEnum.P2P], [FeatureEnum.IPv6],
+])
+def test_best_servers_match_reference(features, max_tier, count):
+    servers = create_servers()
+    index = ServerScoreIndex(create_table(servers))
+
+    assert [
+        server.name
+        for server in index.get_best_servers("ch", features, max_tier, count)
+    ] == get_best_servers(servers, "CH", features, max_tier, count)
+
+
+def test_best_servers_of_unknown_country():
+    index = ServerScoreIndex(create_table(create_servers()))
+
+    assert index.get_best_servers("SE", count=5) == []
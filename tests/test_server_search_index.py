@@ -0,0 +1,147 @@
+from types import SimpleNamespace
+
+import pytest
+from protonvpn_nm_lib.enums import FeatureEnum
+
+from protonvpn_gui.model.feature_mask import get_feature_mask
+from protonvpn_gui.model.server_search_index import (CountrySearchMatch,
+                                                     ServerSearchIndex,
+                                                     get_prefix_edit_distance,
+                                                     get_trigrams)
+
+
+def country(name, code, servers, features=(FeatureEnum.NORMAL,)):
+    return SimpleNamespace(
+        country_name=name, entry_country_code=code,
+        feature_mask=get_feature_mask(features),
+        servers=[
+            SimpleNamespace(name=servername, city=city)
+            for servername, city in servers
+        ]
+    )
+
+
+# In list order
+COUNTRIES = [
+    country("Austria", "AT", [("AT#1", "Vienna")]),
+    country("Australia", "AU", [("AU#1", "Sydney")]),
+    country("Germany", "DE", [
+        ("DE#1", "Frankfurt"), ("DE#2", "Berlin"),
+        ("DE#10", "Frankfurt"), ("DE#11", "Berlin"),
+    ]),
+    country("Switzerland", "CH", [
+        ("CH#1", "Zurich"), ("CH#2", "Geneva"), ("CH#10", "Zurich"),
+    ], (FeatureEnum.NORMAL, FeatureEnum.P2P)),
+    country("United States", "US", [
+        ("US-NY#1", "New York"), ("US-CA#1", "Los Angeles"),
+        ("US-NY#2", "New York"),
+    ], (FeatureEnum.NORMAL, FeatureEnum.STREAMING)),
+    country("United Kingdom", "UK", [("UK#1", "London")]),
+]
+
+
+@pytest.fixture
+def search_index():
+    return ServerSearchIndex(COUNTRIES)
+
+
+def match(country_name, *server_names):
+    return CountrySearchMatch(
+        country_name, frozenset(server_names) if server_names else None
+    )
+
+
+@pytest.mark.parametrize("user_input, expected_matches", [
+    # typos in country names and cities
+    ("Swizerland", (match("Switzerland"),)),
+    ("frankfrt", (match("Germany", "DE#1", "DE#10"),)),
+    ("untied", (match("United States"), match("United Kingdom"))),
+    # servernames, with or without their prefix
+    ("ny#1", (match("United States", "US-NY#1"),)),
+    ("ch#1", (match("Switzerland", "CH#1", "CH#10"),)),
+    ("us-ca", (match("United States", "US-CA#1"),)),
+    # country codes and feature keywords
+    ("de", (match("Germany"),)),
+    ("p2p", (match("Switzerland"),)),
+    ("streaming", (match("United States"),)),
+    # case insensitive substrings of country names
+    ("KINGDOM", (match("United Kingdom"),)),
+    ("zerla", (match("Switzerland"),)),
+    ("zz", ()),
+])
+def test_search(search_index, user_input, expected_matches):
+    assert search_index.search(user_input) == expected_matches
+
+
+def test_empty_search_matches_everything(search_index):
+    assert search_index.search("") is None
+
+
+def test_short_words_are_not_matched_with_typos(search_index):
+    # "swx" is one typo away from "swi", but is too short
+    assert search_index.search("swx") == ()
+
+
+def test_single_letters_only_match_countries(search_index):
+    assert search_index.search("s") == (
+        match("Austria"), match("Australia"),
+        match("Switzerland"), match("United States")
+    )
+    # Vienna is the city of AT#1
+    assert search_index.search("v") == ()
+
+
+def test_exact_matches_come_before_typo_matches(search_index):
+    # Austria comes first in the list, but is one typo away
+    assert search_index.search("austra") == (
+        match("Australia"), match("Austria")
+    )
+
+
+def test_matches_at_the_same_distance_keep_the_list_order(search_index):
+    assert search_index.search("united") == (
+        match("United States"), match("United Kingdom")
+    )
+
+
+@pytest.mark.parametrize("user_input, expected_matches", [
+    ("frankfurt de#1", (match("Germany", "DE#1", "DE#10"),)),
+    ("berlin de#1", (match("Germany", "DE#11"),)),
+    ("new york us-ny#2", (match("United States", "US-NY#2"),)),
+    # a country match keeps the server matches of the other words
+    ("germany berlin", (match("Germany", "DE#2", "DE#11"),)),
+    # servers matching each word, but not the same ones
+    ("geneva ch#1", ()),
+    # words matching different countries
+    ("frankfurt zurich", ()),
+])
+def test_multiple_words_intersect(search_index, user_input, expected_matches):
+    assert search_index.search(user_input) == expected_matches
+
+
+@pytest.mark.parametrize("word, term, max_distance, expected_distance", [
+    ("switzerland", "switzerland", 2, 0),
+    # prefixes of the term are free
+    ("switz", "switzerland", 0, 0),
+    ("swizer", "switzerland", 2, 1),
+    ("frankfrt", "frankfurt", 2, 1),
+    ("untied", "united", 2, 2),
+    # past max_distance, max_distance + 1 is returned
+    ("untied", "united", 1, 2),
+    ("abcdef", "uvwxyz", 2, 3),
+    ("abcdefgh", "abc", 2, 3),
+    ("", "switzerland", 2, 0),
+])
+def test_prefix_edit_distance(word, term, max_distance, expected_distance):
+    assert get_prefix_edit_distance(
+        word, term, max_distance
+    ) == expected_distance
+
+
+def test_trigrams():
+    assert get_trigrams("ch") == {"$$c", "$ch"}
+    assert get_trigrams("united") == {
+        "$$u", "$un", "uni", "nit", "ite", "ted"
+    }
+    # typos in the middle still share the padded trigrams
+    assert get_trigrams("untied") & get_trigrams("united") == {"$$u", "$un"}
@@ -0,0 +1,177 @@
+import pytest
+from conftest import logical_server
+from protonvpn_nm_lib.enums import (FeatureEnum, ServerStatusEnum,
+                                    ServerTierEnum)
+
+from protonvpn_gui.model import ServerList, ServerTable
+
+
+def create_servers():
+    return [
+        logical_server("CH#1", city="Zurich"),
+        logical_server("CH#2", load=20, city="Zurich"),
+        logical_server("DE#1", exit_country="DE", city="Berlin"),
+    ]
+
+
+def create_table(servers):
+    table = ServerTable(ServerTierEnum.PLUS_VISIONARY)
+    for server in servers:
+        table.append(server)
+
+    return table
+
+
+def test_unchanged_loads():
+    table = create_table(create_servers())
+
+    assert table.get_load_changes(create_servers()) == []
+
+
+def test_load_changes():
+    table = create_table(create_servers())
+    servers = create_servers()
+    servers[1].load = 75
+
+    changes = table.get_load_changes(servers)
+    assert changes == [(1, 75, 1.0, ServerStatusEnum.ACTIVE)]
+
+    table.apply_load_changes(changes)
+    assert table.row(1).load == "75"
+    assert table.row(0).load == "10"
+    assert table.get_load_changes(servers) == []
+
+
+def test_score_changes():
+    table = create_table(create_servers())
+    servers = create_servers()
+    servers[0].score = 2.5
+
+    changes = table.get_load_changes(servers)
+    assert changes == [(0, 10, 2.5, ServerStatusEnum.ACTIVE)]
+
+    table.apply_load_changes(changes)
+    assert table.row(0).score == 2.5
+    assert table.get_load_changes(servers) == []
+
+
+def test_server_goes_into_maintenance():
+    table = create_table(create_servers())
+    servers = create_servers()
+    servers[0].enabled = 0
+
+    changes = table.get_load_changes(servers)
+    assert changes == [(0, 10, 1.0, ServerStatusEnum.UNDER_MAINTENANCE)]
+
+    table.apply_load_changes(changes)
+    assert table.row(0).status == ServerStatusEnum.UNDER_MAINTENANCE
+
+
+def test_server_comes_back_from_maintenance():
+    servers = create_servers()
+    servers[2].enabled = 0
+    table = create_table(servers)
+
+    changes = table.get_load_changes(create_servers())
+    assert changes == [(2, 10, 1.0, ServerStatusEnum.ACTIVE)]
+
+    table.apply_load_changes(changes)
+    assert table.row(2).status == ServerStatusEnum.ACTIVE
+
+
+def test_added_server_requires_regeneration():
+    table = create_table(create_servers())
+    servers = create_servers() + [logical_server("CH#3")]
+
+    assert table.get_load_changes(servers) is None
+
+
+def test_removed_server_requires_regeneration():
+    table = create_table(create_servers())
+
+    assert table.get_load_changes(create_servers()[:-1]) is None
+
+
+def test_renamed_server_requires_regeneration():
+    table = create_table(create_servers())
+    servers = create_servers()
+    servers[0].name = "CH#3"
+
+    assert table.get_load_changes(servers) is None
+
+
+@pytest.mark.parametrize("attribute, value", [
+    ("tier", ServerTierEnum.FREE.value),
+    ("features", [FeatureEnum.P2P]),
+])
+def test_tier_or_feature_change_requires_regeneration(attribute, value):
+    table = create_table(create_servers())
+    servers = create_servers()
+    setattr(servers[0], attribute, value)
+
+    assert table.get_load_changes(servers) is None
+
+
+def create_server_list(session):
+    session.servers = create_servers()
+    server_list = ServerList()
+    server_list.generate_list(ServerTierEnum.PLUS_VISIONARY)
+    return server_list
+
+
+def test_server_list_updates_loads_in_place(session):
+    server_list = create_server_list(session)
+    session.servers[1].load = 90
+
+    changes = server_list.update_server_loads()
+    assert [
+        (server.name, load, status) for server, load, status in changes
+    ] == [("CH#2", "90", ServerStatusEnum.ACTIVE)]
+    switzerland, = [
+        country_item for country_item in server_list.none_secure_core.servers
+        if country_item.entry_country_code == "CH"
+    ]
+    assert [server.load for server in switzerland.servers] == ["10", "90"]
+
+
+def test_server_list_ranks_servers_by_updated_scores(session):
+    server_list = create_server_list(session)
+    assert [
+        server.name for server in server_list.get_best_servers("CH", count=2)
+    ] == ["CH#1", "CH#2"]
+    session.servers[1].score = 5.0
+
+    # Scores are not displayed, thus only the ranking changes
+    assert server_list.update_server_loads() == []
+    assert [
+        server.name for server in server_list.get_best_servers("CH", count=2)
+    ] == ["CH#2", "CH#1"]
+
+
+def test_server_list_updates_status_if_country_stays_active(session):
+    server_list = create_server_list(session)
+    session.servers[0].enabled = 0
+
+    changes = server_list.update_server_loads()
+    assert [(server.name, status) for server, _, status in changes] == [
+        ("CH#1", ServerStatusEnum.UNDER_MAINTENANCE)
+    ]
+
+
+def test_server_list_regenerates_if_country_status_changes(session):
+    server_list = create_server_list(session)
+    # DE only has one server, thus the whole country goes into maintenance
+    session.servers[2].enabled = 0
+
+    assert server_list.update_server_loads() is None
+
+
+@pytest.mark.parametrize("servers", [
+    create_servers()[:-1],
+    create_servers() + [logical_server("DE#2", exit_country="DE")],
+])
+def test_server_list_regenerates_if_servers_change(session, servers):
+    server_list = create_server_list(session)
+    session.servers = servers
+
+    assert server_list.update_server_loads() is None
@@ -0,0 +1,92 @@
+import locale
+
+import pytest
+from conftest import logical_server
+from protonvpn_nm_lib.enums import ServerTierEnum
+
+from protonvpn_gui.model import ServerList, ServerListSnapshot, ServerType
+from protonvpn_gui.model.server_type import get_collation_key
+
+# Each country only has servers of a single tier
+SERVER_TIER_BY_COUNTRY = {
+    "CH": ServerTierEnum.FREE,
+    "DE": ServerTierEnum.BASIC,
+    "SE": ServerTierEnum.PLUS_VISIONARY,
+    "US": ServerTierEnum.PM,
+}
+COUNTRY_ORDER_BY_USER_TIER = {
+    ServerTierEnum.FREE: [
+        "Switzerland", "Germany", "Sweden", "United States"
+    ],
+    ServerTierEnum.BASIC: [
+        "Germany", "Switzerland", "Sweden", "United States"
+    ],
+    ServerTierEnum.PLUS_VISIONARY: [
+        "Germany", "Sweden", "Switzerland", "United States"
+    ],
+    ServerTierEnum.PM: [
+        "United States", "Germany", "Sweden", "Switzerland"
+    ],
+}
+
+
+def create_servers():
+    return [
+        logical_server("{}#1".format(country_code), country_code, tier)
+        for country_code, tier in SERVER_TIER_BY_COUNTRY.items()
+    ]
+
+
+def test_collation_key_follows_the_locale():
+    names = ["Switzerland", "Åland", "sweden", "Germany", "Côte d'Ivoire"]
+
+    assert sorted(names, key=get_collation_key) == sorted(
+        names, key=locale.strxfrm
+    )
+    assert get_collation_key("Germany") == locale.strxfrm("Germany")
+
+
+@pytest.mark.parametrize("user_tier", list(COUNTRY_ORDER_BY_USER_TIER))
+def test_countries_of_the_user_tier_come_first(session, user_tier):
+    session.servers = create_servers()
+    server_list = ServerList()
+
+    server_list.generate_list(user_tier)
+    assert [
+        country_item.country_name
+        for country_item in server_list.none_secure_core.servers
+    ] == COUNTRY_ORDER_BY_USER_TIER[user_tier]
+
+
+@pytest.mark.parametrize("user_tier", list(COUNTRY_ORDER_BY_USER_TIER))
+def test_streamed_countries_are_in_list_order(session, user_tier):
+    session.servers = create_servers()
+    countries = []
+
+    ServerList().stream_list(user_tier).subscribe(countries.append)
+    assert [
+        country_item.country_name
+        for country_item in countries
+        if not isinstance(country_item, ServerListSnapshot)
+    ] == COUNTRY_ORDER_BY_USER_TIER[user_tier]
+
+
+@pytest.mark.parametrize("user_tier", list(COUNTRY_ORDER_BY_USER_TIER))
+def test_country_sort_key(user_tier):
+    server_type = ServerType.factory("non_secure_core_default")
+    server_type.user_tier = user_tier
+    countries = [
+        ("Switzerland", ServerTierEnum.FREE),
+        ("Germany", ServerTierEnum.BASIC),
+        ("Sweden", ServerTierEnum.PLUS_VISIONARY),
+        ("United States", ServerTierEnum.PM),
+    ]
+
+    countries.sort(
+        key=lambda country: server_type.get_country_sort_key(
+            country[1], country[0]
+        )
+    )
+    assert [
+        country_name for country_name, _ in countries
+    ] == COUNTRY_ORDER_BY_USER_TIER[user_tier]
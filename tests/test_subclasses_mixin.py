@@ -0,0 +1,64 @@
+import pytest
+
+from protonvpn_gui.utils import SubclassesMixin
+
+
+class Factory(SubclassesMixin):
+    pass
+
+
+class AbstractIntermediateFactory(Factory):
+    pass
+
+
+class LabelFactory(AbstractIntermediateFactory):
+    concrete_factory = "label"
+
+
+class Dummy(LabelFactory):
+    label = "dummy"
+
+
+class ImageFactory(Factory):
+    concrete_factory = "image"
+
+
+def test_concrete_factories_are_found_by_name():
+    assert Factory._get_subclass_by_name("LabelFactory") is LabelFactory
+    assert Factory._get_subclass_by_name("imagefactory") is ImageFactory
+    assert AbstractIntermediateFactory._get_subclass_by_name(
+        "labelfactory"
+    ) is LabelFactory
+
+
+@pytest.mark.parametrize("name", ["abstractintermediatefactory", "dummy"])
+def test_abstract_factories_and_products_are_not_found_by_name(name):
+    with pytest.raises(KeyError):
+        Factory._get_subclass_by_name(name)
+
+
+def test_products_share_names_across_factories():
+    class Dummy(ImageFactory):
+        image = "dummy"
+
+    assert ImageFactory._get_subclasses_dict("image") == {"dummy": Dummy}
+
+
+def test_duplicated_concrete_factory_name_is_rejected():
+    with pytest.raises(TypeError):
+        class LabelFactory(Factory):
+            concrete_factory = "other_label"
+
+    assert Factory._get_subclass_by_name("labelfactory").concrete_factory\
+        == "label"
+
+
+def test_lookups_include_classes_defined_later():
+    assert LabelFactory._get_subclasses_dict("label") == {"dummy": Dummy}
+
+    class Default(LabelFactory):
+        label = "default"
+
+    assert LabelFactory._get_subclasses_dict("label") == {
+        "dummy": Dummy, "default": Default
+    }